@@ -0,0 +1,103 @@
+"""
+Compare building rows with repeated `add` calls against stamping a
+`Template`. Requires a display (use `xvfb-run` on headless machines),
+unless `--headless` is passed to run on `tkx.HeadlessBackend`.
+
+Usage: python benchmarks/build.py [--rows 5000] [--repeat 3] [--headless]
+"""
+from argparse import ArgumentParser
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from tkx import HeadlessBackend, Stylesheet, Template, Window
+import tkinter as tk
+
+from parse import generate_css
+
+
+ROW = {
+    "widget": "Frame",
+    "cl": "row-1",
+    "children": [
+        {"widget": "Label", "text": "Name", "cl": "row-2"},
+        {"widget": "Label", "text": "Value", "cl": "row-3"},
+        {"widget": "Button", "text": "Open"},
+    ],
+}
+
+
+def build_with_tkinter(root: Window, rows: int) -> None:
+    # The same widgets without tkx: what Tk costs either way.
+    for _ in range(rows):
+        frame = tk.Frame(root)
+        frame.pack(fill="x")
+        frame.pack_propagate(0)
+        tk.Label(frame, text="Name").pack(fill="x")
+        tk.Label(frame, text="Value").pack(fill="x")
+        tk.Button(frame, text="Open").pack(fill="x")
+
+
+def build_with_add(root: Window, rows: int) -> None:
+    for _ in range(rows):
+        frame = root.add(tk.Frame, cl="row-1")
+        frame.add(tk.Label, text="Name", cl="row-2")
+        frame.add(tk.Label, text="Value", cl="row-3")
+        frame.add(tk.Button, text="Open")
+
+
+def build_with_template(root: Window, rows: int) -> None:
+    template = Template(ROW)
+    for _ in range(rows):
+        template.instantiate(root)
+
+
+def measure(stylesheet: Stylesheet, build, rows: int, headless: bool) -> float:
+    root = Window("benchmark", stylesheet, backend=HeadlessBackend() if headless else None)
+    try:
+        start = perf_counter()
+        build(root, rows)
+        root.update_idletasks()
+        return perf_counter() - start
+    finally:
+        root.destroy()
+
+
+def has_display() -> bool:
+    try:
+        tk.Tk().destroy()
+    except tk.TclError:
+        return False
+    return True
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--headless", action="store_true", help="Run on tkx.HeadlessBackend, without a display.")
+    args = parser.parse_args()
+
+    if not args.headless and not has_display():
+        parser.error("no display available; run under xvfb-run or pass --headless")
+
+    with TemporaryDirectory() as tmp:
+        path = Path(tmp, "theme.css")
+        path.write_text(generate_css(100))
+        stylesheet = Stylesheet(str(path))
+
+    tkinter = min(measure(stylesheet, build_with_tkinter, args.rows, args.headless) for _ in range(args.repeat))
+    add = min(measure(stylesheet, build_with_add, args.rows, args.headless) for _ in range(args.repeat))
+    template = min(measure(stylesheet, build_with_template, args.rows, args.headless) for _ in range(args.repeat))
+
+    # tkx's own cost per path, without the widgets both create.
+    print(f"{args.rows} rows ({args.rows * 4} elements)")
+    print(f"  tkinter:  {tkinter * 1000:9.2f} ms")
+    print(f"  add:      {add * 1000:9.2f} ms (tkx: {(add - tkinter) * 1000:.2f} ms)")
+    print(
+        f"  template: {template * 1000:9.2f} ms (tkx: {(template - tkinter) * 1000:.2f} ms, "
+        f"{add / template:.2f}x overall, {(add - tkinter) / (template - tkinter):.2f}x tkx)"
+    )
+
+
+if __name__ == "__main__":
+    main()
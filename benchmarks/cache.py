@@ -0,0 +1,39 @@
+"""
+Measure stylesheet load time with and without a warm `StylesheetCache`.
+
+Usage: python benchmarks/cache.py [--rules 1000] [--repeat 20]
+"""
+from argparse import ArgumentParser
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from timeit import repeat
+from tkx.cache import StylesheetCache
+from tkx.stylesheet import Stylesheet
+
+from parse import generate_css
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rules", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    with TemporaryDirectory() as tmp:
+        path = Path(tmp, "theme.css")
+        path.write_text(generate_css(args.rules))
+        cache = StylesheetCache(Path(tmp, "cache"))
+
+        # Warm the cache.
+        Stylesheet(str(path), cache)
+
+        cold = min(repeat(lambda: Stylesheet(str(path)), number=1, repeat=args.repeat))
+        warm = min(repeat(lambda: Stylesheet(str(path), cache), number=1, repeat=args.repeat))
+
+    print(f"{args.rules} rules")
+    print(f"  uncached: {cold * 1000:8.3f} ms")
+    print(f"  cached:   {warm * 1000:8.3f} ms ({cold / warm:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
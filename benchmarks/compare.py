@@ -0,0 +1,57 @@
+"""
+Compare two result files written by `benchmarks/suite.py` and flag cases
+whose median time grew by more than a threshold. Exits with status 1 if
+any regression is found, so it can gate CI.
+
+Usage: python benchmarks/compare.py baseline.json results.json [--threshold 10]
+"""
+from argparse import ArgumentParser
+import json
+import sys
+
+
+def load(path: str) -> dict[str, dict]:
+    with open(path) as f:
+        return json.load(f)["results"]
+
+
+def compare(baseline: dict[str, dict], results: dict[str, dict], threshold: float) -> list[str]:
+    """Print a comparison table and return the names of regressed cases."""
+    regressions = []
+
+    print(f"{'case':<24} {'baseline':>12} {'current':>12} {'change':>9}")
+    for name in sorted(baseline.keys() | results.keys()):
+        if name not in results or name not in baseline:
+            status = "only in baseline" if name not in results else "new"
+            print(f"{name:<24} {status:>35}")
+            continue
+
+        before = baseline[name]["median"]
+        after = results[name]["median"]
+        change = (after - before) / before * 100 if before else 0.0
+
+        flag = ""
+        if change > threshold:
+            flag = "  REGRESSION"
+            regressions.append(name)
+
+        print(f"{name:<24} {before * 1000:9.2f} ms {after * 1000:9.2f} ms {change:+8.1f}%{flag}")
+
+    return regressions
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("baseline")
+    parser.add_argument("results")
+    parser.add_argument("--threshold", type=float, default=10.0, help="Allowed slowdown in percent.")
+    args = parser.parse_args()
+
+    regressions = compare(load(args.baseline), load(args.results), args.threshold)
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) beyond {args.threshold:g}%: {', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
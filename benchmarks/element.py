@@ -0,0 +1,121 @@
+"""
+Measure the memory and attribute access cost of `Element` against the
+__dict__-based representation it replaced, both holding the state an
+element is mounted with. Widgets are stubbed out, so no display is
+needed.
+
+Usage: python benchmarks/element.py [--elements 50000]
+"""
+from argparse import ArgumentParser
+from timeit import timeit
+from tkx.element import Element, shared_inherits
+import re
+import tracemalloc
+
+
+class StubWidget:
+    def __str__(self) -> str:
+        return ".!frame.!label2"
+
+    def cget(self, key: str) -> str:
+        return ""
+
+
+class LegacyElement:
+    """
+    The element representation used before `__slots__`, delegated methods
+    and shared inherited keys.
+    """
+
+    def __init__(self, widget):
+        self.__display = "block"
+        self.__parent = None
+        self.__style = {}
+        self.__widget = widget
+        self.id = None
+        self.cl = None
+        self.elements = None
+        self.virtual = None
+        self.key = None
+        self.spec = None
+        self.resources = None
+        self.depth = 1
+        self.order = 1
+        self.inherits = {"bg", "fg"}
+        self.__iter_parent = None
+
+    @property
+    def style(self):
+        return self.__style
+
+    @property
+    def widget(self):
+        return self.__widget
+
+    @property
+    def widget_name(self):
+        if self.widget is not None:
+            return re.search(r"\w+", str(self.widget).split(".")[-1])[0]
+        return None
+
+    def __getattr__(self, attr):
+        if self[attr] is None and self.widget is not None:
+            return getattr(self.widget, attr)
+        return self[attr]
+
+    def __getitem__(self, attr):
+        return self.__dict__.get(attr)
+
+
+def make_element(widget) -> Element:
+    # The state Element.mount sets, without creating a widget.
+    element = Element.__new__(Element)
+    element.display = "block"
+    element.parent = None
+    element.style = {}
+    element.widget = widget
+    element.widget_name = "label"
+    element.id = element.cl = element.elements = element.virtual = None
+    element.key = element.spec = element.resources = None
+    element._Element__data = element._Element__iter_parent = None
+    element.depth = element.order = 1
+    element.inherits = shared_inherits(("bg", "fg"))
+    return element
+
+
+def allocated(factory, count: int) -> int:
+    """Return the bytes allocated by creating `count` objects with `factory`."""
+    widget = StubWidget()
+    tracemalloc.start()
+    objects = [factory(widget) for _ in range(count)]
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    return size
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--elements", type=int, default=50_000)
+    args = parser.parse_args()
+
+    legacy_size = allocated(LegacyElement, args.elements)
+    slots_size = allocated(make_element, args.elements)
+
+    print(f"{args.elements} elements")
+    print(f"  memory    legacy: {legacy_size / 2**20:7.2f} MiB  slots: {slots_size / 2**20:7.2f} MiB")
+
+    legacy = LegacyElement(StubWidget())
+    element = make_element(StubWidget())
+    for label, statement in (
+        ("style", "e.style"),
+        ("widget_name", "e.widget_name"),
+        ("cget", 'e.cget("text")'),
+    ):
+        before = timeit(statement, globals={"e": legacy}, number=200_000)
+        after = timeit(statement, globals={"e": element}, number=200_000)
+        print(f"  {label:<12} legacy: {before * 5:7.3f} us  slots: {after * 5:7.3f} us ({before / after:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+Compare `Window.run_async` against a plain `mainloop`: the CPU used, how
+late Tk timers fire, and the input latency, from the moment an event
+reaches Tk's queue to the moment its handler runs. Requires a display
+(use `xvfb-run` on headless machines), unless `--headless` is passed to
+run on `tkx.HeadlessBackend`, which cannot take input from other threads
+while `mainloop` runs, so only measures its timers.
+
+Usage: python benchmarks/event_loop.py [--seconds 3] [--events 200] [--max-tick 0.01] [--headless]
+"""
+from argparse import ArgumentParser
+from statistics import median, quantiles
+from time import perf_counter, process_time, sleep
+from tkx import HeadlessBackend, Window
+import asyncio
+import random
+import threading
+import tkinter as tk
+
+
+def schedule_timers(root: Window, delays: list[float], lateness: list[float]) -> None:
+    """Fire a Tk timer after each delay, recording how late each is handled."""
+    start = perf_counter()
+    for delay in delays:
+        root.after(int(delay * 1000), lambda due=start + delay: lateness.append(perf_counter() - due))
+
+
+def send(root: Window, latency: list[float]) -> None:
+    """Queue an event for Tk, as input from the display does, recording how long it waits to be handled."""
+    sent = perf_counter()
+    root.after(0, lambda: latency.append(perf_counter() - sent))
+
+
+def send_from_thread(root: Window, delays: list[float], latency: list[float]) -> None:
+    """Send input from another thread, which wakes `mainloop` the way events from the display do."""
+
+    def run():
+        start = perf_counter()
+        for delay in delays:
+            sleep(max(0.0, start + delay - perf_counter()))
+            send(root, latency)
+
+    # tkinter only hands calls from other threads over once mainloop runs.
+    root.after(0, threading.Thread(target=run, daemon=True).start)
+
+
+def run_mainloop(root: Window, delays: list[float], latency: list[float] | None) -> None:
+    if latency is not None:
+        send_from_thread(root, delays, latency)
+    root.mainloop()
+
+
+def run_async(root: Window, delays: list[float], latency: list[float], max_tick: float) -> None:
+    async def main():
+        loop = asyncio.get_running_loop()
+        for delay in delays:
+            loop.call_later(delay, send, root, latency)
+        await root.run_async(max_tick=max_tick)
+
+    asyncio.run(main())
+
+
+def percentiles(samples: list[float]) -> tuple[float, float] | None:
+    if len(samples) < 2:
+        return None
+    return median(samples) * 1000, quantiles(samples, n=100)[98] * 1000
+
+
+def measure(run, seconds: float, events: int, headless: bool) -> dict[str, tuple[float, float] | float | None]:
+    root = Window("benchmark", backend=HeadlessBackend() if headless else None)
+    timers, latency = [], []
+
+    delays = sorted(random.uniform(0, seconds * 0.8) for _ in range(events))
+    schedule_timers(root, [random.uniform(0, seconds * 0.8) for _ in range(events)], timers)
+    root.after(int(seconds * 1000), root.destroy)
+
+    cpu, wall = process_time(), perf_counter()
+    run(root, delays, latency)
+    cpu, wall = process_time() - cpu, perf_counter() - wall
+
+    return {"cpu_percent": cpu / wall * 100, "timers": percentiles(timers), "input": percentiles(latency)}
+
+
+def has_display() -> bool:
+    try:
+        tk.Tk().destroy()
+    except tk.TclError:
+        return False
+    return True
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=3.0)
+    parser.add_argument("--events", type=int, default=200)
+    parser.add_argument("--max-tick", type=float, default=0.01, help="Longest sleep of run_async, in seconds.")
+    parser.add_argument("--headless", action="store_true", help="Run on tkx.HeadlessBackend, without a display.")
+    args = parser.parse_args()
+
+    if not args.headless and not has_display():
+        parser.error("no display available; run under xvfb-run or pass --headless")
+
+    def mainloop(root, delays, latency):
+        run_mainloop(root, delays, None if args.headless else latency)
+
+    def asynchronous(root, delays, latency):
+        run_async(root, delays, latency, args.max_tick)
+
+    results = {
+        "mainloop": measure(mainloop, args.seconds, args.events, args.headless),
+        "run_async": measure(asynchronous, args.seconds, args.events, args.headless),
+        "idle mainloop": measure(mainloop, args.seconds, 0, args.headless),
+        "idle run_async": measure(asynchronous, args.seconds, 0, args.headless),
+    }
+
+    def cell(values: tuple[float, float] | None) -> str:
+        return f"{'-':>22}" if values is None else f"{values[0]:8.2f} / {values[1]:7.2f} ms"
+
+    print(f"{'':<16} {'cpu':>7} {'timer lateness p50/p99':>24} {'input latency p50/p99':>24}")
+    for name, result in results.items():
+        print(f"{name:<16} {result['cpu_percent']:6.1f}%   {cell(result['timers'])}   {cell(result['input'])}")
+
+
+if __name__ == "__main__":
+    main()
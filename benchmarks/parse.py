@@ -0,0 +1,78 @@
+"""
+Compare the single-pass stylesheet parser against the regex pipeline it
+replaced.
+
+Usage: python benchmarks/parse.py [--rules 10000] [--repeat 5]
+"""
+from argparse import ArgumentParser
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from timeit import repeat
+from tkx.constants import CSS_PROPERTY_NAME_TRANSLATIONS
+from tkx.parser import parse
+import re
+
+
+def generate_css(rules: int) -> str:
+    """Return a stylesheet with `rules` rules in the style of a generated theme."""
+    lines = [":root {", "    --bg: #333;", "    --fg: #ddd;", "}", ""]
+    for i in range(rules):
+        lines += [
+            f"/* Rule {i} */",
+            f".row-{i} {{",
+            "    background: var(--bg);",
+            "    border-style: flat;",
+            f"    border-width: {i % 4};",
+            "    color: var(--fg);",
+            "    cursor: hand2;",
+            "}",
+            "",
+        ]
+    return "\n".join(lines)
+
+
+def legacy_parse(source_path: str) -> dict[str, dict[str, str]]:
+    """The minify/split/zip pipeline used by `Stylesheet` before the single-pass parser."""
+    with open(source_path) as f:
+        lines = map(str.strip, f.readlines())
+
+    result = map(
+        lambda line: re.sub(r"(?<=[:,])\s", "", line) if line.endswith(";") else re.sub(r"\s", "", line),
+        lines,
+    )
+    source_min = re.sub(r"/\*.+?\*/", "", "".join(result))
+
+    selectors = (*filter(None, re.split(r"\{.*?\}", source_min)),)
+    blocks = (*map(lambda i: re.sub(r"[\{\}]", "", i), filter(None, re.split(r"[:\w\.#\-]+\{", source_min))),)
+
+    styles = {}
+    for selector, block in zip(selectors, blocks):
+        results = {p[0]: p[1] for p in map(lambda i: (*i.split(":"),), filter(None, block.split(";")))}
+        styles[selector] = {CSS_PROPERTY_NAME_TRANSLATIONS.get(k, k): v for k, v in results.items()}
+
+    return styles
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rules", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with TemporaryDirectory() as tmp:
+        path = Path(tmp, "theme.css")
+        path.write_text(generate_css(args.rules))
+
+        # Both parsers must agree before their timings mean anything.
+        assert parse(path.read_text()) == legacy_parse(str(path))
+
+        legacy = min(repeat(lambda: legacy_parse(str(path)), number=1, repeat=args.repeat))
+        single = min(repeat(lambda: parse(path.read_text(), str(path)), number=1, repeat=args.repeat))
+
+    print(f"{args.rules} rules")
+    print(f"  legacy pipeline: {legacy * 1000:8.2f} ms")
+    print(f"  single pass:     {single * 1000:8.2f} ms ({legacy / single:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
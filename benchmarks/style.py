@@ -0,0 +1,71 @@
+"""
+Measure the memory held by element styles, shared base styles with
+per-element overrides against the per-element dictionaries they
+replaced, and the cost of reading them. Runs on the headless
+backend, so no display is needed.
+
+Usage: python benchmarks/style.py [--elements 10000]
+"""
+from argparse import ArgumentParser
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from timeit import timeit
+from tkx.style import Style
+import tkinter as tk
+import tkx
+
+STYLESHEET = """
+:root { --fg: #e0e0e0; --bg: #202020; }
+Frame { background: var(--bg); }
+Label { color: var(--fg); background: var(--bg); padx: 4; pady: 2; anchor: w; border-width: 0; }
+.odd { background: #2a2a2a; }
+"""
+
+
+def held(styles: list[Style]) -> int:
+    """Return the bytes held by each style on its own, plus every base style they share once."""
+    own = sum(Style.__sizeof__(s) + (0 if s.overrides is None else s.overrides.__sizeof__()) for s in styles)
+    bases = {id(s.base): s.base for s in styles}
+    return own + sum(base.__sizeof__() for base in bases.values())
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--elements", type=int, default=10_000)
+    args = parser.parse_args()
+
+    with TemporaryDirectory() as directory:
+        path = Path(directory) / "theme.css"
+        path.write_text(STYLESHEET)
+
+        root = tkx.Window("styles", tkx.Stylesheet(str(path)), backend=tkx.HeadlessBackend())
+        container = root.add(tk.Frame)
+        labels = [container.add(tk.Label, text=str(i), cl="odd" if i % 2 else None) for i in range(args.elements)]
+
+    styles = [label.style for label in labels]
+
+    copies = [s.flatten() for s in styles]
+    legacy = sum(c.__sizeof__() for c in copies)
+
+    print(f"{args.elements} labels, {root.stats()['styles']['bases']} base styles")
+    print(f"  memory    dicts: {legacy / 2**20:7.2f} MiB  shared: {held(styles) / 2**20:7.2f} MiB")
+
+    # Values equal to the base's are not kept, so only real changes cost memory.
+    for label in labels:
+        label.configure(bg=label.style["bg"])
+    print(f"  after configuring every label to its current value: {held(styles) / 2**20:7.2f} MiB")
+
+    for label in labels[::100]:
+        label.configure(fg="#ffffff")
+    print(f"  after changing 1% of labels: {held(styles) / 2**20:7.2f} MiB")
+
+    for label, statement in (("get", 's.get("bg")'), ("in", '"fg" in s')):
+        before = timeit(statement, globals={"s": copies[0]}, number=200_000)
+        after = timeit(statement, globals={"s": styles[0]}, number=200_000)
+        print(f"  {label:<12} dict: {before * 5:7.3f} us  shared: {after * 5:7.3f} us")
+
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,413 @@
+"""
+Run the benchmark suite and write the results to a JSON file, which can
+be compared against a baseline with `benchmarks/compare.py`.
+
+Cases which create widgets need a display. On headless machines, run the
+suite under `xvfb-run`, pass `--xvfb` to start a virtual display with
+the `xvfbwrapper` package, or pass `--headless` to run tkx on its
+in-memory backend (which times tkx itself, without the cost of Tk).
+
+Usage: python benchmarks/suite.py [--output results.json] [--repeat 5] [-k filter] [--xvfb | --headless]
+"""
+from __future__ import annotations
+from argparse import ArgumentParser
+from datetime import datetime, timezone
+from pathlib import Path
+from statistics import median
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import Callable
+import json
+import os
+import platform
+import subprocess
+import sys
+import tkinter as tk
+
+from parse import generate_css
+
+SIZES = (100, 1000, 10_000)
+NESTING_DEPTH = 50
+
+# Set by --headless: windows run on tkx.HeadlessBackend instead of Tk.
+HEADLESS = False
+
+
+class Case:
+    """
+    A single benchmark. `setup` returns the state passed to `run`, which is
+    the only part timed. `teardown` cleans up after each repetition.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        run: Callable,
+        setup: Callable = lambda: None,
+        teardown: Callable = lambda _: None,
+        display: bool = True,
+    ):
+        self.name = name
+        self.run = run
+        self.setup = setup
+        self.teardown = teardown
+        self.display = display
+
+    def measure(self, repeat: int) -> list[float]:
+        timings = []
+        for _ in range(repeat):
+            state = self.setup()
+            try:
+                start = perf_counter()
+                self.run(state)
+                timings.append(perf_counter() - start)
+            finally:
+                self.teardown(state)
+        return timings
+
+
+class ImportCase(Case):
+    """
+    Times importing tkx in a fresh interpreter and using `name`, and checks
+    that `forbidden` modules were not loaded along the way.
+    """
+
+    SCRIPT = (
+        "import sys\n"
+        "from time import perf_counter\n"
+        "start = perf_counter()\n"
+        "import tkx\n"
+        "tkx.{name}\n"
+        "print(perf_counter() - start)\n"
+        "loaded = [m for m in {forbidden!r} if m in sys.modules]\n"
+        "sys.exit(f'tkx.{name} imported {{loaded}}' if loaded else 0)\n"
+    )
+
+    def __init__(self, name: str, forbidden: tuple[str, ...] = ()):
+        super().__init__(f"import/{name}", None, display=False)
+        self.script = self.SCRIPT.format(name=name, forbidden=forbidden)
+
+    def measure(self, repeat: int) -> list[float]:
+        src = str(Path(__file__).resolve().parent.parent / "src")
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, (src, os.environ.get("PYTHONPATH")))))
+
+        timings = []
+        for _ in range(repeat):
+            result = subprocess.run([sys.executable, "-c", self.script], capture_output=True, text=True, env=env)
+            if result.returncode:
+                raise RuntimeError(result.stderr.strip())
+            timings.append(float(result.stdout))
+        return timings
+
+
+def parse_case(directory: Path, rules: int) -> Case:
+    from tkx import Stylesheet
+
+    path = directory / f"parse-{rules}.css"
+    path.write_text(generate_css(rules))
+
+    return Case(f"parse/{rules}", lambda _: Stylesheet(str(path)), display=False)
+
+
+def match_case(directory: Path, rules: int) -> Case:
+    from tkx import Stylesheet
+    from tkx.selector import describe
+
+    path = directory / f"match-{rules}.css"
+    path.write_text(generate_css(rules) + "Frame > Label.row-1 { cursor: arrow; }\n")
+    ruleset = Stylesheet(str(path)).rules
+    elements = [describe("Label", None, f"row-{i % 100} selected") for i in range(1000)]
+    ancestry = (describe("Frame"), describe("Window"))
+
+    def run(_):
+        for element in elements:
+            ruleset.match(element, ancestry)
+
+    return Case(f"match/{rules}", run, display=False)
+
+
+def window(stylesheet_path: Path):
+    from tkx import HeadlessBackend, Stylesheet, Window
+
+    backend = HeadlessBackend() if HEADLESS else None
+    root = Window("benchmark", Stylesheet(str(stylesheet_path)), backend=backend)
+    root.withdraw()
+    return root
+
+
+def destroy(root) -> None:
+    try:
+        root.destroy()
+    except tk.TclError:
+        pass
+
+
+def add_case(stylesheet_path: Path, display: str, widgets: int) -> Case:
+    def setup():
+        root = window(stylesheet_path)
+        container = root.add(tk.Frame, display=display)
+        return root, container
+
+    def run(state):
+        root, container = state
+        for i in range(widgets):
+            container.add(tk.Label, text=str(i), cl=f"row-{i % 100}")
+        root.update_idletasks()
+
+    return Case(f"add/{display}/{widgets}", run, setup, lambda state: destroy(state[0]))
+
+
+def restyle_case(stylesheet_path: Path, widgets: int) -> Case:
+    def setup():
+        root = window(stylesheet_path)
+        labels = [root.add(tk.Label, text=str(i)) for i in range(widgets)]
+        root.update_idletasks()
+        return root, labels
+
+    def run(state):
+        root, labels = state
+        for label in labels:
+            label.configure(bg="var(--fg)", fg="var(--bg)")
+        root.update_idletasks()
+
+    return Case(f"restyle/var/{widgets}", run, setup, lambda state: destroy(state[0]))
+
+
+def font_case(stylesheet_path: Path, widgets: int) -> Case:
+    def setup():
+        root = window(stylesheet_path)
+        return root, root.add(tk.Frame)
+
+    def run(state):
+        root, container = state
+        font = {"font-family": "Helvetica", "font-size": "12px", "font-weight": "bold"}
+        for i in range(widgets):
+            container.add(tk.Label, text=str(i), **font)
+        root.update_idletasks()
+
+    return Case(f"add/font/{widgets}", run, setup, lambda state: destroy(state[0]))
+
+
+def transition_case(stylesheet_path: Path, widgets: int) -> Case:
+    def setup():
+        root = window(stylesheet_path)
+        transition = "background 10s linear"
+        labels = [root.add(tk.Label, text=str(i), bg="#0000ff", transition=transition) for i in range(widgets)]
+        root.update_idletasks()
+        for label in labels:
+            label.configure(bg="#ff0000")
+        return root
+
+    def run(root):
+        for _ in range(10):
+            root.animator.step()
+        root.update_idletasks()
+
+    return Case(f"transition/{widgets}", run, setup, destroy)
+
+
+def nesting_case(stylesheet_path: Path, depth: int) -> Case:
+    def setup():
+        root = window(stylesheet_path)
+        element = root
+        for _ in range(depth):
+            element = element.add(tk.Frame)
+        return root, element
+
+    def run(state):
+        # Walk from the deepest frame to the root, as every add does.
+        _, leaf = state
+        for i in range(1000):
+            leaf.root
+            leaf.get_style_of(f".row-{i % 100}")
+        leaf.add(tk.Label, text="leaf")
+
+    return Case(f"nesting/{depth}", run, setup, lambda state: destroy(state[0]))
+
+
+def query_case(stylesheet_path: Path, widgets: int) -> Case:
+    def setup():
+        root = window(stylesheet_path)
+        sidebar = root.add(tk.Frame, id="sidebar")
+        for i in range(10):
+            sidebar.add(tk.Label, text=str(i), cl="item")
+        for i in range(widgets):
+            root.add(tk.Label, text=str(i), cl=f"row-{i % 100}")
+        return root
+
+    def run(root):
+        for _ in range(100):
+            root.query_all("#sidebar Label.item")
+
+    return Case(f"query/{widgets}", run, setup, destroy)
+
+
+def render_tree(widgets: int, changed: int = 0) -> list[dict]:
+    """Return rows of ten keyed elements, a frame and nine labels, with `changed` labels' text altered."""
+    step = max(1, widgets * 9 // 10 // changed) if changed else 0
+    rows = []
+    for row in range(widgets // 10):
+        labels = []
+        for column in range(9):
+            i = row * 9 + column
+            text = f"{i}*" if step and i % step == 0 and i // step < changed else str(i)
+            labels.append({"widget": "Label", "key": column, "text": text, "cl": f"row-{i % 100}"})
+        rows.append({"widget": "Frame", "key": row, "display": "flex", "children": labels})
+    return rows
+
+
+def render_case(stylesheet_path: Path, widgets: int, percent: int | None = None) -> Case:
+    """Render a tree of `widgets` elements into an empty window, or re-render it with `percent` of them changed."""
+
+    def setup():
+        root = window(stylesheet_path)
+        if percent is not None:
+            root.render(render_tree(widgets))
+            root.update_idletasks()
+        return root, render_tree(widgets, widgets * percent // 100 if percent else 0)
+
+    def run(state):
+        root, tree = state
+        root.render(tree)
+        root.update_idletasks()
+
+    name = "full" if percent is None else f"update-{percent}%"
+    return Case(f"render/{name}/{widgets}", run, setup, lambda state: destroy(state[0]))
+
+
+def bind_case(stylesheet_path: Path, mode: str, widgets: int) -> Case:
+    """Handle clicks on every cell of a grid with a binding per cell, or one delegated handler."""
+
+    def setup():
+        root = window(stylesheet_path)
+        cells = [root.add(tk.Label, text=str(i), cl="cell") for i in range(widgets)]
+        return root, cells
+
+    def run(state):
+        root, cells = state
+        clicked = []
+        if mode == "each":
+            for cell in cells:
+                cell.bind("<Button-1>", clicked.append)
+        else:
+            root.cls_bind("cell", "<Button-1>", clicked.append)
+
+        for cell in cells[:: max(1, widgets // 100)]:
+            cell.widget.event_generate("<Button-1>")
+
+    return Case(f"bind/{mode}/{widgets}", run, setup, lambda state: destroy(state[0]))
+
+
+def teardown_case(stylesheet_path: Path, widgets: int) -> Case:
+    def setup():
+        root = window(stylesheet_path)
+        for i in range(widgets):
+            root.add(tk.Label, text=str(i), cl=f"row-{i % 100}")
+        root.update_idletasks()
+        return root
+
+    return Case(f"teardown/{widgets}", lambda root: root.destroy(), setup, destroy)
+
+
+def cases(directory: Path) -> list[Case]:
+    stylesheet_path = directory / "theme.css"
+    stylesheet_path.write_text(generate_css(100))
+
+    result = [ImportCase("Stylesheet", forbidden=("tkinter",)), ImportCase("Window")]
+    result += [parse_case(directory, rules) for rules in SIZES]
+    result += [match_case(directory, rules) for rules in SIZES]
+    result += [add_case(stylesheet_path, display, n) for display in ("block", "flex") for n in SIZES]
+    result += [restyle_case(stylesheet_path, n) for n in SIZES]
+    result += [font_case(stylesheet_path, n) for n in SIZES]
+    result += [transition_case(stylesheet_path, n) for n in SIZES]
+    result += [nesting_case(stylesheet_path, NESTING_DEPTH)]
+    result += [query_case(stylesheet_path, n) for n in SIZES]
+    result += [render_case(stylesheet_path, n) for n in SIZES]
+    result += [render_case(stylesheet_path, n, 1) for n in SIZES]
+    result += [bind_case(stylesheet_path, mode, n) for mode in ("each", "delegate") for n in SIZES]
+    result += [teardown_case(stylesheet_path, n) for n in SIZES]
+    return result
+
+
+def has_display() -> bool:
+    try:
+        tk.Tk().destroy()
+    except tk.TclError:
+        return False
+    return True
+
+
+def metadata() -> dict:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        "commit": commit,
+        "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "machine": platform.machine(),
+        "platform": platform.platform(),
+        "python": platform.python_version(),
+        "tk": tk.TkVersion,
+        "backend": "headless" if HEADLESS else "tk",
+    }
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--output", default="benchmark-results.json")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("-k", dest="filter", default="", help="Only run cases whose name contains this string.")
+    parser.add_argument("--xvfb", action="store_true", help="Start a virtual display with xvfbwrapper.")
+    parser.add_argument("--headless", action="store_true", help="Run windows on tkx's in-memory backend.")
+    args = parser.parse_args()
+
+    global HEADLESS
+    HEADLESS = args.headless
+
+    xvfb = None
+    if args.xvfb:
+        try:
+            from xvfbwrapper import Xvfb
+        except ImportError:
+            parser.error("--xvfb needs the xvfbwrapper package (pip install xvfbwrapper), or use xvfb-run instead.")
+
+        xvfb = Xvfb(width=1280, height=720)
+        xvfb.start()
+
+    try:
+        display = HEADLESS or has_display()
+        results = {}
+        skipped = []
+
+        with TemporaryDirectory() as tmp:
+            for case in cases(Path(tmp)):
+                if args.filter not in case.name:
+                    continue
+
+                if case.display and not display:
+                    skipped.append(case.name)
+                    continue
+
+                timings = case.measure(args.repeat)
+                results[case.name] = {"min": min(timings), "median": median(timings), "timings": timings}
+                print(f"{case.name:<24} {median(timings) * 1000:10.2f} ms", file=sys.stderr)
+
+    finally:
+        if xvfb is not None:
+            xvfb.stop()
+
+    if skipped:
+        print(f"Skipped {len(skipped)} cases without a display (use xvfb-run or --xvfb).", file=sys.stderr)
+
+    with open(args.output, "w") as f:
+        json.dump({"meta": metadata(), "results": results, "skipped": skipped}, f, indent=2)
+
+    print(f"Results written to {os.path.abspath(args.output)}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,48 @@
-from tkx.element import Element
-from tkx.stylesheet import Stylesheet
-from tkx.window import Window
+"""
+tkx loads its submodules on first use, so tools which only parse
+stylesheets (eg. `tkx.Stylesheet`) never import tkinter.
+"""
+from __future__ import annotations
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from tkx.builder import Template
+    from tkx.cache import StylesheetCache
+    from tkx.element import Element
+    from tkx.stylesheet import Stylesheet
+    from tkx.window import Window
+    from tkx.watch import PollingWatcher
+    from tkx.aio import run
+    from tkx.backend import HeadlessBackend
+
+
+# Public names and the submodules which define them.
+EXPORTS: dict[str, str] = {
+    "Element": "tkx.element",
+    "HeadlessBackend": "tkx.backend",
+    "PollingWatcher": "tkx.watch",
+    "Stylesheet": "tkx.stylesheet",
+    "StylesheetCache": "tkx.cache",
+    "Template": "tkx.builder",
+    "Window": "tkx.window",
+    "run": "tkx.aio",
+}
+
+__all__ = list(EXPORTS)
+
+
+def __getattr__(name: str):
+    module = EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module 'tkx' has no attribute {name!r}")
+
+    value = getattr(import_module(module), name)
+
+    # Later lookups find the name directly.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | EXPORTS.keys())
@@ -0,0 +1,173 @@
+"""
+asyncio integration: runs a `Window`'s Tk events from within an asyncio
+event loop, so coroutines and event handlers share one thread.
+
+```python
+async def main():
+    root = tkx.Window("App")
+    ...
+    await root.run_async()
+
+asyncio.run(main())
+```
+"""
+from __future__ import annotations
+from time import perf_counter
+from typing import Any, Awaitable, Coroutine, TYPE_CHECKING
+from _tkinter import DONT_WAIT
+import asyncio
+
+if TYPE_CHECKING:
+    from tkx.window import Window
+
+
+class AsyncRunner:
+    """
+    Interleaves a window's Tk event processing with an asyncio loop.
+
+    Pending Tk events are handled without blocking, then the runner
+    sleeps for an adaptive tick: `min_tick` seconds after any activity,
+    doubling up to `max_tick` while Tk stays idle. Input is therefore
+    picked up within `max_tick` of arriving after a quiet period (and
+    much sooner while the user is interacting) without busy-polling.
+    Tk does not expose its display connection to wait on, so `max_tick`
+    trades idle CPU for latency; the default keeps it under a frame.
+    Completed coroutine handlers wake the runner early so their UI
+    changes are drawn immediately.
+
+    Parameters
+    - window: `Window` - The window to run.
+    - min_tick: `float` - Shortest sleep between polls, in seconds.
+    - max_tick: `float` - Longest sleep between polls, in seconds.
+    - time_slice: `float` - Longest time spent handling Tk events before yielding to asyncio.
+    """
+
+    def __init__(self, window: Window, min_tick: float = 0.001, max_tick: float = 0.01, time_slice: float = 0.01):
+        self.window = window
+        self.min_tick = min_tick
+        self.max_tick = max_tick
+        self.time_slice = time_slice
+        self.closed = False
+
+        # The asyncio loop the window runs in, while it runs.
+        self.loop: asyncio.AbstractEventLoop | None = None
+
+        # Counters for profiling.
+        self.events = 0
+        self.polls = 0
+        self.wakeups = 0
+
+        # Tasks started by coroutine handlers, kept alive until they finish.
+        self.tasks: set[asyncio.Task] = set()
+
+        self.__waiter: asyncio.Future | None = None
+
+    async def run(self) -> None:
+        """Handle the window's events until it is destroyed."""
+        window = self.window
+        loop = asyncio.get_running_loop()
+        dooneevent = window.tk.dooneevent
+
+        def destroyed(event) -> None:
+            if event.widget is window:
+                self.closed = True
+                self.wake()
+
+        window.bind("<Destroy>", destroyed, add="+")
+        window.runner = self
+        self.loop = loop
+        window.post_queue.attach()
+
+        tick = self.min_tick
+        try:
+            while not self.closed:
+                self.polls += 1
+                handled = 0
+                deadline = perf_counter() + self.time_slice
+
+                while not self.closed and dooneevent(DONT_WAIT):
+                    handled += 1
+                    if perf_counter() > deadline:
+                        break
+
+                if self.closed:
+                    break
+
+                self.events += handled
+                tick = self.min_tick if handled else min(tick * 2, self.max_tick)
+
+                self.__waiter = loop.create_future()
+                handle = loop.call_later(tick, self.wake)
+                await self.__waiter
+                handle.cancel()
+
+        finally:
+            self.__waiter = None
+            self.loop = None
+            window.post_queue.detach()
+            if window.runner is self:
+                window.runner = None
+
+    def schedule(self, awaitable: Awaitable) -> asyncio.Future:
+        """Run an awaitable returned by an event handler as a task."""
+        task = asyncio.ensure_future(awaitable)
+        self.tasks.add(task)
+        task.add_done_callback(self.__finished)
+        return task
+
+    def wake(self) -> None:
+        """Poll Tk again now instead of waiting for the current tick to end."""
+        waiter = self.__waiter
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+            self.wakeups += 1
+
+    def __finished(self, task: asyncio.Task) -> None:
+        self.tasks.discard(task)
+        self.wake()
+
+        # Report errors like those of regular Tk callbacks.
+        if not task.cancelled() and task.exception() is not None:
+            error = task.exception()
+            self.window.report_callback_exception(type(error), error, error.__traceback__)
+
+
+def schedule(window: Window, awaitable: Awaitable) -> asyncio.Future:
+    """
+    Run an awaitable returned by an event handler of `window`. Raises
+    `RuntimeError` unless the window is run with `run_async` or `run`.
+    """
+    runner = window.runner
+    if runner is None:
+        # Avoid "coroutine was never awaited" warnings on top of the error.
+        if hasattr(awaitable, "close"):
+            awaitable.close()
+        raise RuntimeError("Coroutine handlers need the window to run with `await window.run_async()` or `tkx.run`.")
+
+    return runner.schedule(awaitable)
+
+
+def run(window: Window, coro: Coroutine | None = None, **kwargs) -> Any:
+    """
+    Run `window` and, optionally, `coro` alongside it in a new asyncio
+    event loop until the window is closed. `coro` is cancelled if it is
+    still running then. Returns the result of `coro` if it finished.
+    Keyword arguments are passed to `AsyncRunner`.
+    """
+
+    async def main():
+        task = None if coro is None else asyncio.ensure_future(coro)
+        try:
+            await window.run_async(**kwargs)
+        finally:
+            if task is not None and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+
+        if task is not None and not task.cancelled():
+            return task.result()
+
+    return asyncio.run(main())
@@ -0,0 +1,737 @@
+"""
+Backends create the interpreter a `Window` and its widgets run on.
+
+The default `TkBackend` uses Tk itself. `HeadlessBackend` runs on a Tcl
+interpreter without Tk, emulating the Tk commands tkinter issues in
+memory, so windows can be built and styled without a display and every
+call Tk would have received is recorded.
+
+```python
+backend = tkx.HeadlessBackend()
+root = tkx.Window("App", stylesheet, backend=backend)
+root.add(tk.Label, text="Hello")
+
+print(backend.configure_calls)
+```
+"""
+from __future__ import annotations
+from collections import deque
+from itertools import takewhile
+from typing import Any, TYPE_CHECKING
+import re
+import tkinter as tk
+
+if TYPE_CHECKING:
+    from tkx.window import Window
+
+
+class TkBackend:
+    """Runs windows on Tk. Requires a display."""
+
+    # Keyword arguments passed to `tk.Tk`.
+    options: dict[str, Any] = {}
+
+    def attach(self, window: Window) -> None:
+        """Called once `window`'s interpreter exists, before anything else uses it."""
+
+
+class HeadlessBackend(TkBackend):
+    """
+    Runs a window on an in-memory stand-in for Tk which records every
+    call made to it. Widgets keep their options, geometry managers and
+    bindings, so styles, layout and event handlers behave as they would
+    on screen, and `event_generate` invokes bound handlers. Nothing is
+    drawn, so sizes are those requested rather than those displayed.
+
+    Timers (`after`) and the event loop are handled by a real Tcl
+    interpreter, created without Tk. Each window needs its own backend.
+
+    Parameters
+    - geometry: `str` - Initial size and position of the window.
+    - max_calls: `int | None` - Most calls recorded, the oldest being dropped first. `None` keeps them all.
+    """
+
+    options = {"useTk": False}
+
+    def __init__(self, geometry: str = "200x200+0+0", max_calls: int | None = 100_000):
+        self.geometry = geometry
+        self.max_calls = max_calls
+        self.interpreter: HeadlessInterpreter | None = None
+
+    def attach(self, window: Window) -> None:
+        self.interpreter = window.tk = HeadlessInterpreter(window.tk, self.geometry, self.max_calls)
+
+    @property
+    def calls(self) -> list[tuple]:
+        """Return the last `max_calls` calls made to Tk (and Tcl), in order, as tuples of arguments."""
+        return list(self.interpreter.calls)
+
+    @property
+    def configure_calls(self) -> list[tuple]:
+        """Return the calls configuring widgets, eg. `(".!label", "configure", "-bg", "#fff")`."""
+        return [c for c in self.calls if len(c) > 1 and c[1] == "configure" and str(c[0]).startswith(".")]
+
+    @property
+    def geometry_calls(self) -> list[tuple]:
+        """Return the calls made to the `pack`, `grid` and `place` geometry managers."""
+        return [c for c in self.calls if c and c[0] in GEOMETRY_MANAGERS]
+
+    def reset(self) -> None:
+        """Forget the calls recorded so far."""
+        self.interpreter.calls.clear()
+
+
+# Geometry managers emulated by the headless backend.
+GEOMETRY_MANAGERS = frozenset({"pack", "grid", "place"})
+
+# Commands provided by Tk, rather than Tcl, which are emulated.
+TK_COMMANDS = frozenset(
+    {"bind", "bindtags", "destroy", "event", "focus", "font", "grab", "image", "lower", "raise", "tk", "winfo", "wm"}
+    | GEOMETRY_MANAGERS
+)
+
+# Abbreviated widget options and the options they stand for.
+OPTION_SYNONYMS = {"bg": "background", "fg": "foreground", "bd": "borderwidth"}
+
+# Default options of the widgets whose options are checked. Other widgets accept any option.
+HEADLESS_BASE_OPTIONS = {
+    "background": "#d9d9d9",
+    "borderwidth": 0,
+    "cursor": "",
+    "height": 0,
+    "highlightbackground": "#d9d9d9",
+    "highlightcolor": "#000000",
+    "highlightthickness": 0,
+    "padx": 0,
+    "pady": 0,
+    "relief": "flat",
+    "takefocus": "",
+    "width": 0,
+}
+
+HEADLESS_FRAME_OPTIONS = {**HEADLESS_BASE_OPTIONS, "class": "Frame", "colormap": "", "container": 0, "visual": ""}
+
+HEADLESS_LABEL_OPTIONS = {
+    **HEADLESS_BASE_OPTIONS,
+    "activebackground": "#ececec",
+    "activeforeground": "#000000",
+    "anchor": "center",
+    "bitmap": "",
+    "borderwidth": 1,
+    "compound": "none",
+    "disabledforeground": "#a3a3a3",
+    "font": "TkDefaultFont",
+    "foreground": "#000000",
+    "image": "",
+    "justify": "center",
+    "padx": 1,
+    "pady": 1,
+    "state": "normal",
+    "text": "",
+    "textvariable": "",
+    "underline": -1,
+    "wraplength": 0,
+}
+
+HEADLESS_WIDGET_OPTIONS = {
+    "Tk": {**HEADLESS_FRAME_OPTIONS, "class": "Tk", "menu": "", "screen": "", "use": ""},
+    "Frame": HEADLESS_FRAME_OPTIONS,
+    "Label": HEADLESS_LABEL_OPTIONS,
+    "Button": {
+        **HEADLESS_LABEL_OPTIONS,
+        "command": "",
+        "default": "disabled",
+        "highlightthickness": 1,
+        "overrelief": "",
+        "repeatdelay": 0,
+        "repeatinterval": 0,
+    },
+}
+
+# Colors Tk knows by name, as 16-bit (red, green, blue).
+NAMED_COLORS = {
+    "black": (0, 0, 0),
+    "white": (65535, 65535, 65535),
+    "red": (65535, 0, 0),
+    "green": (0, 65535, 0),
+    "blue": (0, 0, 65535),
+    "yellow": (65535, 65535, 0),
+    "gray": (48830, 48830, 48830),
+    "grey": (48830, 48830, 48830),
+}
+
+# Event types by name, as reported in %T.
+EVENT_TYPES = {
+    "KeyPress": 2,
+    "KeyRelease": 3,
+    "ButtonPress": 4,
+    "ButtonRelease": 5,
+    "Motion": 6,
+    "Enter": 7,
+    "Leave": 8,
+    "FocusIn": 9,
+    "FocusOut": 10,
+    "Destroy": 17,
+    "Configure": 22,
+    "MouseWheel": 38,
+}
+# Event names Tk accepts in place of others.
+EVENT_ALIASES = {"Button": "ButtonPress", "Key": "KeyPress"}
+
+# Finds the Tcl commands of Python handlers in a binding script.
+MATCH_HANDLER = re.compile(r"\[(\S+) %#")
+
+# Event fields passed to `event_generate`, and their substitutions.
+EVENT_FIELDS = {
+    "serial": "%#",
+    "button": "%b",
+    "height": "%h",
+    "keycode": "%k",
+    "state": "%s",
+    "time": "%t",
+    "width": "%w",
+    "x": "%x",
+    "y": "%y",
+    "keysym": "%K",
+    "rootx": "%X",
+    "rooty": "%Y",
+    "delta": "%D",
+}
+
+
+def canonical_sequence(sequence: str) -> str:
+    """Return an event sequence in one spelling, eg. `<Button-1>` and `<1>` as `<ButtonPress-1>`."""
+    parts = sequence.strip("<>").split("-")
+    if len(parts) == 1 and parts[0].isdigit():
+        parts = ["ButtonPress", parts[0]]
+
+    parts = [EVENT_ALIASES.get(p, p) for p in parts]
+    return f"<{'-'.join(parts)}>"
+
+
+class VirtualWidget:
+    """What the headless interpreter knows of one widget."""
+
+    __slots__ = ("path", "cls", "options", "children", "manager", "placement", "slaves", "bindings", "tags")
+
+    def __init__(self, path: str, cls: str, options: dict[str, Any]):
+        self.path = path
+        self.cls = cls
+        self.options = options
+        self.children: list[str] = []
+        self.manager = ""
+
+        # Options given to the geometry manager, and the paths of managed
+        # children in their packing (or gridding) order.
+        self.placement: dict[str, Any] = {}
+        self.slaves: list[str] = []
+
+        self.bindings: dict[str, str] = {}
+        self.tags: tuple[str, ...] | None = None
+
+    @property
+    def defaults(self) -> dict[str, Any] | None:
+        return HEADLESS_WIDGET_OPTIONS.get(self.cls)
+
+    def option(self, name: str) -> str:
+        """Return the full name of an option, raising `TclError` if the widget has none by that name."""
+        name = name.lstrip("-")
+        name = OPTION_SYNONYMS.get(name, name)
+
+        defaults = self.defaults
+        if defaults is not None and name not in defaults:
+            raise tk.TclError(f'unknown option "-{name}"')
+
+        return name
+
+    def get(self, name: str) -> Any:
+        defaults = self.defaults or {}
+        return self.options.get(name, defaults.get(name, ""))
+
+    def size(self, name: str) -> int:
+        try:
+            return max(int(float(self.get(name))), 1)
+        except (TypeError, ValueError):
+            return 1
+
+
+class HeadlessInterpreter:
+    """
+    Stands in for the `tkapp` object tkinter sends its commands to. Tk
+    commands are recorded and emulated; everything else goes to `tcl`.
+    """
+
+    def __init__(self, tcl, geometry: str = "200x200+0+0", max_calls: int | None = None):
+        self.tcl = tcl
+        self.calls: deque[tuple] = deque(maxlen=max_calls)
+        self.widgets: dict[str, VirtualWidget] = {".": VirtualWidget(".", "Tk", {})}
+        self.fonts: dict[str, dict[str, Any]] = {"TkDefaultFont": {"family": "sans-serif", "size": 10}}
+        self.images: dict[str, dict[str, Any]] = {}
+        self.title = ""
+        self.geometry = geometry
+        self.withdrawn = False
+        self.destroyed = False
+        self.__quit = False
+
+        # Bindings of class names and "all", which are not widgets.
+        self.__tagged: dict[str, dict[str, str]] = {}
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self.tcl, attr)
+
+    def call(self, *args) -> Any:
+        if len(args) == 1 and isinstance(args[0], tuple):
+            args = args[0]
+
+        # tkinter leaves out options passed as None.
+        args = tuple(a for a in args if a is not None)
+        self.calls.append(args)
+
+        command = str(args[0])
+        if command.startswith("."):
+            return self.__widget_command(command, args[1:])
+
+        if command in TK_COMMANDS:
+            return getattr(self, f"_{command}")(*args[1:])
+
+        # Widget creation, eg. ("label", ".!label", "-text", "Hello").
+        if len(args) > 1 and str(args[1]).startswith("."):
+            return self.__create(command, str(args[1]), args[2:])
+
+        return self.tcl.call(*args)
+
+    def mainloop(self, n: int = 0) -> None:
+        self.__quit = False
+        while not self.destroyed and not self.__quit:
+            self.tcl.dooneevent(0)
+
+    def quit(self) -> None:
+        self.__quit = True
+
+    def widget(self, path: str) -> VirtualWidget:
+        widget = self.widgets.get(str(path))
+        if widget is None:
+            raise tk.TclError(f'bad window path name "{path}"')
+        return widget
+
+    def generate(self, path: str, sequence: str, **fields) -> None:
+        """Invoke the handlers bound to an event on a widget, as if Tk had delivered it."""
+        widget = self.widget(path)
+        sequence = canonical_sequence(sequence)
+        kind = sequence.strip("<>").split("-")[0]
+
+        values = {
+            "%#": "0",
+            "%b": "??",
+            "%f": "0",
+            "%h": "??",
+            "%k": "0",
+            "%s": "0",
+            "%t": "0",
+            "%w": "??",
+            "%x": "0",
+            "%y": "0",
+            "%A": "",
+            "%E": "0",
+            "%K": "??",
+            "%N": "0",
+            "%W": widget.path,
+            "%T": str(EVENT_TYPES.get(kind, 0)),
+            "%X": "0",
+            "%Y": "0",
+            "%D": "0",
+        }
+        if kind == "ButtonPress" and sequence.strip("<>").split("-")[-1].isdigit():
+            values["%b"] = sequence.strip("<>").split("-")[-1]
+        for k, v in fields.items():
+            values[EVENT_FIELDS.get(k, k)] = str(v)
+
+        arguments = tuple(values[f] for f in tk.Misc._subst_format)
+        for tag in self.__tags(widget):
+            script = self.__binding(tag, sequence)
+            if not script:
+                continue
+
+            for handler in MATCH_HANDLER.findall(script):
+                if self.tcl.call(handler, *arguments) == "break":
+                    return
+
+    def __binding(self, tag: str, sequence: str) -> str:
+        target = self.widgets.get(tag)
+        bindings = target.bindings if target is not None else self.__tagged.get(tag, {})
+        return bindings.get(sequence, "")
+
+    def __tags(self, widget: VirtualWidget) -> tuple[str, ...]:
+        if widget.tags is not None:
+            return widget.tags
+        if widget.path == ".":
+            return (".", "Tk", "all")
+        return (widget.path, widget.cls, ".", "all")
+
+    def __create(self, command: str, path: str, args: tuple) -> str:
+        # Tk classes are named after their commands, eg. "ttk::label" makes a "TLabel".
+        prefix, _, name = command.rpartition("::")
+        cls = {"labelframe": "LabelFrame", "panedwindow": "PanedWindow"}.get(name, name.capitalize())
+        if prefix == "ttk":
+            cls = f"T{cls}"
+
+        widget = VirtualWidget(path, cls, {})
+        self.__configure(widget, args)
+
+        parent = path.rpartition(".")[0] or "."
+        self.widget(parent).children.append(path)
+        self.widgets[path] = widget
+        return path
+
+    def __configure(self, widget: VirtualWidget, args: tuple) -> None:
+        for name, value in zip(args[::2], args[1::2]):
+            name = widget.option(name)
+            widget.options[name] = value if type(value) in (str, int, float, bool) else str(value)
+
+    def __describe(self, widget: VirtualWidget, name: str) -> tuple:
+        defaults = widget.defaults or {}
+        return (f"-{name}", name, name.capitalize(), defaults.get(name, ""), widget.get(name))
+
+    def __widget_command(self, path: str, args: tuple) -> Any:
+        widget = self.widget(path)
+        if not args:
+            return ""
+
+        command, args = args[0], args[1:]
+        if command == "configure":
+            if not args:
+                names = (widget.defaults or widget.options).keys()
+                synonyms = [(f"-{k}", f"-{v}") for k, v in OPTION_SYNONYMS.items() if v in names]
+                return tuple(self.__describe(widget, k) for k in names) + tuple(synonyms)
+
+            if len(args) == 1:
+                return self.__describe(widget, widget.option(args[0]))
+
+            self.__configure(widget, args)
+            if path == ".":
+                self.__resize(widget)
+            return ""
+
+        if command == "cget":
+            return widget.get(widget.option(args[0]))
+
+        return ""
+
+    def __resize(self, widget: VirtualWidget) -> None:
+        """Follow the window's width and height options, like Tk's geometry propagation."""
+        size, _, position = self.geometry.partition("+")
+        width, height = size.split("x")
+        width = widget.options.get("width", width) or width
+        height = widget.options.get("height", height) or height
+        self._wm("geometry", ".", f"{width}x{height}+{position}")
+
+    def _bind(self, tag: str, sequence: str | None = None, script: str | None = None) -> Any:
+        widget = self.widgets.get(tag)
+        bindings = widget.bindings if widget is not None else self.__tagged.setdefault(tag, {})
+
+        if sequence is None:
+            return tuple(bindings)
+
+        sequence = canonical_sequence(sequence)
+        if script is None:
+            return bindings.get(sequence, "")
+
+        if script.startswith("+"):
+            bindings[sequence] = bindings.get(sequence, "") + script[1:]
+        elif script:
+            bindings[sequence] = script
+        else:
+            bindings.pop(sequence, None)
+        return ""
+
+    def _bindtags(self, path: str, tags: Any = None) -> Any:
+        widget = self.widget(path)
+        if tags is None:
+            return self.__tags(widget)
+
+        widget.tags = tuple(self.tcl.splitlist(tags)) if isinstance(tags, str) else tuple(tags)
+        return ""
+
+    def _destroy(self, *paths: str) -> str:
+        for path in paths:
+            widget = self.widgets.get(str(path))
+            if widget is None:
+                continue
+
+            # Tk destroys children before their parent.
+            for child in list(widget.children):
+                self._destroy(child)
+
+            self.generate(widget.path, "<Destroy>")
+            if widget.path == ".":
+                self.destroyed = True
+                for id in self.tcl.splitlist(self.tcl.call("after", "info")):
+                    self.tcl.call("after", "cancel", id)
+                continue
+
+            del self.widgets[widget.path]
+            parent = self.widgets.get(widget.path.rpartition(".")[0] or ".")
+            if parent is not None and widget.path in parent.children:
+                parent.children.remove(widget.path)
+            if parent is not None and widget.manager:
+                parent.slaves.remove(widget.path)
+
+        return ""
+
+    def _event(self, command: str, path: str = "", sequence: str = "", *args) -> str:
+        if command == "generate":
+            fields = {str(k).lstrip("-"): v for k, v in zip(args[::2], args[1::2])}
+            fields.pop("when", None)
+            self.generate(path, sequence, **fields)
+        return ""
+
+    def _focus(self, *args) -> str:
+        return ""
+
+    def _font(self, command: str, *args) -> Any:
+        if command == "create":
+            name, options = args[0], args[1:]
+            self.fonts[name] = {str(k).lstrip("-"): v for k, v in zip(options[::2], options[1::2])}
+            return name
+
+        if command == "delete":
+            for name in args:
+                self.fonts.pop(name, None)
+            return ""
+
+        if command == "names":
+            return tuple(self.fonts)
+
+        if command in ("actual", "config", "configure"):
+            font = self.fonts.get(args[0]) if args else None
+            if font is None:
+                return ()
+            if len(args) == 2:
+                return font.get(str(args[1]).lstrip("-"), "")
+            if len(args) > 2:
+                font.update({str(k).lstrip("-"): v for k, v in zip(args[1::2], args[2::2])})
+                return ""
+            return tuple(x for k, v in font.items() for x in (f"-{k}", v))
+
+        if command == "measure":
+            return len(str(args[-1])) * 7
+
+        if command == "metrics":
+            return 12
+
+        if command == "families":
+            return ("sans-serif",)
+
+        return ""
+
+    def _grab(self, *args) -> str:
+        return ""
+
+    def _image(self, command: str, *args) -> Any:
+        if command == "create":
+            kind, name, options = args[0], args[1], args[2:]
+            self.images[name] = {"type": kind, **{str(k).lstrip("-"): v for k, v in zip(options[::2], options[1::2])}}
+            return name
+
+        if command == "delete":
+            for name in args:
+                self.images.pop(name, None)
+            return ""
+
+        if command in ("width", "height"):
+            # Images are never decoded.
+            return int(self.images.get(args[0], {}).get(command, 0))
+
+        if command == "names":
+            return tuple(self.images)
+
+        if command == "type":
+            return self.images[args[0]]["type"]
+
+        return ""
+
+    def _lower(self, *args) -> str:
+        return ""
+
+    def _raise(self, *args) -> str:
+        return ""
+
+    def _manage(self, manager: str, command: str, *args) -> Any:
+        if command.startswith("."):
+            command, args = "configure", (command, *args)
+
+        if command == "configure":
+            paths = list(takewhile(lambda a: str(a).startswith("."), map(str, args)))
+            options = dict(zip(args[len(paths) :: 2], args[len(paths) + 1 :: 2]))
+            options = {str(k).lstrip("-"): v for k, v in options.items()}
+            after = "after" in options
+            anchor = options.pop("after" if after else "before", None)
+
+            for path in paths:
+                self.__manage(self.widget(path), manager, options, anchor, after)
+            return ""
+
+        if command == "forget":
+            for path in args:
+                widget = self.widgets.get(str(path))
+                if widget is not None and widget.manager == manager:
+                    widget.manager = ""
+                    widget.placement = {}
+                    self.__parent(widget).slaves.remove(widget.path)
+            return ""
+
+        if command == "slaves":
+            parent = str(args[0]) if args else "."
+            return tuple(p for p in self.widget(parent).slaves if self.widgets[p].manager == manager)
+
+        if command == "info":
+            widget = self.widget(str(args[0]))
+            if widget.manager != manager:
+                raise tk.TclError(f'window "{widget.path}" isn\'t managed by {manager}')
+            return tuple(x for k, v in widget.placement.items() for x in (f"-{k}", v))
+
+        return ""
+
+    def __parent(self, widget: VirtualWidget) -> VirtualWidget:
+        return self.widget(widget.path.rpartition(".")[0] or ".")
+
+    def __manage(
+        self, widget: VirtualWidget, manager: str, options: dict[str, Any], anchor: str | None, after: bool
+    ) -> None:
+        """Manage `widget` with `options`, moving it before or after the `anchor` path if one is given."""
+        slaves = self.__parent(widget).slaves
+
+        # Managed widgets, and only those, are in their parent's slaves.
+        managed = bool(widget.manager)
+        if widget.manager != manager:
+            widget.placement = {}
+        widget.manager = manager
+        widget.placement.update(options)
+
+        if anchor is not None and str(anchor) != widget.path:
+            if managed:
+                slaves.remove(widget.path)
+            slaves.insert(slaves.index(str(anchor)) + after, widget.path)
+
+        elif not managed:
+            slaves.append(widget.path)
+
+    def _pack(self, command: str, *args) -> Any:
+        return self._manage("pack", command, *args)
+
+    def _grid(self, command: str, *args) -> Any:
+        return self._manage("grid", command, *args)
+
+    def _place(self, command: str, *args) -> Any:
+        return self._manage("place", command, *args)
+
+    def _tk(self, command: str, *args) -> Any:
+        if command == "windowingsystem":
+            return "x11"
+        if command == "scaling":
+            return 1.0
+        return ""
+
+    def _winfo(self, command: str, *args) -> Any:
+        if command == "exists":
+            return int(str(args[0]) in self.widgets and not (self.destroyed and str(args[0]) == "."))
+
+        if command == "rgb":
+            return rgb(args[1])
+
+        if command in ("screenwidth", "vrootwidth"):
+            return 1920
+
+        if command in ("screenheight", "vrootheight"):
+            return 1080
+
+        if command in ("pixels", "fpixels"):
+            value = float(str(args[1]).rstrip("pcmi"))
+            return value if command == "fpixels" else round(value)
+
+        widget = self.widget(args[0])
+
+        if command in ("width", "height", "reqwidth", "reqheight"):
+            if widget.path == ".":
+                width, height = self.geometry.partition("+")[0].split("x")
+                return int(width if "width" in command else height)
+            return widget.size("width" if "width" in command else "height")
+
+        if command in ("x", "y", "rootx", "rooty", "pointerx", "pointery"):
+            return 0
+
+        if command in ("ismapped", "viewable"):
+            return int(widget.path == "." or bool(widget.manager))
+
+        if command == "manager":
+            return widget.manager
+
+        if command == "children":
+            return tuple(widget.children)
+
+        if command == "class":
+            return widget.cls
+
+        if command == "name":
+            return widget.path.rpartition(".")[2] or "."
+
+        if command == "parent":
+            return "" if widget.path == "." else widget.path.rpartition(".")[0] or "."
+
+        if command == "toplevel":
+            return "."
+
+        if command == "id":
+            return hex(id(widget))
+
+        return ""
+
+    def _wm(self, command: str, path: str = ".", *args) -> Any:
+        if command == "title":
+            if args:
+                self.title = args[0]
+                return ""
+            return self.title
+
+        if command == "geometry":
+            if not args:
+                return self.geometry
+
+            before = self.geometry.partition("+")[0]
+            size, plus, position = str(args[0]).partition("+")
+            current_size, _, current_position = self.geometry.partition("+")
+            self.geometry = f"{size or current_size}+{position if plus else current_position}"
+
+            # Resizing the window is reported to <Configure> handlers.
+            after = self.geometry.partition("+")[0]
+            if after != before:
+                width, height = after.split("x")
+                self.generate(".", "<Configure>", width=width, height=height)
+            return ""
+
+        if command == "state":
+            return "withdrawn" if self.withdrawn else "normal"
+
+        if command == "withdraw":
+            self.withdrawn = True
+        elif command == "deiconify":
+            self.withdrawn = False
+
+        return ""
+
+
+def rgb(color: str) -> tuple[int, int, int]:
+    """Return a color as Tk's 16-bit (red, green, blue), raising `TclError` if it is unknown."""
+    color = str(color)
+    if color.startswith("#") and len(color) in (4, 7, 13):
+        digits = len(color[1:]) // 3
+        scale = 65535 // (16**digits - 1)
+        try:
+            return tuple(int(color[1 + i * digits : 1 + (i + 1) * digits], 16) * scale for i in range(3))
+        except ValueError:
+            pass
+
+    named = NAMED_COLORS.get(color.lower())
+    if named is None:
+        raise tk.TclError(f'unknown color name "{color}"')
+    return named
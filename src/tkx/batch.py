@@ -0,0 +1,156 @@
+from __future__ import annotations
+from time import perf_counter
+from tkx import instrument
+from typing import Any, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from tkx.core import TkxElement
+    from tkx.window import Window
+
+
+class BatchStats:
+    """
+    Counts widget configure requests and the Tk calls actually issued
+    for them.
+    """
+
+    def __init__(self):
+        self.requested = 0
+        self.issued = 0
+
+    @property
+    def saved(self) -> int:
+        """Return the number of Tk configure calls avoided by merging."""
+        return self.requested - self.issued
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(requested={self.requested}, issued={self.issued}, saved={self.saved})"
+
+
+class Batch(BatchStats):
+    """
+    Context manager returned by `Window.batch`. While any batch is open,
+    widget configuration is deferred and merged per element, then sent as
+    one `configure` call per widget when the outermost batch closes.
+    """
+
+    def __init__(self, queue: ConfigureQueue):
+        super().__init__()
+        self.queue = queue
+
+    def __enter__(self) -> Batch:
+        self.queue.open(self)
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.queue.close(self)
+
+
+class ConfigureQueue:
+    """
+    Pending widget options for a `Window`, merged per element.
+
+    Options are sent to Tk immediately unless a `Batch` is open or
+    `idle` is set, in which case they are flushed when the outermost
+    batch closes or when Tk is next idle, respectively.
+    """
+
+    def __init__(self, window: Window):
+        self.window = window
+        self.pending: dict[TkxElement, dict[str, Any]] = {}
+        self.stats = BatchStats()
+        self.__batches: list[Batch] = []
+        self.__idle = False
+        self.__idle_id: str | None = None
+
+    @property
+    def deferring(self) -> bool:
+        return bool(self.__batches) or self.__idle
+
+    @property
+    def idle(self) -> bool:
+        return self.__idle
+
+    @idle.setter
+    def idle(self, value: bool) -> None:
+        self.__idle = value
+
+        # Nothing should be left waiting once deferral stops.
+        if not self.deferring:
+            self.flush()
+
+    def close(self, batch: Batch) -> None:
+        # Flush before removing the outermost batch so its counters
+        # include the calls issued on its behalf. It is removed even if
+        # a call fails, or every later configure would be deferred.
+        try:
+            if self.__batches == [batch]:
+                self.flush()
+        finally:
+            self.__batches.remove(batch)
+
+    def flush(self) -> None:
+        """
+        Send all pending options to Tk, one `configure` call per widget.
+        A call which raises does not stop the others: the first error is
+        raised once every widget was configured, and any further ones are
+        reported with `Window.report_callback_exception`.
+        """
+        if self.__idle_id is not None:
+            self.window.after_cancel(self.__idle_id)
+            self.__idle_id = None
+
+        pending, self.pending = self.pending, {}
+        errors: list[Exception] = []
+        for element, options in pending.items():
+            try:
+                self.issue(element, options)
+            except Exception as error:
+                errors.append(error)
+
+        if errors:
+            for error in errors[1:]:
+                self.window.report_callback_exception(type(error), error, error.__traceback__)
+            raise errors[0]
+
+    def issue(self, element: TkxElement, options: dict[str, Any]) -> None:
+        """Configure an element's widget now, bypassing any deferral."""
+        if instrument.enabled:
+            start = perf_counter()
+            element.widget.configure(**options)
+            instrument.record("tk.configure", element.widget_name, start)
+        else:
+            element.widget.configure(**options)
+
+        self.stats.issued += 1
+        for batch in self.__batches:
+            batch.issued += 1
+
+    def open(self, batch: Batch) -> None:
+        self.__batches.append(batch)
+
+    def submit(self, element: TkxElement, options: dict[str, Any]) -> None:
+        """Configure an element's widget now, or merge the options into its pending call."""
+        self.stats.requested += 1
+        for batch in self.__batches:
+            batch.requested += 1
+
+        if not self.deferring:
+            self.issue(element, options)
+            return
+
+        pending = self.pending.get(element)
+        if pending is None:
+            self.pending[element] = dict(options)
+        else:
+            pending.update(options)
+
+        if self.__idle and self.__idle_id is None:
+            self.__idle_id = self.window.after_idle(self._flush_idle)
+
+    def _flush_idle(self) -> None:
+        self.__idle_id = None
+
+        # An open batch flushes everything itself when it closes.
+        if not self.__batches:
+            self.flush()
@@ -0,0 +1,229 @@
+from __future__ import annotations
+from collections import OrderedDict
+from typing import Any, NamedTuple, TYPE_CHECKING
+from weakref import WeakKeyDictionary
+from tkx.constants import NON_STYLE_CONFIG_OPTIONS, WIDGET_NAME
+from tkx.core import TkxElement, parse_css_values
+from tkx.element import Element, resolve_options
+from tkx.layout import relative_values
+from tkx.selector import Descriptor, describe
+import tkinter as tk
+
+if TYPE_CHECKING:
+    from tkx.stylesheet import Stylesheet
+    from tkx.window import Window
+
+# Most parent contexts a template keeps compiled per window.
+MAX_COMPILED = 64
+
+
+class Node(NamedTuple):
+    """A template node with its options parsed for one parent context."""
+
+    widget: type[tk.Widget]
+    id: str | None
+    cl: str | None
+    display: str
+    style: dict[str, str]
+    options: dict[str, Any]
+    relative: dict[str, float]
+    inherits: frozenset[str]
+    children: tuple[Node, ...]
+
+    # Known before the widget exists, so that instances skip working them out.
+    classes: tuple[str, ...] | None
+    widget_name: str | None
+
+
+class Template:
+    """
+    Reusable, declarative description of an element tree.
+
+    A spec is a dictionary with a `widget` (a tkinter widget class or the
+    name of one, eg. `"Label"`), an optional list of `children` specs and
+    any keyword arguments accepted by `TkxElement.add`. Specs may be
+    nested dictionaries loaded from JSON.
+
+    ```python
+    row = tkx.Template({
+        "widget": "Frame",
+        "cl": "row",
+        "display": "flex",
+        "children": [
+            {"widget": "Label", "cl": "name"},
+            {"widget": "Button", "text": "Open"},
+        ],
+    })
+
+    for _ in range(5000):
+        row.instantiate(root)
+    ```
+
+    Styles and options are resolved once per parent context and reused by
+    every instance, so stamping a template costs little more than
+    creating its widgets. Each window keeps the `MAX_COMPILED` contexts
+    used last, which are dropped with the window or when its stylesheet
+    changes.
+    """
+
+    def __init__(self, spec: dict[str, Any]):
+        self.spec = normalize(spec)
+        self.__compiled: WeakKeyDictionary[Window, Compiled] = WeakKeyDictionary()
+
+    def instantiate(self, parent: TkxElement, **kwargs) -> Element:
+        """
+        Create a new instance of this template as a child of `parent` and
+        return its top-level `Element`. Keyword arguments override those
+        of the template's top-level spec for this instance only.
+        """
+        root = parent.root
+
+        # Ids and classes change the cascade, so resolve those instances anew.
+        if {"id", "cl", "display"} & kwargs.keys():
+            spec = dict(self.spec, **kwargs)
+            node = compile_node(spec, root, parent.style, root.ancestry(parent))
+            kwargs = {}
+
+        else:
+            compiled = self.__compiled.get(root)
+            if compiled is None or not compiled.current(root.stylesheet):
+                compiled = self.__compiled[root] = Compiled(root.stylesheet)
+
+            ancestry = root.ancestry(parent)
+            key = (tuple(parent.style.items()), ancestry)
+            node = compiled.nodes.get(key)
+            if node is None:
+                node = compiled.nodes[key] = compile_node(self.spec, root, parent.style, ancestry)
+                if len(compiled.nodes) > MAX_COMPILED:
+                    compiled.nodes.popitem(last=False)
+            else:
+                compiled.nodes.move_to_end(key)
+
+        return mount(node, parent, kwargs, root)
+
+
+class Compiled:
+    """The nodes a template compiled for one window, by parent context, least recently used first."""
+
+    __slots__ = ("stylesheet", "version", "nodes")
+
+    def __init__(self, stylesheet: Stylesheet | None):
+        self.stylesheet = stylesheet
+        self.version = getattr(stylesheet, "version", None)
+        self.nodes: OrderedDict[tuple, Node] = OrderedDict()
+
+    def current(self, stylesheet: Stylesheet | None) -> bool:
+        """Return whether the nodes were compiled for the current version of `stylesheet`."""
+        return stylesheet is self.stylesheet and getattr(stylesheet, "version", None) == self.version
+
+
+def compile_node(
+    spec: dict[str, Any], root: TkxElement, parent_style: dict[str, str], ancestry: tuple[Descriptor, ...] = ()
+) -> Node:
+    """
+    Resolve the options of `spec` and its children against a parent style
+    and, for selectors with combinators, the parent's ancestry.
+    """
+    kwargs = dict(spec)
+    widget = kwargs.pop("widget")
+    children = kwargs.pop("children", ())
+
+    id, cl, display, style, options, relative, inherits = resolve_options(widget, root, parent_style, kwargs, ancestry)
+
+    # Children see this node as their parent.
+    if ancestry:
+        ancestry = (describe(widget.__name__, id, cl),) + ancestry
+
+    return Node(
+        widget,
+        id,
+        cl,
+        display,
+        style,
+        options,
+        relative,
+        inherits,
+        tuple(compile_node(child, root, style, ancestry) for child in children),
+        None if cl is None else tuple(cl.split(" ")),
+        # Tk names a widget after its class unless it is given a name.
+        None if "name" in options else WIDGET_NAME.search(widget.__name__.lower())[0],
+    )
+
+
+def mount(
+    node: Node,
+    parent: TkxElement,
+    overrides: dict[str, Any] | None = None,
+    root: Window | None = None,
+    place: bool = True,
+) -> Element:
+    """
+    Create the elements described by a compiled node under `parent`, whose
+    root is `root`. The children of each node are placed together once
+    they all exist; `place` is false for them, so that they are not placed
+    one by one.
+    """
+    if root is None:
+        root = parent.root
+
+    style = node.style.copy()
+    options = node.options
+    relative = node.relative
+    inherits = node.inherits
+
+    if overrides:
+        relative = {k: v for k, v in relative.items() if k not in overrides}
+        relative.update(relative_values(overrides))
+        inherits = inherits - overrides.keys()
+        overrides = parse_css_values(dict(overrides), parent.style, root.stylesheet)
+        style.update((k, v) for k, v in overrides.items() if k not in NON_STYLE_CONFIG_OPTIONS)
+        options = dict(options, **overrides)
+
+    element = Element.__new__(Element)
+    element.mount(
+        node.widget,
+        parent,
+        node.id,
+        node.cl,
+        node.display,
+        style,
+        options,
+        relative,
+        inherits,
+        root,
+        node.classes,
+        node.widget_name,
+    )
+
+    if parent.elements is None:
+        parent.elements = []
+
+    parent.elements.append(element)
+    if place:
+        parent.add_element(element)
+
+    if node.children:
+        element.add_elements([mount(child, element, None, root, False) for child in node.children])
+
+    return element
+
+
+def normalize(spec: dict[str, Any]) -> dict[str, Any]:
+    """
+    Return a copy of `spec` with widget names replaced by tkinter widget
+    classes, recursively.
+    """
+    spec = dict(spec)
+    spec["widget"] = widget_class(spec.get("widget"))
+    spec["children"] = tuple(normalize(child) for child in spec.get("children", ()))
+    return spec
+
+
+def widget_class(widget: type[tk.Widget] | str) -> type[tk.Widget]:
+    """Return a tkinter widget class, given it or its name (eg. `"Label"`)."""
+    cls = getattr(tk, widget, None) if isinstance(widget, str) else widget
+
+    if not (isinstance(cls, type) and issubclass(cls, tk.Widget)):
+        raise ValueError(f"{widget!r} is not a tkinter widget.")
+
+    return cls
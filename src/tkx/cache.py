@@ -0,0 +1,173 @@
+from __future__ import annotations
+from collections import OrderedDict
+from hashlib import blake2b
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Callable, NamedTuple
+from tkx.constants import CACHE_FORMAT_VERSION
+import marshal
+import os
+import threading
+
+
+class CacheLoad(NamedTuple):
+    """Passed to a `StylesheetCache` hook after every load."""
+
+    source_path: str
+    hit: bool
+    seconds: float
+
+
+class StylesheetCache:
+    """
+    Opt-in on-disk cache of compiled stylesheets.
+
+    Each stylesheet is stored in its own file inside `directory`, keyed by
+    its resolved path. An entry is reused if the source file's mtime and
+    size are unchanged, or if its contents still hash to the same digest.
+    Anything else (including a corrupt or outdated cache file) is treated
+    as a miss and the entry is rebuilt.
+
+    Parameters
+    - directory: `str | Path` - Where cache files are written. Created if missing.
+    - hook: `Callable[[CacheLoad], None] | None` - Called after every load.
+    """
+
+    def __init__(self, directory: str | Path, hook: Callable[[CacheLoad], None] | None = None):
+        self.directory = Path(directory)
+        self.hook = hook
+        self.hits = 0
+        self.misses = 0
+        self.last: CacheLoad | None = None
+
+    def entry_path(self, source_path: str) -> Path:
+        """Return the cache file used for the given stylesheet."""
+        key = blake2b(str(Path(source_path).resolve()).encode(), digest_size=16).hexdigest()
+        return self.directory / f"{key}.tkxc"
+
+    def load(self, source_path: str, compile: Callable[[str], Any]) -> Any:
+        """
+        Return the compiled form of `source_path`, calling `compile` with
+        the file's contents only if no valid cache entry exists.
+        """
+        start = perf_counter()
+        resolved = str(Path(source_path).resolve())
+        entry_path = self.entry_path(resolved)
+        stat = os.stat(source_path)
+        entry = self._read(entry_path)
+
+        data = None
+        source = None
+        if entry is not None:
+            _, path, mtime, size, digest, cached = entry
+
+            # Fast path: the file is untouched, so skip reading it.
+            if path == resolved and (mtime, size) == (stat.st_mtime_ns, stat.st_size):
+                data = cached
+
+            # The file was touched but may not have changed.
+            else:
+                source = _read_source(source_path)
+                if _digest(source) == digest:
+                    data = cached
+                    self._write(entry_path, resolved, stat, digest, data)
+
+        hit = data is not None
+        if not hit:
+            if source is None:
+                source = _read_source(source_path)
+            data = compile(source)
+            self._write(entry_path, resolved, stat, _digest(source), data)
+
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+
+        self.last = CacheLoad(str(source_path), hit, perf_counter() - start)
+        if self.hook is not None:
+            self.hook(self.last)
+
+        return data
+
+    def _read(self, entry_path: Path) -> tuple | None:
+        try:
+            # Reading the whole file first is much faster than marshal.load(f).
+            with open(entry_path, "rb") as f:
+                entry = marshal.loads(f.read())
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+
+        if not isinstance(entry, tuple) or len(entry) != 6 or entry[0] != CACHE_FORMAT_VERSION:
+            return None
+        return entry
+
+    def _write(self, entry_path: Path, resolved: str, stat: os.stat_result, digest: bytes, data: Any) -> None:
+        entry = (CACHE_FORMAT_VERSION, resolved, stat.st_mtime_ns, stat.st_size, digest, data)
+
+        # Write to a temporary file first so readers never see a partial entry.
+        # Processes and threads writing the same entry each use their own.
+        tmp_path = entry_path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                marshal.dump(entry, f)
+            os.replace(tmp_path, entry_path)
+        except OSError:
+            # A cache that cannot be written is simply not used.
+            tmp_path.unlink(missing_ok=True)
+
+
+def _digest(source: str) -> bytes:
+    return blake2b(source.encode(), digest_size=16).digest()
+
+
+def _read_source(source_path: str) -> str:
+    with open(source_path) as f:
+        return f.read()
+
+
+class StyleCache:
+    """
+    Fully resolved element styles, keyed by everything that determines
+    them: the widget class, id, class list and the values an element
+    inherits from its parent. Holds at most `max_size` styles, dropping
+    the least recently used first.
+
+    Entries must be treated as read-only. Callers copy a style before
+    changing it.
+
+    Parameters
+    - max_size: `int` - Most styles kept.
+    """
+
+    def __init__(self, max_size: int = 4096):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.__styles: OrderedDict[tuple, dict[str, str]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.__styles)
+
+    def clear(self) -> None:
+        """Discard every cached style. Hit and miss counters are kept."""
+        self.__styles.clear()
+
+    def get(self, key: tuple) -> dict[str, str] | None:
+        """Return the style cached under `key` or `None`, counting the lookup."""
+        style = self.__styles.get(key)
+        if style is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self.__styles.move_to_end(key)
+        return style
+
+    def set(self, key: tuple, style: dict[str, str]) -> None:
+        styles = self.__styles
+        styles[key] = style
+        if len(styles) > self.max_size:
+            styles.popitem(last=False)
+            self.evictions += 1
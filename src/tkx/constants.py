@@ -1,3 +1,6 @@
+import re
+
+
 # Property name translations.
 CSS_PROPERTY_NAME_TRANSLATIONS = {
     "background": "bg",
@@ -14,19 +17,28 @@ INHERITED_PROPERTIES: list[str] = [
     "color",
 ]
 
+# Style keys of the inherited properties, eg. "bg" for "background".
+INHERITED_STYLE_KEYS: tuple[str] = tuple(CSS_PROPERTY_NAME_TRANSLATIONS.get(p) for p in INHERITED_PROPERTIES)
+
 # Properties not supported by container objects.
 INVALID_CONTAINER_PROPERTIES: list[str] = [
     "color",
 ]
 
-# Regular expressions to help parse CSS.
-MATCH_COMMENT = r"/\*.+?\*/"
-MATCH_BLOCK = r"\{.*?\}"
-MATCH_BRACES = r"[\{\}]"
-MATCH_DELIMITER_SPACE = r"(?<=[:,])\s"
-MATCH_SELECTOR = r"[:\w\.#\-]+\{"
-MATCH_SPACE = r"\s"
-MATCH_VAR_NAME = r"--\w+"
+# Regular expressions to help parse CSS, compiled once at import.
+# Matches a whole var() call, up to its closing parenthesis: group 1 is
+# the variable name and group 2 the optional fallback value, which may
+# contain parentheses, eg. `var(--bg, rgb(0, 0, 0))`.
+MATCH_VAR_CALL = re.compile(r"var\(\s*(--[-\w]+)\s*(?:,\s*(.*?))?\s*\)", re.DOTALL)
+
+# Matches a url() value: group 1 is the unquoted URL.
+MATCH_URL = re.compile(r"""url\(\s*["']?([^"')]*)["']?\s*\)""")
+
+# Splits tk geometry strings ("{width}x{height}+{x}+{y}").
+MATCH_GEOMETRY_SEPARATOR = re.compile(r"[x+]")
+
+FONT_PROPERTIES: frozenset[str] = frozenset({"font-family", "font-size", "font-style", "font-weight"})
+RESOURCE_PROPERTIES: frozenset[str] = FONT_PROPERTIES | {"background-image"}
 
 # tk.Widget options not associated with style.
 NON_STYLE_CONFIG_OPTIONS: set[str] = {
@@ -45,6 +57,39 @@ NON_STYLE_CONFIG_OPTIONS: set[str] = {
     "visual",
 }
 
+# Widget options which transitions animate, by the kind of value they hold.
+ANIMATED_COLOR_OPTIONS: frozenset[str] = frozenset(
+    {
+        "activebackground",
+        "activeforeground",
+        "background",
+        "bg",
+        "disabledforeground",
+        "fg",
+        "foreground",
+        "highlightbackground",
+        "highlightcolor",
+        "insertbackground",
+        "selectbackground",
+        "selectforeground",
+        "troughcolor",
+    }
+)
+ANIMATED_LENGTH_OPTIONS: frozenset[str] = frozenset(
+    {
+        "bd",
+        "borderwidth",
+        "height",
+        "highlightthickness",
+        "insertwidth",
+        "padx",
+        "pady",
+        "selectborderwidth",
+        "width",
+        "wraplength",
+    }
+)
+
 STYLE_CONFIG_OPTIONS: set[str] = {
     "bd",
     "borderwidth",
@@ -60,3 +105,138 @@ STYLE_CONFIG_OPTIONS: set[str] = {
     "pady",
     "width",
 }
+
+
+# Bump whenever the layout of cached data changes.
+CACHE_FORMAT_VERSION = 4
+
+
+# Widget methods which Element forwards to its widget. These are bound
+# once on the class instead of being looked up through __getattr__.
+DELEGATED_WIDGET_METHODS: tuple[str] = (
+    "after",
+    "after_cancel",
+    "after_idle",
+    "cget",
+    "focus_set",
+    "grid",
+    "grid_forget",
+    "grid_info",
+    "keys",
+    "lift",
+    "lower",
+    "pack",
+    "pack_forget",
+    "pack_info",
+    "place",
+    "place_forget",
+    "place_info",
+    "unbind",
+    "update",
+    "update_idletasks",
+    "winfo_exists",
+    "winfo_height",
+    "winfo_ismapped",
+    "winfo_reqheight",
+    "winfo_reqwidth",
+    "winfo_rootx",
+    "winfo_rooty",
+    "winfo_width",
+    "winfo_x",
+    "winfo_y",
+)
+
+# The name Tk gives a widget after its class, eg. "label" in ".!frame.!label2".
+WIDGET_NAME = re.compile(r"\w+")
+
+
+# Durations kept per stage and label for percentiles.
+MAX_SAMPLES = 4096
+
+# Events kept for Chrome traces.
+MAX_EVENTS = 200_000
+
+
+# Whitespace and comments which may appear between any two tokens.
+MATCH_SKIP = re.compile(r"(?:\s+|/\*.*?\*/)*", re.S)
+
+# A selector (or selector list) followed by the opening brace of its block.
+MATCH_SELECTOR = re.compile(r"([^{};/\"']+)\{")
+
+# A single "name: value" declaration. Quoted strings may contain any
+# character, including the ":" and ";" delimiters. Values may span lines,
+# but end before a line starting with another "name:", so that a missing
+# ";" is reported rather than read as part of the value.
+MATCH_DECLARATION = re.compile(
+    r"""
+    ([-\w]+)\s*:\s*
+    (
+        (?:
+            [^;{}"'/\n]+
+            | \n(?!(?:[^\S\n]|/\*.*?\*/)*[-\w]+\s*:)
+            | "(?:\\.|[^"\\])*"
+            | '(?:\\.|[^'\\])*'
+            | /\*.*?\*/
+            | /(?!\*)
+        )*
+    )
+    """,
+    re.S | re.X,
+)
+
+# A comment inside a declaration's value.
+MATCH_COMMENT = re.compile(r"/\*.*?\*/", re.S)
+
+
+# Spec entries which describe the tree rather than an element's options.
+STRUCTURAL_KEYS = frozenset({"widget", "children", "key"})
+
+# Marks a missing value where None is a valid one.
+MISSING = object()
+
+
+# Rough memory used by a font, which Tk does not report.
+FONT_BYTES = 4096
+
+# Bytes per pixel of a decoded image.
+IMAGE_PIXEL_BYTES = 4
+
+
+# Splits a selector into compounds: group 1 is ">" for child
+# combinators and None for descendant combinators (whitespace).
+MATCH_COMBINATOR = re.compile(r"\s*(>)\s*|\s+")
+
+# Matches a compound selector such as "Button#save.primary": group 1 is
+# the type (or "*") and group 2 any number of ids and classes.
+MATCH_COMPOUND = re.compile(r"(\*|[A-Za-z_][-\w]*)?((?:[#.][-\w]+)*)")
+# An id ("#save") or class (".primary") of a compound selector.
+MATCH_COMPOUND_PART = re.compile(r"([#.])([-\w]+)")
+
+# Classes of a selector or element without any.
+NO_CLASSES: frozenset[str] = frozenset()
+
+
+# Marks a key of the base style which an element's overrides removed.
+DELETED = object()
+
+
+# Splits a transition list on commas outside of parentheses.
+MATCH_TRANSITION_SEPARATOR = re.compile(r",(?![^(]*\))")
+
+# A time such as "200ms" or ".3s": group 1 is the amount and group 2 the unit.
+MATCH_TIME = re.compile(r"(\d*\.?\d+)(ms|s)")
+
+# A length without a unit or in pixels, eg. "12" or "12px".
+MATCH_NUMBER = re.compile(r"-?\d*\.?\d+(?:px)?")
+
+# A cubic-bezier() timing function: group 1 is its comma-separated points.
+MATCH_CUBIC_BEZIER = re.compile(r"cubic-bezier\(([^)]*)\)")
+
+# The points of the cubic-bezier() curve of each named timing function.
+TIMING_FUNCTIONS: dict[str, tuple[float, float, float, float]] = {
+    "linear": (0.0, 0.0, 1.0, 1.0),
+    "ease": (0.25, 0.1, 0.25, 1.0),
+    "ease-in": (0.42, 0.0, 1.0, 1.0),
+    "ease-out": (0.0, 0.0, 0.58, 1.0),
+    "ease-in-out": (0.42, 0.0, 0.58, 1.0),
+}
@@ -1,25 +1,48 @@
 from __future__ import annotations
+from time import perf_counter
 from tkinter import Widget
 from typing import Any, Callable, Literal
 from tkx.constants import (
     CSS_PROPERTY_NAME_TRANSLATIONS,
-    INHERITED_PROPERTIES,
+    INHERITED_STYLE_KEYS,
     NON_STYLE_CONFIG_OPTIONS,
 )
+from tkx import instrument
 from tkx.error import InvalidDisplayError
-import re
 
 
 translate_css = lambda x: CSS_PROPERTY_NAME_TRANSLATIONS.get(x)
 
 
 class TkxElement:
-    def __init__(self):
-        super().__init__()
+    # Elements are created in large numbers, so their state is kept in
+    # slots rather than a per-instance __dict__.
+    __slots__ = ("__display", "depth", "inherits", "order", "parent", "style", "widget", "widget_name")
+
+    def __init__(self, **kwargs):
+        # Keyword arguments are passed on, eg. to tk.Tk for windows.
+        super().__init__(**kwargs)
         self.__display: Literal["block", "flex", "grid", "none"] = "block"
-        self.__parent: TkxElement | None = None
-        self.__style: dict[str, str] | None = None
-        self.__widget: Widget | None = None
+
+        # Object to which this object is added, or None for the root.
+        self.parent: TkxElement | None = None
+
+        # Number of ancestors, and position in the order elements were created.
+        self.depth = 0
+        self.order = 0
+
+        # Style dictionary associated with this object.
+        self.style: dict[str, str] = dict()
+
+        # Inherited style keys whose values currently come from the parent
+        # rather than from this object's own rules or options. Elements
+        # inheriting the same keys share one frozenset.
+        self.inherits: frozenset[str] = frozenset()
+
+        # Widget associated with this object and its lowercase name, or
+        # None if this object is itself a widget (eg. a Window).
+        self.widget: Widget | None = None
+        self.widget_name: str | None = None
 
     def add(self, widget: Widget, **kwargs):
         """
@@ -44,7 +67,6 @@ class TkxElement:
         if self.elements is None:
             self.elements = []
 
-        kwargs = parse_css_kwargs(self, **kwargs)
         element = Element(widget, self, **kwargs)
         self.elements.append(element)
 
@@ -52,16 +74,103 @@ class TkxElement:
 
         return element
 
+    def build(self, spec: dict[str, Any] | list[dict[str, Any]]):
+        """
+        Creates the elements described by a declarative spec (or list of
+        specs) as children of the caller in a single pass. Returns the
+        top-level `Element`, or a list of them if given a list.
+
+        See `tkx.Template` for the format of a spec.
+        """
+        from tkx.builder import Template
+
+        if isinstance(spec, list):
+            return [Template(s).instantiate(self) for s in spec]
+
+        return Template(spec).instantiate(self)
+
+    def delegate(self, sequence: str, selector: str, func: Callable):
+        """
+        Call `func` when the event `sequence` happens on an element inside
+        the caller which matches `selector` (or inside such an element).
+        Returns a `Delegate` which can be passed to `undelegate`.
+
+        One handler serves every matching element, including elements
+        added later, so delegating costs the same however many elements
+        there are. `func` is given the event with its `element` attribute
+        set to the matched element, and may be a coroutine function (see
+        `Element.bind`).
+
+        Parameters
+        - sequence: `str` - Event sequence, eg. `"<Button-1>"`.
+        - selector: `str` - Selector list, as accepted by `Window.query_all`.
+        - func: `Callable` - Event handler.
+        """
+        from tkx.element import awaitable_handler
+
+        return self.root.delegator.add(self, sequence, selector, awaitable_handler(self, func))
+
+    def undelegate(self, sequence: str, delegate=None) -> None:
+        """Remove a handler added with `delegate` for `sequence`, or all of the caller's."""
+        self.root.delegator.remove(self, sequence, delegate)
+
+    def render(self, tree: dict[str, Any] | list[dict[str, Any]]):
+        """
+        Make the children of the caller match a spec (or list of specs),
+        as accepted by `build`, changing only what differs from the specs
+        last rendered. Returns a `RenderReport` of the widgets created,
+        configured, moved and destroyed.
+
+        Children are matched to specs by their `key` (or else their `id`),
+        and otherwise by position among those without one. Specs equal to
+        the ones last rendered are skipped along with their children, so
+        rendered specs must not be modified in place.
+        """
+        from tkx.reconcile import render
+
+        return render(self, tree if isinstance(tree, list) else [tree])
+
     def add_element(self, element):
+        start = perf_counter() if instrument.enabled else None
+
         if self.display == "block":
             element.widget.pack(fill="x")
-            return
 
-        if self.display == "flex":
+        elif self.display == "flex":
             element.widget.grid(row=0, column=len(self.elements))
+
+        # Rows of a virtual container are placed by its VirtualList.
+        elif self.display != "virtual":
+            raise NotImplementedError()
+
+        if start is not None:
+            instrument.record("geometry", element.widget_name, start)
+
+    def add_elements(self, elements: list) -> None:
+        """
+        Place several new children, the last ones of `self.elements`, as
+        `add_element` does for each. Children of a block container are
+        packed with a single Tk call.
+        """
+        if not elements:
             return
 
-        raise NotImplementedError()
+        start = perf_counter() if instrument.enabled else None
+
+        if self.display == "block":
+            widget = elements[0].widget
+            widget.tk.call("pack", "configure", *(e.widget for e in elements), "-fill", "x")
+
+        elif self.display == "flex":
+            first = len(self.elements) - len(elements) + 1
+            for i, element in enumerate(elements):
+                element.widget.grid(row=0, column=first + i)
+
+        elif self.display != "virtual":
+            raise NotImplementedError()
+
+        if start is not None:
+            instrument.record("geometry", elements[0].widget_name, start)
 
     def get_style_of(self, name: str, fallback: str | None = None) -> dict[str, str] | None:
         """
@@ -87,35 +196,19 @@ class TkxElement:
         # Return a copy of the style dictionary.
         return dict(self.stylesheet.get(name))
 
-    def inherit_style(self) -> None:
-        for p in INHERITED_PROPERTIES:
-            if self.style.get(translate_css(p)) is None:
-                if self.parent.style.get(translate_css(p)) is None:
-                    continue
-
-                self.style[translate_css(p)] = self.parent.style.get(translate_css(p))
-
     @property
-    def display(self) -> Literal["block", "flex", "grid", "none"]:
+    def display(self) -> Literal["block", "flex", "grid", "none", "virtual"]:
         return self.__display
 
     @display.setter
-    def display(self, value: Literal["block", "flex", "grid", "none"]) -> None:
-        if value not in {"block", "flex", "grid", "none"}:
+    def display(self, value: Literal["block", "flex", "grid", "none", "virtual"]) -> None:
+        if value not in {"block", "flex", "grid", "none", "virtual"}:
             raise InvalidDisplayError(
-                f'"{value}" is not a valid value. Expected one of ("block", "flex", "grid", or "none")'
+                f'"{value}" is not a valid value. Expected one of ("block", "flex", "grid", "none", or "virtual")'
             )
 
         self.__display = value
 
-    @property
-    def parent(self) -> TkxElement:
-        return self.__parent
-
-    @parent.setter
-    def parent(self, value: TkxElement) -> None:
-        self.__parent = value
-
     @property
     def root(self):
         """Returns the root window."""
@@ -123,48 +216,49 @@ class TkxElement:
             return self
         return self.parent.root
 
-    @property
-    def style(self) -> dict[str, str] | None:
+    def virtualize(self, source, template, bind=None, row_height: int = 24):
         """
-        Returns the style dictionary associated with this object or
-        creates a new `dict` and returns it.
+        Displays the items of `source` as rows created from `template`,
+        creating only enough rows to fill the caller's viewport and
+        recycling them as it scrolls. The caller must have been created
+        with `display="virtual"`. Returns the `VirtualList` managing the
+        rows, which is also stored as `self.virtual`.
+
+        Parameters
+        - source: `Sequence` - Items to display.
+        - template: `Template | dict` - Template (or spec) for a single row.
+        - bind: `Callable[[Element, Any], None] | None` - Applies an item to a row.
+          By default, dictionaries are passed to `configure` and other items become the row's text.
+        - row_height: `int` - Height of every row in pixels.
         """
-        # Create self.style if it doesn't already exist.
-        if self.__style is None:
-            self.__style = dict()
-        return self.__style
+        from tkx.virtual import VirtualList, bind_item
 
-    @style.setter
-    def style(self, value: dict[str, str] | None) -> None:
-        self.__style = value
+        if self.display != "virtual":
+            raise InvalidDisplayError('virtualize requires display="virtual".')
 
-    @property
-    def widget(self) -> Widget | None:
-        """Returns the widget associated with this object or `None`."""
-        return self.__widget
+        self.virtual = VirtualList(self, source, template, bind or bind_item, row_height)
+        self.virtual.render()
+        return self.virtual
 
-    @widget.setter
-    def widget(self, value: Widget) -> None:
-        self.__widget = value
+    def __getattr__(self, attr: str) -> Any | None:
+        # Only called when no attribute is found in self. Common widget
+        # methods are delegated by Element directly, so this is the slow
+        # path for anything else: check self.widget.
+        if attr == "widget":
+            raise AttributeError(attr)
 
-    @property
-    def widget_name(self) -> str | None:
-        """Returns the lowercase name of this object's widget or `None`."""
         if self.widget is not None:
-            return re.search(r"\w+", str(self.widget).split(".")[-1])[0]
-        return None
-
-    def __getattr__(self, attr: str) -> Any | None:
-        # If no attribute is found in self, check self.widget.
-        if self[attr] is None and self.widget is not None:
             return getattr(self.widget, attr)
-        return self[attr]
+        return None
 
     def __getitem__(self, attr: str) -> Any | None:
-        return self.__dict__.get(attr)
+        try:
+            return object.__getattribute__(self, attr)
+        except AttributeError:
+            return None
 
     def __setitem__(self, key: str, value: Any) -> None:
-        self.__dict__[key] = value
+        setattr(self, key, value)
 
 
 def parse_css_kwargs(obj, **kwargs) -> dict[str, str]:
@@ -173,21 +267,31 @@ def parse_css_kwargs(obj, **kwargs) -> dict[str, str]:
     CSS variables. Possible values include:
     * Percent values (`width: 50%` -> `width={self.parent|root}.width / 2`)
     """
-    for k, v in kwargs.items():
-        if "%" in str(v):
-            percent = float(v.replace("%", ""))
+    target = obj.parent if obj.parent is not None else obj.root
+    return parse_css_values(kwargs, target.style, obj.root.stylesheet)
 
-            if obj.parent is not None:
-                target = obj.parent
 
-            else:
-                target = obj.root
+def parse_css_values(values: dict[str, Any], reference: dict[str, str], stylesheet) -> dict[str, Any]:
+    """
+    Return `values` with percentages resolved against the `reference`
+    style and CSS variables replaced using `stylesheet`, if any.
+    """
+    start = perf_counter() if instrument.enabled else None
 
-            amount = float(target.style[k])
+    for k, v in values.items():
+        if "%" in str(v):
+            percent = float(v.replace("%", ""))
+            amount = float(reference[k])
             total = float(amount / 100) * percent
-            kwargs[k] = str(int(total))
+            values[k] = str(int(total))
+
+    if stylesheet is not None:
+        values = stylesheet.format_properties(values)
+
+    if start is not None:
+        instrument.record("parse_css", None, start)
 
-    return obj.root.stylesheet.format_properties(kwargs)
+    return values
 
 
 def update_style(fn):
@@ -229,24 +333,47 @@ def update_style(fn):
 
     def func(self, args: dict[str, Any] | None = None, **kwargs) -> Callable:
         # If both a positional dictionary and keyword arguments
-        # are provided, update the dictionary with the provided
-        # keyword arguments.
+        # are provided, update a copy of the dictionary with the
+        # provided keyword arguments.
         if args is not None:
-            args.update(kwargs)
-            kwargs = args
+            kwargs = {**args, **kwargs}
 
-        # If there is no stylesheet or if no arguments exist, exit.
-        if self.root.stylesheet is None or not any((args, kwargs)):
+        # If no arguments exist, exit.
+        if not kwargs:
             return
 
+        start = perf_counter() if instrument.enabled else None
+        layout = self.root.layout
+
+        # Keep percentages live for elements (the window's size is its own).
+        if self.parent is not None:
+            layout.track(self, kwargs)
+
         kwargs = parse_css_kwargs(self, **kwargs)
 
-        self.style.update(kwargs)
+        # Record the new values, skipping keys not associated with style.
+        style = self.style
+        previous = {k: style.get(k) for k in INHERITED_STYLE_KEYS if k in kwargs}
+        for k, v in kwargs.items():
+            if k not in NON_STYLE_CONFIG_OPTIONS:
+                style[k] = v
 
-        # Remove keys not associated with style.
-        self.style = dict(filter(lambda i: i[0] not in NON_STYLE_CONFIG_OPTIONS, self.style.items()))
+        # Elements sized relative to this one follow its new size.
+        layout.update(kwargs.keys())
 
         # Call the original configure method.
         fn(self, **kwargs)
 
+        # Values set explicitly override inheritance, and new values are
+        # pushed down to descendants still inheriting them.
+        if previous:
+            if not self.inherits.isdisjoint(previous):
+                self.inherits = self.inherits.difference(previous)
+            changed = [k for k, v in previous.items() if style.get(k) != v]
+            if changed and self.elements:
+                self.root.propagate_inherited(self, changed)
+
+        if start is not None:
+            instrument.record("update_style", self.widget_name, start)
+
     return func
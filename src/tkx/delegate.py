@@ -0,0 +1,137 @@
+from __future__ import annotations
+from tkx.query import matches_selector
+from tkx.selector import Selector, parse_selector
+from typing import Any, Callable, TYPE_CHECKING
+import tkinter as tk
+
+if TYPE_CHECKING:
+    from tkx.core import TkxElement
+    from tkx.element import Element
+    from tkx.window import Window
+
+
+class Delegate:
+    """A handler delegated by a container, returned by `TkxElement.delegate`."""
+
+    __slots__ = ("container", "sequence", "selectors", "func")
+
+    def __init__(self, container: TkxElement, sequence: str, selectors: tuple[Selector, ...], func: Callable):
+        self.container = container
+        self.sequence = sequence
+        self.selectors = selectors
+        self.func = func
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.sequence!r}, {self.container!r})"
+
+
+class Delegator:
+    """
+    Dispatches events to handlers delegated by containers to the elements
+    inside them matching a selector.
+
+    Each event sequence is bound once, on the window: bindings on a
+    toplevel also fire for every widget inside it. The element an event
+    happened on is found through `Window.paths`, and handlers run for the
+    closest element matching their selector, from the innermost container
+    out, as events bubble in the DOM. So delegating costs the same however
+    many elements there are, and elements created later are handled too.
+
+    Parameters
+    - window: `Window` - The window whose events are dispatched.
+    """
+
+    def __init__(self, window: Window):
+        self.window = window
+
+        # Handlers by sequence, then by container, in the order they were added.
+        self.__handlers: dict[str, dict[TkxElement, list[Delegate]]] = {}
+
+    def __len__(self) -> int:
+        return sum(len(delegates) for containers in self.__handlers.values() for delegates in containers.values())
+
+    def add(self, container: TkxElement, sequence: str, selectors: str, func: Callable) -> Delegate:
+        """Call `func` for `sequence` events on elements inside `container` matching `selectors`."""
+        parsed = []
+        for text in selectors.split(","):
+            selector = parse_selector(text)
+            if selector is None:
+                raise ValueError(f"{text.strip()!r} is not a supported selector.")
+            parsed.append(selector)
+
+        containers = self.__handlers.get(sequence)
+        if containers is None:
+            containers = self.__handlers[sequence] = {}
+            self.window.bind(sequence, lambda event: self.dispatch(sequence, event), add="+")
+
+        delegate = Delegate(container, sequence, tuple(parsed), func)
+        containers.setdefault(container, []).append(delegate)
+        return delegate
+
+    def dispatch(self, sequence: str, event: tk.Event) -> Any:
+        """
+        Run the handlers delegated for `sequence` which the element `event`
+        happened on, or one of its ancestors, is selected for. Handlers are
+        given the event with its `element` attribute set to the element
+        they matched. One returning `"break"` stops the others.
+        """
+        containers = self.__handlers.get(sequence)
+        if not containers:
+            return None
+
+        element = self.window.paths.get(str(event.widget))
+        if element is None:
+            return None
+
+        # The target and its ancestors, up to the window.
+        chain: list[TkxElement] = []
+        node = element
+        while node is not None:
+            chain.append(node)
+            node = node.parent
+
+        root = self.window
+        for i, container in enumerate(chain):
+            delegates = containers.get(container)
+            if not delegates:
+                continue
+
+            for delegate in list(delegates):
+                match = closest(root, chain[:i], delegate.selectors)
+                if match is None:
+                    continue
+
+                event.element = match
+                if delegate.func(event) == "break":
+                    return "break"
+
+        return None
+
+    def forget(self, container: TkxElement) -> None:
+        """Remove every handler delegated by `container`, eg. when it is destroyed."""
+        for containers in self.__handlers.values():
+            containers.pop(container, None)
+
+    def remove(self, container: TkxElement, sequence: str, delegate: Delegate | None = None) -> None:
+        """Remove a handler delegated by `container` for `sequence`, or all of them."""
+        containers = self.__handlers.get(sequence, {})
+        delegates = containers.get(container)
+        if delegates is None:
+            return
+
+        if delegate is None:
+            delegates.clear()
+        elif delegate in delegates:
+            delegates.remove(delegate)
+
+        if not delegates:
+            del containers[container]
+
+
+def closest(root: Window, chain: list[Element], selectors: tuple[Selector, ...]) -> Element | None:
+    """Return the first element of `chain` (a target and its ancestors) matching one of `selectors`."""
+    for element in chain:
+        if any(matches_selector(root, element, selector) for selector in selectors):
+            return element
+
+    return None
@@ -1,96 +1,232 @@
 from __future__ import annotations
-from typing import Generator
-from tkx.constants import INVALID_CONTAINER_PROPERTIES
-from tkx.core import TkxElement, translate_css, update_style
+from time import perf_counter
+from typing import Any, Callable, Generator
+from tkx import instrument
+from tkx.constants import (
+    DELEGATED_WIDGET_METHODS,
+    INHERITED_STYLE_KEYS,
+    INVALID_CONTAINER_PROPERTIES,
+    MISSING,
+    NON_STYLE_CONFIG_OPTIONS,
+    RESOURCE_PROPERTIES,
+    WIDGET_NAME,
+)
+from tkx.core import TkxElement, parse_css_values, translate_css, update_style
 from tkx.error import DuplicateIdError
+from tkx.layout import relative_values
+from tkx.selector import Descriptor
+from tkx.style import Style
 import tkinter as tk
 
 
 class Element(TkxElement):
-    def __init__(self, widget: tk.Widget, parent: tk.Widget, **kwargs):
-        # CSS id and class values. None if not provided.
-        self.id = kwargs.pop("id", None)
-        self.cl = kwargs.pop("cl", None)
+    __slots__ = (
+        "id",
+        "cl",
+        "elements",
+        "key",
+        "spec",
+        "virtual",
+        "resources",
+        "__data",
+        "__iter_parent",
+        "__weakref__",
+    )
 
-        explicit_display: bool = "display" in kwargs.keys()
-        self.display = kwargs.pop("display", "block")
-        other_kwargs = dict()
+    def __init__(self, widget: tk.Widget, parent: tk.Widget, **kwargs):
+        # Object to which this Element is added.
+        self.parent = parent
 
-        # Handle keyword arguments tkinter doesn't recognize.
-        if widget is tk.Frame:
-            for k in INVALID_CONTAINER_PROPERTIES:
-                value = kwargs.pop(k, None)
-                if value is not None:
-                    other_kwargs[translate_css(k)] = value
+        root = self.root
+        self.mount(widget, parent, *resolve_options(widget, root, parent.style, kwargs, root.ancestry(parent)))
+
+    def mount(
+        self,
+        widget: tk.Widget,
+        parent: TkxElement,
+        id: str | None,
+        cl: str | None,
+        display: str,
+        style: dict[str, str],
+        options: dict[str, Any],
+        relative: dict[str, float] | None = None,
+        inherits: frozenset[str] | None = None,
+        root: TkxElement | None = None,
+        classes: tuple[str, ...] | None = None,
+        widget_name: str | None = None,
+    ) -> None:
+        """
+        Create this `Element`'s widget from fully parsed options and
+        register it with the root. Used by `__init__` and by templates,
+        which parse options once and mount them many times.
+
+        `style` becomes this `Element`'s `Style` and `options`
+        are passed to the widget's constructor as they are. `relative`
+        holds percentage sizes which follow the parent's size, and
+        `inherits` the style keys whose values follow the parent's.
+        Templates also pass what they know in advance: the `root`, the
+        split `classes` and the `widget_name` Tk will use.
+        """
+        self.id = id
+        self.cl = cl
+        self.display = display
 
         # List of direct children of this Element.
         self.elements: list[Element] | None = None
 
+        # VirtualList managing this Element's rows, if virtualized.
+        self.virtual = None
+
+        # Key and spec this Element was last rendered from, see tkx.reconcile.
+        self.key = None
+        self.spec: dict[str, Any] | None = None
+
+        # Keys of the shared fonts and images used, see tkx.resources.
+        self.resources: dict[str, tuple] | None = None
+
+        # Values stored with self[key] under keys which are not attributes,
+        # created on first use.
+        self.__data: dict[str, Any] | None = None
+
         # Object to which this Element is added.
         self.parent = parent
         self.__iter_parent = self.parent
 
+        # Depth lets queries check ancestry by walking up a known distance.
+        if root is None:
+            root = self.root
+        self.depth = parent.depth + 1
+        root.created += 1
+        self.order = root.created
+
+        if self.id is not None:
+            # Raise an error if an element with this id already exists.
+            if root.ids.get(self.id):
+                raise DuplicateIdError(f'An element with id "{self.id}" already exists.')
+
+            # If no error is raised, add this id and Element.
+            root.ids[self.id] = self
+
+        # Register this Element with each of its classes and its type.
+        self.parse_cl(root, classes)
+        root.types.setdefault(widget.__name__, set()).add(self)
+
+        self.style = style
+        self.inherits = shared_inherits(inherits or ())
+
+        # Fonts and images are shared with every element using the same ones.
+        options = root.resources.apply(self, options, widget is tk.Frame)
+
         # Use self.parent's widget attribute as the parent of self.widget.
         # Elements by themselves do not have the tk attribute which
         # tkinter requires for a widget to be added to another object.
+        start = perf_counter() if instrument.enabled else None
+
         if self.parent.widget is not None:
-            self.widget = widget(self.parent.widget, **kwargs)
+            self.widget = widget(self.parent.widget, **options)
 
         # If self.parent has no widget attribute, it is assumed that it
         # is a Window, which directly inherits the tk attribute from its
         # superclass (tk.Tk).
         else:
-            self.widget = widget(self.parent, **kwargs)
+            self.widget = widget(self.parent, **options)
 
-        fallback: str | None = None
-        if self.widget_name == "frame":
+        if start is not None:
+            instrument.record("tk.create", widget.__name__, start)
+
+        # Tk names widgets after their class (eg. ".!frame.!label2").
+        path = str(self.widget)
+        if widget_name is None:
+            widget_name = WIDGET_NAME.search(path.rpartition(".")[2])[0]
+        self.widget_name = widget_name
+
+        # Events name the widget they happened on, see tkx.delegate.
+        root.paths[path] = self
+
+        if widget is tk.Frame:
             self.widget.pack_propagate(0)
 
-        # Style the element from its selector or the fallback.
-        self.style = self.get_style_of(widget.__name__, fallback) or dict()
-        self.style.update(other_kwargs)
+        if relative:
+            root.layout.add(self, relative)
+
+    def __getitem__(self, attr: str) -> Any | None:
+        try:
+            return object.__getattribute__(self, attr)
+        except AttributeError:
+            data = self.__data
+            return None if data is None else data.get(attr)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        # Elements have no __dict__, so keys which are not attributes are
+        # kept in a dictionary of their own.
+        try:
+            setattr(self, key, value)
+        except AttributeError:
+            if self.__data is None:
+                self.__data = {}
+            self.__data[key] = value
+
+    def add_class(self, *names: str) -> None:
+        """Add one or more CSS classes to this `Element` and restyle it."""
+        classes = self.classes
+        self.set_classes(classes + [n for n in names if n not in classes])
+
+    def bind(self, sequence: str | None = None, func: Callable | None = None, add: bool | None = None):
+        """
+        Bind an event and handler to an `Element`'s widget. Handlers may be
+        coroutine functions while the window runs with `run_async` or
+        `tkx.run`, in which case they are scheduled as asyncio tasks.
+        """
+        if func is not None:
+            func = awaitable_handler(self, func)
+        return self.widget.bind(sequence, func, add)
+
+    @property
+    def classes(self) -> list[str]:
+        """Returns this `Element`'s CSS classes in order."""
+        return self.cl.split(" ") if self.cl else []
 
-        if explicit_display:
-            self.style["display"] = self.display
+    @update_style
+    def configure(self, **kwargs):
+        """Configure properties of an `Element` and its widget."""
+        cl = kwargs.pop("cl", None)
+        if cl is not None:
+            self.set_classes(cl.split(" "))
 
-        if self.id is not None:
-            # Raise an error if an element with this id already exists.
-            if self.root.ids.get(self.id):
-                raise DuplicateIdError(f'An element with id "{self.id}" already exists.')
+        display = kwargs.pop("display", None)
+        if display is not None:
+            self.display = display
 
-            # If no error is raised, add this id and Element.
-            self.root.ids[self.id] = self
+        id = kwargs.pop("id", None)
+        if id is not None and id != self.id:
+            self.set_id(id)
 
-            # Style the element from its id selector.
-            self.style.update(self.get_style_of(f"#{self.id}", widget.__name__))
+        # Transitions are stored in the style and applied by the animator.
+        kwargs.pop("transition", None)
 
-        # Apply one or more classes if applicable.
-        self.parse_cl()
+        if "frame" in self.widget_name:
+            kwargs.pop("fg", None)
 
-        # Configure with values from CSS stylesheet.
-        self.inherit_style()
-        self.configure(self.style)
+        root = self.root
+        kwargs = root.resources.apply(self, kwargs, self.widget_name == "frame")
 
-        # Reconfigure the widget with any provided keyword arguments.
         if kwargs:
-            self.configure(kwargs)
-
-    def bind(self, *args):
-        """Bind an event and handler to an `Element`'s widget."""
-        self.widget.bind(*args)
+            root.animator.submit(self, kwargs)
 
-    @update_style
-    def configure(self, **kwargs):
-        """Configure properties of an `Element` and its widget."""
-        for k in ("cl", "display", "id"):
-            value = kwargs.pop(k, None)
-            if value is not None:
-                setattr(self, k, value)
+    def destroy(self) -> None:
+        """
+        Destroy this `Element`'s widget and its descendants, removing them
+        from their parent and from the root's indexes.
+        """
+        root = self.root
+        for element in (self, *descendants(self)):
+            element.unregister(root)
 
-        if "frame" in self.widget_name:
-            kwargs.pop("fg", None)
+        siblings = self.parent.elements
+        if siblings is not None and self in siblings:
+            siblings.remove(self)
 
-        self.widget.configure(**kwargs)
+        self.widget.destroy()
 
     def parents(self) -> Generator[Element]:
         """Returns an ascending generator of an `Element`'s parents."""
@@ -109,26 +245,333 @@ class Element(TkxElement):
         # Return the root.
         yield ref
 
-    def parse_cl(self):
-        """Apply CSS classes in the given order."""
+    def remove_class(self, *names: str) -> None:
+        """Remove one or more CSS classes from this `Element` and restyle it."""
+        self.set_classes([c for c in self.classes if c not in names])
+
+    def restyle(self, before: dict[str, str], properties) -> None:
+        """
+        Update the given style properties from the stylesheet, sending
+        only changed values to the widget. `before` is the resolved style
+        this `Element` previously had: properties whose current value
+        differs from it were set explicitly and are kept.
+        """
+        root = self.root
+        after = self.resolved_style()
+
+        style = self.style
+        options = {}
+        for k in properties:
+            current = style.get(k)
+            value = after.get(k)
+
+            if current != before.get(k) or k == "display":
+                continue
+
+            # Rules may have started or stopped overriding an inherited value.
+            if k in INHERITED_STYLE_KEYS:
+                if self.resolved_style(inherited=False).get(k) is None:
+                    self.inherits = shared_inherits(self.inherits | {k})
+                else:
+                    self.inherits = shared_inherits(self.inherits - {k})
+
+            if current == value:
+                continue
+
+            if value is None:
+                # Nothing else sets this property, so restore the widget's default.
+                del style[k]
+                if k in RESOURCE_PROPERTIES:
+                    options[k] = None
+                elif k in self.widget.keys():
+                    options[k] = self.widget.configure(k)[3]
+
+            else:
+                style[k] = value
+                options[k] = value
+
+        changed = [k for k in INHERITED_STYLE_KEYS if k in options]
+
+        options.pop("transition", None)
+        if self.widget_name == "frame":
+            options.pop("fg", None)
+
+        options = root.resources.apply(self, options, self.widget_name == "frame")
+        if options:
+            root.animator.submit(self, options)
+
+        if changed and self.elements:
+            root.propagate_inherited(self, changed)
+
+    def resolved_style(self, inherited: bool = True) -> dict[str, str]:
+        """
+        Return the shared, read-only style the stylesheet gives this
+        `Element`, without the values it inherits from its parent if
+        `inherited` is `False`.
+        """
+        root = self.root
+        return root.resolved_style(
+            type(self.widget).__name__,
+            self.id,
+            self.cl,
+            self.parent.style if inherited else {},
+            root.ancestry(self.parent),
+        )
+
+    def set_id(self, id: str | None) -> None:
+        """Change this `Element`'s CSS id, keeping the root's id index up to date."""
+        ids = self.root.ids
+        if id is not None and ids.get(id) not in (None, self):
+            raise DuplicateIdError(f'An element with id "{id}" already exists.')
+
+        if self.id is not None and ids.get(self.id) is self:
+            del ids[self.id]
+
+        self.id = id
+        if id is not None:
+            ids[id] = self
+
+    def set_classes(self, classes: list[str], properties=None) -> None:
+        """
+        Replace this `Element`'s CSS classes, keeping the root's class
+        index up to date and restyling only the properties set by the
+        added or removed classes' rules (or the given `properties`).
+        Descendants are restyled too if rules such as `.open > Label`
+        select them through the changed classes.
+        """
+        previous = self.classes
+        if classes == previous:
+            return
+
+        index = self.root.cls
+        for cl in previous:
+            if cl not in classes:
+                members = index.get(cl)
+                if members is not None:
+                    members.discard(self)
+                    if not members:
+                        del index[cl]
+
+        for cl in classes:
+            if cl not in previous:
+                index.setdefault(cl, set()).add(self)
+
+        root = self.root
+        changed = set(previous) ^ set(classes)
+        before = self.resolved_style()
+
+        # Resolve descendants' previous styles while the old classes apply.
+        nested = {}
+        nested_properties = root.class_properties(changed, subject=False) if self.elements else ()
+        if nested_properties:
+            nested = {element: element.resolved_style() for element in descendants(self)}
+
+        self.cl = " ".join(classes) or None
+
+        if properties is None:
+            properties = root.class_properties(changed)
+
+        self.restyle(before, properties)
+        for element, style in nested.items():
+            element.restyle(style, nested_properties)
+
+    def toggle_class(self, name: str, force: bool | None = None, properties=None) -> bool:
+        """
+        Add a CSS class to this `Element` if it is missing, otherwise
+        remove it. If `force` is given, the class is added when `True` and
+        removed when `False`. Returns whether the class is now present.
+        """
+        classes = self.classes
+        present = name in classes
+        add = not present if force is None else force
+
+        if add and not present:
+            self.set_classes(classes + [name], properties)
+        elif not add and present:
+            self.set_classes([c for c in classes if c != name], properties)
+
+        return add
+
+    def unregister(self, root: TkxElement) -> None:
+        """Remove this `Element` from the root's indexes and pending work."""
+        if self.id is not None and root.ids.get(self.id) is self:
+            del root.ids[self.id]
+
+        for name in self.classes:
+            members = root.cls.get(name)
+            if members is not None:
+                members.discard(self)
+                if not members:
+                    del root.cls[name]
+
+        members = root.types.get(type(self.widget).__name__)
+        if members is not None:
+            members.discard(self)
+            if not members:
+                del root.types[type(self.widget).__name__]
+
+        if root.paths.get(str(self.widget)) is self:
+            del root.paths[str(self.widget)]
+
+        root.delegator.forget(self)
+        root.layout.forget(self)
+        root.configure_queue.pending.pop(self, None)
+        root.animator.cancel(self)
+        root.resources.release(self)
+
+    def parse_cl(self, root: TkxElement | None = None, names: tuple[str, ...] | None = None):
+        """
+        Add this `Element` to the root's index of each of its CSS classes.
+        `names` may give the classes already split.
+        """
 
         # If no classes are supplied, exit.
         if self.cl is None:
             return
 
-        for cl in self.cl.split(" "):
+        classes = (self.root if root is None else root).cls
+        for cl in self.cl.split(" ") if names is None else names:
             # If this CSS class isn't defined in the root, create a new set.
-            if self.root.cls.get(cl) is None:
-                self.root.cls[cl] = set()
+            if classes.get(cl) is None:
+                classes[cl] = set()
 
             # Add this Element to the CSS class.
-            self.root.cls[cl].add(self)
+            classes[cl].add(self)
+
+
+def awaitable_handler(element: Element, func: Callable) -> Callable:
+    """Wrap an event handler so that awaitables it returns are run as tasks."""
+
+    def handler(event):
+        result = func(event)
+        if hasattr(result, "__await__"):
+            # Imported here so that asyncio is only loaded by apps using it.
+            from tkx.aio import schedule
+
+            schedule(element.root, result)
+            return None
+        return result
+
+    return handler
+
+
+def descendants(element: TkxElement) -> Generator[Element]:
+    """Yield every element below `element`, parents before their children."""
+    for child in element.elements or ():
+        yield child
+        yield from descendants(child)
+
+
+def resolve_options(
+    widget: type[tk.Widget],
+    root: TkxElement,
+    parent_style: dict[str, str],
+    kwargs: dict[str, Any],
+    ancestry: tuple[Descriptor, ...] = (),
+) -> tuple[str | None, str | None, str, Style, dict[str, Any], dict[str, float], set[str]]:
+    """
+    Resolve the keyword arguments of a new `Element` against the root's
+    stylesheet and its parent's style. `ancestry` describes the parent
+    and its ancestors for selectors with combinators.
+
+    Returns the element's id, class and display values, its style, the
+    options its widget should be created with, its percentage sizes and
+    the style keys it inherits from its parent. Stylesheet values are
+    overridden by `kwargs`.
+    """
+    kwargs = dict(kwargs)
+
+    # CSS id and class values. None if not provided.
+    id = kwargs.pop("id", None)
+    cl = kwargs.pop("cl", None)
+
+    explicit_display: bool = "display" in kwargs.keys()
+    display = kwargs.pop("display", "block")
+    other_kwargs = dict()
+
+    # Handle keyword arguments tkinter doesn't recognize.
+    if widget is tk.Frame:
+        for k in INVALID_CONTAINER_PROPERTIES:
+            value = kwargs.pop(k, None)
+            if value is not None:
+                other_kwargs[translate_css(k)] = value
+
+    # Style the element from its type, id and class selectors. Elements
+    # sharing these (and their parent's inherited values) share one
+    # cached cascade, and one base style parsed from it.
+    stylesheet = root.stylesheet
+    resolved = root.resolved_style(widget.__name__, id, cl, parent_style, ancestry)
+    base = root.styles.base(resolved, lambda style: parse_base(style, parent_style, stylesheet))
+
+    # Keys which neither the element's own rules nor its options set follow its parent.
+    own = root.resolved_style(widget.__name__, id, cl, {}, ancestry)
+    inherits = shared_inherits(
+        k for k in INHERITED_STYLE_KEYS if own.get(k) is None and k not in kwargs and k not in other_kwargs
+    )
+
+    # Values from the stylesheet are overridden by any provided
+    # keyword arguments.
+    explicit = other_kwargs
+    if explicit_display:
+        explicit["display"] = display
+    explicit.update(kwargs)
+
+    # Percentages are kept so they can follow the parent's size.
+    relative = {k: v for k, v in relative_values(resolved).items() if k not in explicit}
+    relative.update(relative_values(explicit))
+
+    explicit = parse_css_values(explicit, parent_style, stylesheet)
+    options = {**base, **explicit}
+
+    # Options the stylesheet sets which are not kept in styles (eg. `text`).
+    other = NON_STYLE_CONFIG_OPTIONS.intersection(resolved)
+    if other:
+        options = {**parse_css_values({k: resolved[k] for k in other}, parent_style, stylesheet), **options}
+
+    # The element only keeps the values which differ from its base style.
+    style = Style(
+        base, {k: v for k, v in explicit.items() if k not in NON_STYLE_CONFIG_OPTIONS and base.get(k, MISSING) != v}
+    )
+
+    # Pass tkinter only the options it accepts.
+    options.pop("display", None)
+    options.pop("transition", None)
+    if widget is tk.Frame:
+        options.pop("fg", None)
+
+    return id, cl, display, style, options, relative, inherits
+
+
+def shared_inherits(keys) -> frozenset[str]:
+    """
+    Return the given inherited style keys as a frozenset shared by every
+    element inheriting the same ones, instead of a set per element.
+    """
+    keys = frozenset(keys)
+    return _inherits.setdefault(keys, keys)
+
+
+# Every combination of inherited keys seen so far, see shared_inherits.
+_inherits: dict[frozenset[str], frozenset[str]] = {}
+
+
+def parse_base(style: dict[str, str], parent_style: dict[str, str], stylesheet) -> dict[str, str]:
+    """Return the stylesheet's `style` for an element, parsed as a base style (see `tkx.style`)."""
+    style = parse_css_values(style, parent_style, stylesheet)
+    return {k: v for k, v in style.items() if k not in NON_STYLE_CONFIG_OPTIONS}
+
+
+def delegate(name: str) -> Callable:
+    """Return a method which calls the tkinter method `name` on an Element's widget."""
+
+    # Look the method up on the widget itself so subclasses' overrides apply.
+    def func(self, *args, **kwargs):
+        return getattr(self.widget, name)(*args, **kwargs)
 
-            cl_dict = self.get_style_of(f".{cl}", self.widget_name)
+    func.__name__ = name
+    func.__doc__ = getattr(tk.Widget, name).__doc__
+    return func
 
-            # If this CSS class isn't defined in the stylesheet, exit.
-            if cl_dict is None:
-                return
 
-            # Update the relevant style properties.
-            self.style.update(cl_dict)
+for name in DELEGATED_WIDGET_METHODS:
+    setattr(Element, name, delegate(name))
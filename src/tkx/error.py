@@ -1,3 +1,20 @@
+class CSSSyntaxError(Exception):
+    """Raised when a stylesheet cannot be parsed."""
+
+    def __init__(self, message: str, line: int, column: int, source_path: str | None = None):
+        self.message = message
+        self.line = line
+        self.column = column
+        self.source_path = source_path
+
+        location = f"{source_path}:{line}:{column}" if source_path else f"line {line}, column {column}"
+        super().__init__(f"{message} ({location})")
+
+
+class CircularVariableError(Exception):
+    pass
+
+
 class DuplicateIdError(Exception):
     pass
 
@@ -0,0 +1,207 @@
+"""
+Opt-in timing of tkx's hot paths.
+
+Timings are process-wide: they are shared by every window, and read
+with `summary()`. Instrumentation is disabled by default. Enable it with `enable()` or by
+setting the `TKX_INSTRUMENT` environment variable before importing tkx.
+While disabled, each instrumented call site costs a single attribute
+check, so it can stay in production builds.
+
+Recorded stages:
+- `parse`: reading and compiling a stylesheet (by source path)
+- `cascade`: resolving an uncached element style (by widget type)
+- `selector`: merging one stylesheet rule into a style (by selector)
+- `parse_css`: resolving percentages and variables in property values
+- `update_style`: a full `configure` call (by widget type)
+- `tk.create`: creating a widget (by widget type)
+- `tk.configure`: sending options to a widget (by widget type)
+- `geometry`: packing or gridding a widget (by widget type)
+- `render`: reconciling children with specs in `render` (by widget type, or none for the window)
+"""
+from __future__ import annotations
+from time import perf_counter
+from typing import Any
+from tkx.constants import MAX_EVENTS, MAX_SAMPLES
+import os
+
+
+enabled: bool = bool(os.environ.get("TKX_INSTRUMENT"))
+
+
+class Stat:
+    """
+    Count, total and sampled durations (in seconds) of one stage. Stats
+    merged from several labels weigh each sample by the number of calls
+    it stands for, see `merge`.
+    """
+
+    __slots__ = ("count", "total", "max", "samples", "weights")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.samples: list[float] = []
+        self.weights: list[float] | None = None
+
+    def add(self, duration: float) -> None:
+        self.count += 1
+        self.total += duration
+        if duration > self.max:
+            self.max = duration
+
+        # Reservoir sampling keeps percentiles representative without
+        # keeping every duration.
+        if len(self.samples) < MAX_SAMPLES:
+            self.samples.append(duration)
+        else:
+            i = randrange(self.count)
+            if i < MAX_SAMPLES:
+                self.samples[i] = duration
+
+    def percentile(self, p: float) -> float:
+        if not self.samples:
+            return 0.0
+
+        if self.weights is None:
+            samples = sorted(self.samples)
+            return samples[min(int(len(samples) * p / 100), len(samples) - 1)]
+
+        weighted = sorted(zip(self.samples, self.weights))
+        target = sum(self.weights) * p / 100
+        cumulative = 0.0
+        for duration, weight in weighted:
+            cumulative += weight
+            if cumulative > target:
+                return duration
+        return weighted[-1][0]
+
+    def summary(self) -> dict[str, float]:
+        """Return this stat in milliseconds."""
+        return {
+            "count": self.count,
+            "total_ms": self.total * 1000,
+            "mean_ms": self.total / self.count * 1000 if self.count else 0.0,
+            "p50_ms": self.percentile(50) * 1000,
+            "p90_ms": self.percentile(90) * 1000,
+            "p99_ms": self.percentile(99) * 1000,
+            "max_ms": self.max * 1000,
+        }
+
+
+def merge(stats) -> Stat:
+    """
+    Return one stat for all of `stats`. A label's reservoir holds at most
+    `MAX_SAMPLES` of its calls, so each of its samples is weighed by the
+    number of calls it stands for: a label called a million times is not
+    outweighed by one called a hundred times.
+    """
+    merged = Stat()
+    merged.weights = []
+    for stat in stats:
+        merged.count += stat.count
+        merged.total += stat.total
+        merged.max = max(merged.max, stat.max)
+        if stat.samples:
+            merged.samples.extend(stat.samples)
+            merged.weights.extend([stat.count / len(stat.samples)] * len(stat.samples))
+    return merged
+
+
+def randrange(stop: int) -> int:
+    # random is only needed once a stage has more than MAX_SAMPLES calls,
+    # so it isn't imported with tkx.
+    from random import randrange
+
+    return randrange(stop)
+
+
+def write_json(path: str, data: Any, **kwargs) -> None:
+    import json
+
+    with open(path, "w") as f:
+        json.dump(data, f, **kwargs)
+
+
+stats: dict[str, dict[str | None, Stat]] = {}
+events: list[tuple[str, str | None, float, float]] = []
+origin = perf_counter()
+
+
+def disable() -> None:
+    """Stop recording. Recorded data is kept until `reset` is called."""
+    global enabled
+    enabled = False
+
+
+def enable() -> None:
+    """Start recording hot path timings."""
+    global enabled
+    enabled = True
+
+
+def export_chrome_trace(path: str) -> None:
+    """Write recorded events in the Chrome trace event format (see chrome://tracing or Perfetto)."""
+    trace = {
+        "traceEvents": [
+            {
+                "name": stage if label is None else f"{stage} {label}",
+                "cat": stage,
+                "ph": "X",
+                "ts": (start - origin) * 1e6,
+                "dur": (end - start) * 1e6,
+                "pid": os.getpid(),
+                "tid": 0,
+                "args": {} if label is None else {"label": label},
+            }
+            for stage, label, start, end in events
+        ],
+        "displayTimeUnit": "ms",
+    }
+
+    write_json(path, trace)
+
+
+def export_json(path: str) -> None:
+    """Write `summary()` to a JSON file."""
+    write_json(path, summary(), indent=2)
+
+
+def record(stage: str, label: str | None, start: float, end: float | None = None) -> None:
+    """Record one timed call of `stage`, which began at `start` (from `perf_counter`)."""
+    if end is None:
+        end = perf_counter()
+
+    by_label = stats.get(stage)
+    if by_label is None:
+        by_label = stats[stage] = {}
+
+    stat = by_label.get(label)
+    if stat is None:
+        stat = by_label[label] = Stat()
+    stat.add(end - start)
+
+    if len(events) < MAX_EVENTS:
+        events.append((stage, label, start, end))
+
+
+def reset() -> None:
+    """Discard everything recorded so far."""
+    global origin
+    stats.clear()
+    events.clear()
+    origin = perf_counter()
+
+
+def summary() -> dict[str, Any]:
+    """
+    Return recorded timings per stage, each with totals across labels and
+    a `by_label` breakdown (eg. per widget type or selector). Timings are
+    recorded for the whole process, across every window.
+    """
+    result = {}
+    for stage, by_label in stats.items():
+        result[stage] = merge(by_label.values()).summary()
+        result[stage]["by_label"] = {str(label): stat.summary() for label, stat in by_label.items()}
+
+    return result
@@ -0,0 +1,144 @@
+from __future__ import annotations
+from operator import attrgetter
+from typing import Any, TYPE_CHECKING
+from weakref import WeakKeyDictionary
+
+if TYPE_CHECKING:
+    import tkinter as tk
+    from tkx.core import TkxElement
+    from tkx.window import Window
+
+
+def relative_values(values: dict[str, Any]) -> dict[str, float]:
+    """Return the percentages in `values` (eg. `width="50%"` -> `{"width": 50.0}`)."""
+    return {k: float(v[:-1]) for k, v in values.items() if isinstance(v, str) and v.endswith("%")}
+
+
+class Layout:
+    """
+    Keeps percentage sizes live for every element of a `Window`.
+
+    Percentages given to an element (eg. `width="50%"`) are remembered
+    alongside the pixel value computed from its parent. The window listens
+    to its own `<Configure>` event only, and when it or a referenced parent
+    size changes, a single pass is scheduled for the next frame. The pass
+    recomputes relative sizes top-down and configures only the widgets
+    whose computed size actually changed, in one batch.
+
+    Parameters
+    - window: `Window` - The window whose elements are laid out.
+    - delay: `int` - Milliseconds to wait for further changes before a pass.
+    """
+
+    def __init__(self, window: Window, delay: int = 16):
+        self.window = window
+        self.delay = delay
+        self.passes = 0
+
+        # Percentages per element, and elements ordered by depth so that
+        # parents are always resolved before their children.
+        self.__relative: WeakKeyDictionary[TkxElement, dict[str, float]] = WeakKeyDictionary()
+        self.__order: list[TkxElement] | None = None
+        self.__keys: set[str] | None = None
+        self.__after_id: str | None = None
+
+        window.bind("<Configure>", self.on_configure, add="+")
+
+    def __len__(self) -> int:
+        return len(self.__relative)
+
+    def forget(self, element: TkxElement) -> None:
+        """Stop tracking the relative sizes of `element`."""
+        if self.__relative.pop(element, None) is not None:
+            self.__order = None
+            self.__keys = None
+
+    def on_configure(self, event: tk.Event) -> None:
+        # Bindings on a toplevel also fire for its descendants.
+        if event.widget is not self.window:
+            return
+
+        style = self.window.style
+        size = {"width": str(event.width), "height": str(event.height)}
+        if all(style.get(k) == v for k, v in size.items()):
+            return
+
+        style.update(size)
+        self.window.width, self.window.height = size["width"], size["height"]
+        self.schedule()
+
+    def run(self) -> None:
+        """Recompute every relative size now, configuring only changed widgets."""
+        if self.__after_id is not None:
+            self.window.after_cancel(self.__after_id)
+            self.__after_id = None
+
+        if self.__order is None:
+            self.__order = sorted(self.__relative.keys(), key=attrgetter("depth"))
+
+        self.passes += 1
+        queue = self.window.configure_queue
+        with self.window.batch():
+            for element in self.__order:
+                reference = element.parent.style
+                style = element.style
+                changed = {}
+
+                for k, percent in self.__relative[element].items():
+                    amount = reference.get(k)
+                    if amount is None:
+                        continue
+
+                    value = str(int(float(amount) / 100 * percent))
+                    if style.get(k) != value:
+                        style[k] = changed[k] = value
+
+                if changed:
+                    queue.submit(element, changed)
+
+    def schedule(self) -> None:
+        """Run a pass after `delay`, merging any changes made until then."""
+        if self.__after_id is None and self.__relative:
+            self.__after_id = self.window.after(self.delay, self.run)
+
+    def track(self, element: TkxElement, values: dict[str, Any]) -> None:
+        """
+        Update the relative sizes of `element` from options it is being
+        created or configured with. Percentages are kept, and any other
+        value for the same key replaces a previous percentage.
+        """
+        relative = self.__relative.get(element)
+        if relative is not None and not relative.keys().isdisjoint(values):
+            for k in values.keys() & relative.keys():
+                del relative[k]
+            self.__keys = None
+
+            if not relative:
+                self.forget(element)
+
+        self.add(element, relative_values(values))
+
+    def add(self, element: TkxElement, relative: dict[str, float]) -> None:
+        """Size `element` relative to its parent, eg. `{"width": 50.0}` for half its width."""
+        if not relative:
+            return
+
+        current = self.__relative.get(element)
+        if current is None:
+            current = self.__relative[element] = {}
+            self.__order = None
+
+        current.update(relative)
+        self.__keys = None
+
+    def update(self, keys) -> None:
+        """Schedule a pass if size keys which elements depend on are being configured."""
+        if self.__relative and not self.keys.isdisjoint(keys):
+            self.schedule()
+
+    @property
+    def keys(self) -> set[str]:
+        """Return every key which some element sizes relatively."""
+        if self.__keys is None:
+            self.__keys = set().union(*self.__relative.values())
+        return self.__keys
@@ -0,0 +1,109 @@
+from __future__ import annotations
+from tkx.constants import CSS_PROPERTY_NAME_TRANSLATIONS, MATCH_COMMENT, MATCH_DECLARATION, MATCH_SELECTOR, MATCH_SKIP
+from tkx.error import CSSSyntaxError
+from sys import intern
+
+
+def parse(source: str, source_path: str | None = None) -> dict[str, dict[str, str]]:
+    """
+    Parse CSS source code into a dictionary of selectors and their
+    properties. Rules which share a selector are merged, with later
+    declarations taking precedence. See `parse_blocks`.
+    """
+    return merge_blocks(parse_blocks(source, source_path))
+
+
+def parse_blocks(source: str, source_path: str | None = None) -> list[tuple[tuple[str, ...], dict[str, str]]]:
+    """
+    Parse CSS source code into a list of rule blocks in source order, each
+    as the selectors of the block and its properties, in a single forward
+    pass. Selector lists (`a, b { ... }`) give the block several selectors.
+
+    Property names are translated to their tkinter equivalents as they
+    are read.
+
+    Raises `CSSSyntaxError` with the line and column of the offending
+    token if the source cannot be parsed.
+    """
+    blocks: list[tuple[tuple[str, ...], dict[str, str]]] = []
+    translate = CSS_PROPERTY_NAME_TRANSLATIONS.get
+    skip = MATCH_SKIP.match
+    match_selector = MATCH_SELECTOR.match
+    match_declaration = MATCH_DECLARATION.match
+
+    pos = skip(source, 0).end()
+    end = len(source)
+
+    while pos < end:
+        selector = match_selector(source, pos)
+        if selector is None:
+            raise _error(source, pos, source_path, "Expected a selector followed by '{'")
+
+        # Every selector in a list receives the same declarations.
+        names = []
+        for name in selector[1].split(","):
+            name = " ".join(name.split())
+            if not name:
+                raise _error(source, pos, source_path, "Empty selector")
+            names.append(name)
+
+        declarations: dict[str, str] = {}
+        blocks.append((tuple(names), declarations))
+
+        pos = skip(source, selector.end()).end()
+
+        # Read declarations until the closing brace.
+        while True:
+            if pos >= end:
+                raise _error(source, selector.start(), source_path, "Unterminated block")
+
+            char = source[pos]
+            if char == "}":
+                pos = skip(source, pos + 1).end()
+                break
+
+            if char == ";":
+                pos = skip(source, pos + 1).end()
+                continue
+
+            declaration = match_declaration(source, pos)
+            if declaration is None:
+                raise _error(source, pos, source_path, "Expected a declaration")
+
+            value = declaration[2]
+            if "/*" in value:
+                value = MATCH_COMMENT.sub("", value)
+            value = value.strip()
+
+            if not value:
+                raise _error(source, declaration.end(), source_path, f'Missing value for "{declaration[1]}"')
+
+            pos = declaration.end()
+            if pos < end and source[pos] not in ";}":
+                if source[pos] == "\n":
+                    pos = skip(source, pos).end()
+                    raise _error(source, pos, source_path, f'Expected ";" after the value of "{declaration[1]}"')
+                raise _error(source, pos, source_path, f"Unexpected {source[pos]!r}")
+
+            # Property names repeat across rules, so share one string per name.
+            name = declaration[1]
+            declarations[intern(translate(name, name))] = value
+
+    return blocks
+
+
+def merge_blocks(blocks: list[tuple[tuple[str, ...], dict[str, str]]]) -> dict[str, dict[str, str]]:
+    """Return the properties of every selector in `blocks`, later blocks taking precedence."""
+    styles: dict[str, dict[str, str]] = {}
+    for names, declarations in blocks:
+        for name in names:
+            styles.setdefault(name, {}).update(declarations)
+
+    return styles
+
+
+def _error(source: str, pos: int, source_path: str | None, message: str) -> CSSSyntaxError:
+    """Build a `CSSSyntaxError` pointing at the given offset of `source`."""
+    line = source.count("\n", 0, pos) + 1
+    column = pos - source.rfind("\n", 0, pos)
+    return CSSSyntaxError(message, line, column, source_path)
@@ -0,0 +1,210 @@
+from __future__ import annotations
+from typing import Any, TYPE_CHECKING
+import threading
+
+if TYPE_CHECKING:
+    from tkx.core import TkxElement
+    from tkx.window import Window
+
+
+class PostQueue:
+    """
+    Element updates posted from any thread, applied on the Tk thread.
+
+    Posting only merges properties into a pending dictionary under a
+    short lock, so the latest value of each property wins and an element
+    is configured at most once per frame however often it is posted to.
+    The Tk thread drains the queue at most `max_fps` times per second
+    while updates keep arriving. No timer runs while the queue is empty:
+    the first post after it emptied schedules the next drain, and the
+    timer stops at the first frame finding nothing to apply.
+
+    Scheduling is the only call a worker thread makes into Tk, and is
+    handed over to the Tk thread by the event loop running the window
+    (`mainloop` or `run_async`). Updates posted before the loop starts
+    are applied once it does.
+
+    Parameters
+    - window: `Window` - The window whose elements are updated.
+    - max_fps: `int` - Most times per second updates are applied.
+    - max_depth: `int | None` - Most elements with pending updates. Posts for further elements are dropped.
+    """
+
+    def __init__(self, window: Window, max_fps: int = 60, max_depth: int | None = None):
+        self.window = window
+        self.max_fps = max_fps
+        self.max_depth = max_depth
+
+        # Counters. `coalesced` counts property values replaced before they
+        # were applied, `dropped` posts discarded because the queue was full
+        # or their element had been destroyed, and `failed` updates which
+        # raised when applied.
+        self.posted = 0
+        self.coalesced = 0
+        self.dropped = 0
+        self.applied = 0
+        self.failed = 0
+        self.frames = 0
+
+        self.__lock = threading.Lock()
+        self.__pending: dict[TkxElement, dict[str, Any]] = {}
+
+        # Whether a drain is scheduled, and the id of its timer once known.
+        self.__scheduled = False
+        self.__stopped = False
+        self.__after_id: str | None = None
+        self.__thread = threading.get_ident()
+        self.__mainloop = False
+
+    @property
+    def depth(self) -> int:
+        """Return the number of elements with pending updates."""
+        return len(self.__pending)
+
+    @property
+    def frame_interval(self) -> int:
+        """Return the shortest time between drains in milliseconds."""
+        return max(1, round(1000 / self.max_fps))
+
+    @property
+    def running(self) -> bool:
+        """Return whether a drain is scheduled."""
+        return self.__scheduled
+
+    def counters(self) -> dict[str, int]:
+        return {
+            "depth": self.depth,
+            "posted": self.posted,
+            "coalesced": self.coalesced,
+            "dropped": self.dropped,
+            "applied": self.applied,
+            "failed": self.failed,
+            "frames": self.frames,
+        }
+
+    def drain(self) -> int:
+        """
+        Apply every pending update in one batch and return the number of
+        elements configured. An update which raises is reported like an
+        error in a Tk callback (see `Window.report_callback_exception`)
+        and does not stop the others. Must be called on the Tk thread.
+        """
+        with self.__lock:
+            if not self.__pending:
+                return 0
+            pending, self.__pending = self.__pending, {}
+
+        applied = 0
+        try:
+            with self.window.batch():
+                for element, properties in pending.items():
+                    if not element.winfo_exists():
+                        with self.__lock:
+                            self.dropped += 1
+                        continue
+
+                    try:
+                        element.configure(properties)
+                    except Exception as error:
+                        self.__report(error)
+                        continue
+
+                    applied += 1
+
+        # Raised when the batch is sent, for the first widget whose options Tk refused.
+        except Exception as error:
+            self.__report(error)
+
+        self.applied += applied
+        self.frames += 1
+        return applied
+
+    def post(self, element: TkxElement, properties: dict[str, Any]) -> bool:
+        """
+        Queue properties to configure `element` with. Safe to call from any
+        thread. Returns `False` if the post was dropped because the queue
+        is full.
+        """
+        with self.__lock:
+            self.posted += 1
+            pending = self.__pending.get(element)
+
+            if pending is None:
+                if self.max_depth is not None and len(self.__pending) >= self.max_depth:
+                    self.dropped += 1
+                    return False
+                self.__pending[element] = dict(properties)
+
+            else:
+                self.coalesced += len(pending.keys() & properties.keys())
+                pending.update(properties)
+
+            start = not self.__scheduled and not self.__stopped
+            self.__scheduled = self.__scheduled or start
+
+        # Outside the lock, as the Tk thread may be waiting for it while
+        # the call is handed over.
+        if start:
+            self.__wake()
+
+        return True
+
+    def attach(self, mainloop: bool = False) -> None:
+        """
+        Called on the Tk thread when an event loop starts running the
+        window, to apply updates posted before. `mainloop` tells whether
+        it is Tk's, which takes over calls from other threads.
+        """
+        self.__mainloop = mainloop
+        with self.__lock:
+            start = self.__scheduled and self.__after_id is None
+        if start:
+            self.__schedule()
+
+    def detach(self) -> None:
+        """Called on the Tk thread when the event loop running the window stops."""
+        self.__mainloop = False
+
+    def stop(self) -> None:
+        """Stop draining the queue, eg. when its window is destroyed. Must be called on the Tk thread."""
+        with self.__lock:
+            self.__stopped = True
+            self.__scheduled = False
+
+        if self.__after_id is not None:
+            self.window.after_cancel(self.__after_id)
+            self.__after_id = None
+
+    def __report(self, error: Exception) -> None:
+        self.failed += 1
+        self.window.report_callback_exception(type(error), error, error.__traceback__)
+
+    def __schedule(self) -> None:
+        if not self.__stopped:
+            self.__after_id = self.window.after(self.frame_interval, self.__tick)
+
+    def __wake(self) -> None:
+        if threading.get_ident() == self.__thread:
+            self.__schedule()
+            return
+
+        runner = self.window.runner
+        if runner is not None and runner.loop is not None:
+            runner.loop.call_soon_threadsafe(self.__schedule)
+        elif self.__mainloop:
+            # tkinter hands calls from other threads over to its main loop.
+            self.__schedule()
+        # Otherwise `attach` schedules the drain once an event loop starts.
+
+    def __tick(self) -> None:
+        drained = 0
+        try:
+            drained = self.drain()
+        finally:
+            # Keep draining at the frame rate while updates flow, and stop
+            # once a frame finds nothing to apply.
+            with self.__lock:
+                self.__scheduled = not self.__stopped and bool(drained or self.__pending)
+                scheduled = self.__scheduled
+
+            self.__after_id = self.window.after(self.frame_interval, self.__tick) if scheduled else None
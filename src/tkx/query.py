@@ -0,0 +1,108 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+from tkx.selector import Compound, Selector, parse_selector
+
+if TYPE_CHECKING:
+    from tkx.core import TkxElement
+    from tkx.element import Element
+    from tkx.window import Window
+
+
+def select(root: Window, selectors: str) -> list[Element]:
+    """
+    Return the elements of `root` matching a selector list, in the order
+    they were created. See `Window.query_all`.
+    """
+    matches: set[Element] = set()
+
+    for text in selectors.split(","):
+        selector = parse_selector(text)
+        if selector is None:
+            raise ValueError(f"{text.strip()!r} is not a supported selector.")
+
+        matches.update(e for e in candidates(root, selector.subject) if matches_selector(root, e, selector))
+
+    return sorted(matches, key=lambda e: e.order)
+
+
+def candidates(root: Window, compound: Compound):
+    """
+    Return the smallest set of indexed elements which could match a
+    compound: the one with its id, or those with one of its classes or
+    its type, whichever set is smallest.
+    """
+    if compound.id is not None:
+        element = root.ids.get(compound.id)
+        return () if element is None else (element,)
+
+    sets = [root.cls.get(name, ()) for name in compound.classes]
+    if compound.type is not None:
+        sets.append(root.types.get(compound.type, ()))
+
+    if sets:
+        return min(sets, key=len)
+
+    # The universal selector matches every element.
+    return set().union(*root.types.values())
+
+
+def matches_compound(element: TkxElement, compound: Compound) -> bool:
+    # The window itself has neither an id nor classes.
+    if element.parent is None:
+        return compound.id is None and not compound.classes and compound.type in (None, "Window")
+
+    if compound.id is not None and element.id != compound.id:
+        return False
+
+    if compound.type is not None and type(element.widget).__name__ != compound.type:
+        return False
+
+    return not compound.classes or compound.classes.issubset(element.classes)
+
+
+def matches_selector(root: Window, element: Element, selector: Selector) -> bool:
+    if not matches_compound(element, selector.subject):
+        return False
+
+    if not selector.combinators:
+        return True
+
+    return match_ancestors(root, selector, len(selector.compounds) - 2, element.parent)
+
+
+def match_ancestors(root: Window, selector: Selector, index: int, parent: TkxElement | None) -> bool:
+    """
+    Return `True` if `selector.compounds[index]` (and every compound left
+    of it) can be matched walking up from `parent`.
+    """
+    compound = selector.compounds[index]
+    child = selector.combinators[index] == ">"
+
+    # An ancestor selected by id is unique, so check its position directly:
+    # walking up from `parent` to its depth must reach it.
+    if compound.id is not None and not child:
+        ancestor = root.ids.get(compound.id)
+        if ancestor is None or parent is None or ancestor.depth > parent.depth:
+            return False
+
+        node = parent
+        while node.depth > ancestor.depth:
+            node = node.parent
+        if node is not ancestor or not matches_compound(ancestor, compound):
+            return False
+
+        return index == 0 or match_ancestors(root, selector, index - 1, ancestor.parent)
+
+    node = parent
+    while node is not None:
+        if matches_compound(node, compound):
+            if index == 0 or match_ancestors(root, selector, index - 1, node.parent):
+                return True
+
+        # A child combinator only accepts the direct parent.
+        if child:
+            return False
+
+        node = node.parent
+
+    return False
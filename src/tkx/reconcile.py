@@ -0,0 +1,250 @@
+from __future__ import annotations
+from time import perf_counter
+from tkx import instrument
+from tkx.builder import widget_class
+from tkx.constants import CSS_PROPERTY_NAME_TRANSLATIONS, MISSING, STRUCTURAL_KEYS
+from typing import Any, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from tkx.core import TkxElement
+    from tkx.element import Element
+
+
+class RenderReport:
+    """
+    Counts the operations `TkxElement.render` issued. `operations` lists
+    each as `(operation, widget path)`, where operation is `"create"`,
+    `"configure"`, `"move"` or `"destroy"`.
+    """
+
+    def __init__(self):
+        self.created = 0
+        self.updated = 0
+        self.moved = 0
+        self.destroyed = 0
+        self.unchanged = 0
+        self.seconds = 0.0
+        self.operations: list[tuple[str, str]] = []
+
+    def record(self, operation: str, element: Element) -> None:
+        self.operations.append((operation, str(element.widget)))
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(created={self.created}, updated={self.updated}, moved={self.moved}, "
+            f"destroyed={self.destroyed}, unchanged={self.unchanged})"
+        )
+
+
+def render(parent: TkxElement, specs: list[dict[str, Any]]) -> RenderReport:
+    """Reconcile the children of `parent` with `specs`. See `TkxElement.render`."""
+    report = RenderReport()
+    start = perf_counter()
+
+    with parent.root.batch():
+        reconcile(parent, specs, report)
+
+    report.seconds = perf_counter() - start
+    if instrument.enabled:
+        instrument.record("render", parent.widget_name, start)
+
+    return report
+
+
+def reconcile(parent: TkxElement, specs, report: RenderReport) -> None:
+    """
+    Make the children of `parent` match `specs`, reusing the existing
+    child with the same key (or id), or else the next unkeyed child of
+    the same widget type, for each spec.
+    """
+    old = list(parent.elements or ())
+
+    keyed: dict[Any, Element] = {}
+    unkeyed: list[Element] = []
+    for element in old:
+        if element.key is not None:
+            keyed[element.key] = element
+        else:
+            unkeyed.append(element)
+
+    # Pair each spec with the element it updates, if any.
+    matches = []
+    seen = set()
+    position = 0
+    for spec in specs:
+        widget = widget_class(spec["widget"])
+        key = spec.get("key", spec.get("id"))
+
+        if key is not None:
+            if key in seen:
+                raise ValueError(f"Siblings share the key {key!r}.")
+            seen.add(key)
+            element = keyed.pop(key, None)
+
+        elif position < len(unkeyed):
+            element = unkeyed[position]
+            unkeyed[position] = None
+            position += 1
+
+        else:
+            element = None
+
+        # A different widget type cannot be reconfigured into this one.
+        if element is not None and type(element.widget) is not widget:
+            keyed[object()] = element
+            element = None
+
+        matches.append((spec, widget, key, element))
+
+    # Remove what is gone first, so that new elements may reuse its ids.
+    for element in (*keyed.values(), *unkeyed):
+        if element is not None:
+            report.record("destroy", element)
+            report.destroyed += 1
+            element.destroy()
+
+    index = {element: i for i, element in enumerate(old)}
+    result: list[Element] = []
+    created = set()
+    moved = set()
+    last = -1
+
+    for spec, widget, key, element in matches:
+        if element is None:
+            element = create(parent, spec, widget, key, report)
+            created.add(element)
+
+        else:
+            update(element, spec, report)
+
+            # Elements kept in their relative order stay where they are;
+            # any other is moved after its new predecessor.
+            i = index[element]
+            if i < last:
+                moved.add(element)
+            else:
+                last = i
+
+        result.append(element)
+
+    parent.elements = result
+    place(parent, index, result, created, moved, report)
+
+
+def create(parent: TkxElement, spec: dict[str, Any], widget, key, report: RenderReport) -> Element:
+    element = parent.add(widget, **options(spec))
+    element.key = key
+    element.spec = spec
+
+    report.record("create", element)
+    report.created += 1
+
+    children = spec.get("children")
+    if children:
+        reconcile(element, children, report)
+
+    return element
+
+
+def update(element: Element, spec: dict[str, Any], report: RenderReport) -> None:
+    previous = element.spec
+    if spec == previous:
+        report.unchanged += 1
+        return
+
+    before = options(previous) if previous is not None else {}
+    after = options(spec)
+
+    changed = {k: v for k, v in after.items() if before.get(k, MISSING) != v}
+    removed = before.keys() - after.keys()
+
+    if removed:
+        changed.update(defaults(element, removed))
+
+    if changed or removed:
+        report.record("configure", element)
+        report.updated += 1
+    else:
+        report.unchanged += 1
+
+    if changed:
+        element.configure(changed)
+
+    element.spec = spec
+
+    children = spec.get("children", ())
+    if previous is None or children != previous.get("children", ()):
+        reconcile(element, children, report)
+
+
+def defaults(element: Element, keys) -> dict[str, Any]:
+    """Return the values options no longer given by a spec fall back to."""
+    values = {}
+    resolved = element.resolved_style()
+
+    for k in keys:
+        name = CSS_PROPERTY_NAME_TRANSLATIONS.get(k, k)
+        if k == "id":
+            element.set_id(None)
+        elif k == "cl":
+            element.set_classes([])
+        elif k == "display":
+            values[k] = "block"
+        elif resolved.get(name) is not None:
+            values[k] = resolved[name]
+        elif name in element.widget.keys():
+            values[k] = element.widget.configure(name)[3]
+
+    return values
+
+
+def options(spec: dict[str, Any]) -> dict[str, Any]:
+    return {k: v for k, v in spec.items() if k not in STRUCTURAL_KEYS}
+
+
+def place(
+    parent: TkxElement,
+    index: dict[Element, int],
+    result: list[Element],
+    created: set,
+    moved: set,
+    report: RenderReport,
+) -> None:
+    """Position moved elements, and new ones created before existing ones, in the parent's layout."""
+    # New elements were added after every existing one, so those followed
+    # by an existing element are out of place too.
+    following = False
+    for element in reversed(result):
+        if element not in created:
+            following = True
+        elif following:
+            moved.add(element)
+
+    for element in moved - created:
+        report.record("move", element)
+        report.moved += 1
+
+    if parent.display == "block" and moved:
+        # Elements left in place keep their relative order, and so the
+        # last of them is packed after all of those.
+        last = next((e for e in reversed(result) if e not in moved), None)
+
+        # Place elements from the end, each before its successor, which is
+        # already where it belongs.
+        for i in range(len(result) - 1, -1, -1):
+            element = result[i]
+            if element not in moved:
+                continue
+
+            if i + 1 < len(result):
+                element.widget.pack_configure(before=result[i + 1].widget)
+            elif last is not None:
+                element.widget.pack_configure(after=last.widget)
+
+    elif parent.display == "flex":
+        # Columns follow the order of elements, counting from 1 as
+        # `add_element` does. New elements were given the next column at
+        # the time, which may be taken.
+        for i, element in enumerate(result):
+            if element in created or index[element] != i:
+                element.widget.grid(row=0, column=i + 1)
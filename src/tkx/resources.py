@@ -0,0 +1,235 @@
+from __future__ import annotations
+from collections import OrderedDict
+from tkx.constants import FONT_BYTES, FONT_PROPERTIES, IMAGE_PIXEL_BYTES, MATCH_URL, RESOURCE_PROPERTIES
+from typing import Any, Callable, Hashable, TYPE_CHECKING
+import tkinter as tk
+import tkinter.font as tkfont
+
+if TYPE_CHECKING:
+    from tkx.core import TkxElement
+
+
+class Entry:
+    __slots__ = ("value", "refs", "size")
+
+    def __init__(self, value: Any, size: int):
+        self.value = value
+        self.refs = 0
+        self.size = size
+
+
+class ResourceCache:
+    """
+    Fonts and images shared by every element using the same spec.
+
+    Entries are keyed by a normalized spec (eg. the family, size, weight
+    and slant of a font, or an image's absolute path) and counted each
+    time an element uses them. Entries no element uses any more are kept
+    for reuse until the estimated memory of all entries exceeds `budget`,
+    at which point the least recently used unused entries are released.
+
+    Parameters
+    - budget: `int` - Memory, in bytes, above which unused entries are evicted.
+    """
+
+    def __init__(self, budget: int = 16 * 1024 * 1024):
+        self.budget = budget
+        self.size = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self.__entries: OrderedDict[Hashable, Entry] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    @property
+    def hit_rate(self) -> float:
+        """Return the share of lookups served from the cache, from 0 to 1."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def acquire(self, key: Hashable, create: Callable[[], tuple[Any, int]]) -> Any:
+        """
+        Return the resource cached under `key` and count a new reference
+        to it. If there is none, `create` is called and must return the
+        resource and its size in bytes.
+        """
+        entry = self.__entries.get(key)
+        if entry is None:
+            self.misses += 1
+            value, size = create()
+            entry = self.__entries[key] = Entry(value, size)
+            self.size += size
+        else:
+            self.hits += 1
+            self.__entries.move_to_end(key)
+
+        entry.refs += 1
+        self.evict()
+        return entry.value
+
+    def apply(self, element: TkxElement, options: dict[str, Any], container: bool = False) -> dict[str, Any]:
+        """
+        Return `options` with font and image properties replaced by the
+        shared `font` and `image` they describe, given `element`'s style.
+        References are counted for `element` and those to the resources it
+        used before are released. Containers accept neither, so their
+        properties are only removed. `options` is never modified.
+        """
+        keys = RESOURCE_PROPERTIES & options.keys()
+        if not keys:
+            return options
+
+        options = {k: v for k, v in options.items() if k not in RESOURCE_PROPERTIES}
+        if container:
+            return options
+
+        root = element.root
+        style = element.style
+
+        if keys & FONT_PROPERTIES:
+            spec = font_spec(style)
+            key = None if spec is None else ("font", root, *spec)
+            options["font"] = self.__use(element, "font", key, lambda: create_font(root, spec))
+
+        if "background-image" in keys:
+            path = image_path(style.get("background-image"))
+            key = None if path is None else ("image", root, path)
+            options["image"] = self.__use(element, "image", key, lambda: load_image(root, path))
+
+        return options
+
+    def clear(self, root: TkxElement | None = None) -> None:
+        """Drop every entry, or those created for the window `root`, whether used or not."""
+        for key in list(self.__entries):
+            if root is None or key[1] is root:
+                self.size -= self.__entries.pop(key).size
+
+    def counters(self) -> dict[str, float]:
+        return {
+            "entries": len(self.__entries),
+            "size": self.size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hit_rate,
+        }
+
+    def evict(self) -> None:
+        """Release the least recently used unused entries until memory use is within the budget."""
+        if self.size <= self.budget:
+            return
+
+        for key, entry in list(self.__entries.items()):
+            if self.size <= self.budget:
+                break
+
+            if entry.refs == 0:
+                del self.__entries[key]
+                self.size -= entry.size
+                self.evictions += 1
+
+    def release(self, element: TkxElement) -> None:
+        """Release every resource `element` uses, eg. when it is destroyed."""
+        held = element.resources
+        if held:
+            element.resources = None
+            for key in held.values():
+                self.__release(key)
+
+    def __release(self, key: Hashable) -> None:
+        entry = self.__entries.get(key)
+        if entry is not None and entry.refs > 0:
+            entry.refs -= 1
+
+        if entry is not None and entry.refs == 0:
+            self.evict()
+
+    def __use(self, element: TkxElement, option: str, key: Hashable | None, create: Callable) -> Any:
+        """Make `element` use the resource under `key` for `option`, releasing the one it used before."""
+        held = element.resources or {}
+        previous = held.get(option)
+
+        if key is not None and key == previous:
+            return self.__entries[key].value
+
+        if key is None:
+            # Nothing is specified any more, so restore the widget's default.
+            value = "" if element.widget is None else element.widget.configure(option)[3]
+        else:
+            value = self.acquire(key, create)
+
+        if previous is not None:
+            self.__release(previous)
+
+        if key is None:
+            held.pop(option, None)
+        else:
+            held[option] = key
+
+        element.resources = held or None
+        return value
+
+
+# Shared by every window of the process.
+cache = ResourceCache()
+
+
+def font_spec(style: dict[str, str]) -> tuple[str | None, int | None, str, str] | None:
+    """
+    Return the normalized family, size, weight and slant given by the
+    `font-*` properties of a style, or `None` if it has none. Sizes in
+    `px` are returned as negative numbers, as Tk expects for pixels.
+    """
+    family = style.get("font-family")
+    size = style.get("font-size")
+    weight = style.get("font-weight")
+    slant = style.get("font-style")
+
+    if family is None and size is None and weight is None and slant is None:
+        return None
+
+    if family is not None:
+        # Tk picks the closest match itself, so only the first family is used.
+        family = family.split(",")[0].strip().strip("\"'").lower() or None
+
+    if size is not None:
+        size = str(size).strip()
+        try:
+            size = -round(float(size[:-2])) if size.endswith("px") else round(float(size.removesuffix("pt")))
+        except ValueError:
+            size = None
+
+    weight = str(weight).strip()
+    weight = "bold" if weight in ("bold", "bolder") or (weight.isdigit() and int(weight) >= 600) else "normal"
+    slant = "italic" if slant in ("italic", "oblique") else "roman"
+
+    return family, size, weight, slant
+
+
+def create_font(root: TkxElement, spec: tuple[str | None, int | None, str, str]) -> tuple[tkfont.Font, int]:
+    family, size, weight, slant = spec
+    options = {"weight": weight, "slant": slant}
+    if family is not None:
+        options["family"] = family
+    if size is not None:
+        options["size"] = size
+
+    return tkfont.Font(root=root, **options), FONT_BYTES
+
+
+def image_path(value: str | None) -> str | None:
+    """Return the path given by a `background-image` value, such as `url("icon.png")`, or `None`."""
+    if value is None or value.strip() == "none":
+        return None
+
+    match = MATCH_URL.fullmatch(value.strip())
+    return match[1] if match is not None else value.strip()
+
+
+def load_image(root: TkxElement, path: str) -> tuple[tk.PhotoImage, int]:
+    image = tk.PhotoImage(master=root, file=path)
+    return image, image.width() * image.height() * IMAGE_PIXEL_BYTES
@@ -0,0 +1,248 @@
+from __future__ import annotations
+from typing import Iterable, NamedTuple
+from tkx.constants import MATCH_COMBINATOR, MATCH_COMPOUND, MATCH_COMPOUND_PART, NO_CLASSES
+
+
+class Descriptor(NamedTuple):
+    """What selectors can match on an element: its widget type, id and classes."""
+
+    type: str
+    id: str | None
+    classes: frozenset[str]
+
+
+def describe(widget_name: str, id: str | None = None, cl: str | None = None) -> Descriptor:
+    return Descriptor(widget_name, id, frozenset(cl.split()) if cl else NO_CLASSES)
+
+
+class Compound(NamedTuple):
+    """A selector without combinators, eg. `Button.primary`."""
+
+    type: str | None
+    id: str | None
+    classes: frozenset[str]
+
+    def matches(self, element: Descriptor) -> bool:
+        return (
+            (self.type is None or self.type == element.type)
+            and (self.id is None or self.id == element.id)
+            and self.classes <= element.classes
+        )
+
+
+class Selector(NamedTuple):
+    """
+    A parsed selector. `compounds` are ordered left to right, and
+    `combinators[i]` (`">"` or `" "`) joins `compounds[i]` to
+    `compounds[i + 1]`. The last compound is the selector's subject.
+    """
+
+    text: str
+    compounds: tuple[Compound, ...]
+    combinators: tuple[str, ...]
+    specificity: tuple[int, int, int]
+
+    @property
+    def subject(self) -> Compound:
+        return self.compounds[-1]
+
+    def matches(self, element: Descriptor, ancestry: tuple[Descriptor, ...] = ()) -> bool:
+        """
+        Return `True` if this selector matches an element, given its
+        ancestors ordered from its parent outwards.
+        """
+        if not self.subject.matches(element):
+            return False
+
+        if not self.combinators:
+            return True
+
+        return self.__match_ancestors(len(self.compounds) - 2, ancestry, 0)
+
+    def __match_ancestors(self, index: int, ancestry: tuple[Descriptor, ...], start: int) -> bool:
+        compound = self.compounds[index]
+
+        # A child combinator only accepts the nearest remaining ancestor,
+        # a descendant combinator any of them.
+        end = start + 1 if self.combinators[index] == ">" else len(ancestry)
+        for i in range(start, min(end, len(ancestry))):
+            if compound.matches(ancestry[i]) and (index == 0 or self.__match_ancestors(index - 1, ancestry, i + 1)):
+                return True
+
+        return False
+
+
+def parse_selector(text: str) -> Selector | None:
+    """
+    Parse a selector made of types, `#ids`, `.classes`, `*` and the
+    descendant (` `) and child (`>`) combinators. Returns `None` for
+    selectors using anything else, such as `:root`.
+    """
+    parts = MATCH_COMBINATOR.split(text.strip())
+
+    compounds = []
+    for part in parts[::2]:
+        match = MATCH_COMPOUND.fullmatch(part)
+        if not part or match is None:
+            return None
+
+        ids = []
+        classes = []
+        for prefix, name in MATCH_COMPOUND_PART.findall(match[2]):
+            (ids if prefix == "#" else classes).append(name)
+
+        if len(set(ids)) > 1:
+            return None
+
+        type = match[1] if match[1] != "*" else None
+        compounds.append(Compound(type, ids[0] if ids else None, frozenset(classes)))
+
+    combinators = tuple(c or " " for c in parts[1::2])
+    specificity = (
+        sum(c.id is not None for c in compounds),
+        sum(len(c.classes) for c in compounds),
+        sum(c.type is not None for c in compounds),
+    )
+
+    return Selector(text, tuple(compounds), combinators, specificity)
+
+
+def subject_index(selector_text: str) -> tuple[str, str | None]:
+    """
+    Return which index of a `Window` holds the elements a selector could
+    apply to, and the key in it: `("ids", id)`, `("cls", class)`,
+    `("types", type)`, `("all", None)`, or `("none", None)` if the selector
+    cannot match elements.
+    """
+    selector = parse_selector(selector_text)
+    if selector is None:
+        return "none", None
+
+    subject = selector.subject
+    if subject.id is not None:
+        return "ids", subject.id
+    if subject.classes:
+        return "cls", min(subject.classes)
+    if subject.type is not None:
+        return "types", subject.type
+    return "all", None
+
+
+class Rule(NamedTuple):
+    selector: Selector
+    order: int
+    declarations: dict[str, str]
+
+    @property
+    def key(self) -> tuple[tuple[int, int, int], int]:
+        """Sort key applying rules in specificity, then source, order."""
+        return self.selector.specificity, self.order
+
+
+class RuleSet:
+    """
+    The rules of a stylesheet indexed for matching, the way browsers do:
+    each rule is filed in one bucket under the id, a class or the type of
+    its subject, so only rules which could apply to an element are tested.
+
+    Rules whose selectors contain combinators depend on an element's
+    ancestors and are kept apart, so callers can skip describing
+    ancestors when a stylesheet has none.
+
+    Rules keep the position of their block in the source, as given by
+    `parse_blocks`, so a selector repeated in later blocks weighs as much
+    as each of them. Selectors listed in the same block share its position.
+    """
+
+    def __init__(self, blocks: list[tuple[tuple[str, ...], dict[str, str]]]):
+        self.rules: list[Rule] = []
+        self.contextual = False
+
+        self.__ids: dict[str, list[Rule]] = {}
+        self.__classes: dict[str, list[Rule]] = {}
+        self.__types: dict[str, list[Rule]] = {}
+        self.__universal: list[Rule] = []
+
+        # Rules mentioning each class in their subject or in the compounds
+        # matching ancestors, for restyling after class changes.
+        self.__subject_classes: dict[str, list[Rule]] = {}
+        self.__context_classes: dict[str, list[Rule]] = {}
+
+        for order, (names, declarations) in enumerate(blocks):
+            for selector_text in names:
+                self.__add(selector_text, order, declarations)
+
+    def __add(self, selector_text: str, order: int, declarations: dict[str, str]) -> None:
+        selector = parse_selector(selector_text)
+        if selector is None:
+            return
+
+        rule = Rule(selector, order, declarations)
+        self.rules.append(rule)
+        self.contextual = self.contextual or bool(selector.combinators)
+
+        for name in selector.subject.classes:
+            self.__subject_classes.setdefault(name, []).append(rule)
+        for name in set().union(*(c.classes for c in selector.compounds[:-1])):
+            self.__context_classes.setdefault(name, []).append(rule)
+
+        subject = selector.subject
+        if subject.id is not None:
+            self.__ids.setdefault(subject.id, []).append(rule)
+        elif subject.classes:
+            self.__classes.setdefault(min(subject.classes), []).append(rule)
+        elif subject.type is not None:
+            self.__types.setdefault(subject.type, []).append(rule)
+        else:
+            self.__universal.append(rule)
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+    def candidates(self, element: Descriptor) -> list[Rule]:
+        """Return the rules filed under any of an element's keys, which may match it."""
+        candidates = list(self.__universal)
+        candidates += self.__types.get(element.type, ())
+        if element.id is not None:
+            candidates += self.__ids.get(element.id, ())
+        for name in element.classes:
+            candidates += self.__classes.get(name, ())
+        return candidates
+
+    def match(self, element: Descriptor, ancestry: tuple[Descriptor, ...] = ()) -> list[Rule]:
+        """Return the rules matching an element in the order they apply."""
+        rules = [r for r in self.candidates(element) if r.selector.matches(element, ancestry)]
+        rules.sort(key=Rule.key.fget)
+        return rules
+
+    def match_context(self, element: Descriptor, ancestry: tuple[Descriptor, ...]) -> tuple[int, ...]:
+        """
+        Return the source order of every rule with combinators which
+        matches an element. Together with the element's own descriptor,
+        this determines which rules apply to it.
+        """
+        if not self.contextual:
+            return ()
+
+        return tuple(
+            sorted(
+                r.order
+                for r in self.candidates(element)
+                if r.selector.combinators and r.selector.matches(element, ancestry)
+            )
+        )
+
+    def properties(self, classes: Iterable[str], subject: bool = True) -> set[str]:
+        """
+        Return the names of every property set by rules which mention the
+        given classes, either in their subject or (with `subject=False`)
+        in the compounds matching an element's ancestors.
+        """
+        index = self.__subject_classes if subject else self.__context_classes
+        properties = set()
+
+        for name in classes:
+            for rule in index.get(name, ()):
+                properties.update(rule.declarations)
+
+        return properties
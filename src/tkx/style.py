@@ -0,0 +1,202 @@
+from __future__ import annotations
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from tkx.constants import DELETED, MISSING
+from tkx.layout import relative_values
+from typing import Any, Iterator
+from weakref import WeakValueDictionary
+
+
+class BaseStyle(dict):
+    """A style shared by many elements. Must be treated as read-only."""
+
+    __slots__ = ("__weakref__",)
+
+
+EMPTY = BaseStyle()
+
+
+class Style(MutableMapping):
+    """
+    The style of an element: a base style shared with every element the
+    stylesheet styles alike, and a small layer of the values set on this
+    element alone. Reading falls through to the base; writing only ever
+    changes the overrides, which are created on the first write. A value
+    equal to the base's is not kept as an override.
+
+    Parameters
+    - base: `dict[str, Any]` - Shared, read-only style.
+    - overrides: `dict[str, Any] | None` - Values which differ from `base`. Owned by this style.
+    """
+
+    __slots__ = ("base", "overrides")
+
+    def __init__(self, base: dict[str, Any] = EMPTY, overrides: dict[str, Any] | None = None):
+        self.base = base
+        self.overrides = overrides or None
+
+    def __contains__(self, key: object) -> bool:
+        overrides = self.overrides
+        if overrides is not None and key in overrides:
+            return overrides[key] is not DELETED
+        return key in self.base
+
+    def __delitem__(self, key: str) -> None:
+        if key not in self:
+            raise KeyError(key)
+
+        if key in self.base:
+            self.__overrides()[key] = DELETED
+        else:
+            self.__drop(key)
+
+    def __getitem__(self, key: str) -> Any:
+        overrides = self.overrides
+        if overrides is not None and key in overrides:
+            value = overrides[key]
+            if value is DELETED:
+                raise KeyError(key)
+            return value
+        return self.base[key]
+
+    def __iter__(self) -> Iterator[str]:
+        overrides = self.overrides
+        if overrides is None:
+            return iter(self.base)
+        return iter(self.flatten())
+
+    def __len__(self) -> int:
+        if self.overrides is None:
+            return len(self.base)
+        return len(self.flatten())
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.flatten()!r})"
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        base = self.base.get(key, MISSING)
+        if base is not MISSING and base == value:
+            self.__drop(key)
+        else:
+            self.__overrides()[key] = value
+
+    def copy(self) -> Style:
+        """Return a style sharing this one's base, with a copy of its overrides."""
+        return Style(self.base, None if self.overrides is None else dict(self.overrides))
+
+    def flatten(self) -> dict[str, Any]:
+        """Return every value of this style in a new dictionary."""
+        overrides = self.overrides
+        if overrides is None:
+            return dict(self.base)
+
+        style = {k: v for k, v in self.base.items() if k not in overrides}
+        style.update((k, v) for k, v in overrides.items() if v is not DELETED)
+        return style
+
+    def get(self, key: str, default: Any = None) -> Any:
+        overrides = self.overrides
+        if overrides is not None and key in overrides:
+            value = overrides[key]
+            return default if value is DELETED else value
+        return self.base.get(key, default)
+
+    def items(self):
+        if self.overrides is None:
+            return self.base.items()
+        return self.flatten().items()
+
+    def __drop(self, key: str) -> None:
+        overrides = self.overrides
+        if overrides is not None:
+            overrides.pop(key, None)
+            if not overrides:
+                self.overrides = None
+
+    def __overrides(self) -> dict[str, Any]:
+        if self.overrides is None:
+            self.overrides = {}
+        return self.overrides
+
+
+class StyleTable:
+    """
+    Interns the base styles of a window's elements, so that elements the
+    stylesheet styles alike share one read-only dictionary however many
+    of them there are. Bases no element uses any more are dropped once
+    the stylesheet changes.
+
+    Parsed bases are also kept per resolved style (see
+    `Window.resolved_style`), so that creating an element parses the
+    stylesheet's values only once per combination of selectors. At most
+    `max_parsed` of them are kept, least recently used first out.
+
+    Parameters
+    - max_parsed: `int` - Most parsed bases kept.
+    """
+
+    def __init__(self, max_parsed: int = 4096):
+        self.max_parsed = max_parsed
+
+        # Each call to `base` is either a hit or a miss; misses whose parsed
+        # style equals a base already in use are also counted as shared.
+        self.hits = 0
+        self.misses = 0
+        self.shared = 0
+
+        self.__bases: WeakValueDictionary[frozenset, BaseStyle] = WeakValueDictionary()
+        self.__parsed: OrderedDict[int, tuple[dict[str, str], BaseStyle]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.__bases)
+
+    def base(self, resolved: dict[str, str], parse) -> BaseStyle:
+        """
+        Return the interned base style parsed from the `resolved` style
+        by `parse`, which is called with a copy of `resolved` the first
+        time it is seen. Styles with percentages depend on their parent
+        and are parsed every time.
+        """
+        parsed = self.__parsed
+        entry = parsed.get(id(resolved))
+        if entry is not None and entry[0] is resolved:
+            self.hits += 1
+            parsed.move_to_end(id(resolved))
+            return entry[1]
+
+        self.misses += 1
+        base = self.intern(parse(dict(resolved)))
+        if not relative_values(resolved):
+            parsed[id(resolved)] = (resolved, base)
+            if len(parsed) > self.max_parsed:
+                parsed.popitem(last=False)
+
+        return base
+
+    def clear(self) -> None:
+        """Forget parsed bases, eg. when the stylesheet changes. Interned bases stay shared."""
+        self.__parsed.clear()
+
+    def counters(self) -> dict[str, int]:
+        """
+        Return the number of bases in use, how many lookups found a parsed
+        base (hits) or parsed one (misses), and how many of those parsed
+        bases were already in use (shared).
+        """
+        return {"bases": len(self.__bases), "hits": self.hits, "misses": self.misses, "shared": self.shared}
+
+    def intern(self, style: dict[str, Any]) -> BaseStyle:
+        """Return the shared base style equal to `style`."""
+        try:
+            key = frozenset(style.items())
+        except TypeError:
+            # Unhashable values (eg. lists) cannot be looked up, so are not shared.
+            return BaseStyle(style)
+
+        base = self.__bases.get(key)
+        if base is None:
+            base = self.__bases[key] = BaseStyle(style)
+        else:
+            self.shared += 1
+
+        return base
@@ -1,16 +1,17 @@
-from pathlib import Path
-from tkx.constants import (
-    CSS_PROPERTY_NAME_TRANSLATIONS,
-    MATCH_BLOCK,
-    MATCH_BRACES,
-    MATCH_COMMENT,
-    MATCH_DELIMITER_SPACE,
-    MATCH_SELECTOR,
-    MATCH_SPACE,
-    MATCH_VAR_NAME,
-)
+from __future__ import annotations
+from tkx import instrument
+from tkx.constants import MATCH_URL, MATCH_VAR_CALL
+from tkx.error import CircularVariableError
+from tkx.parser import merge_blocks, parse_blocks
+from tkx.selector import RuleSet
+from time import perf_counter
+from typing import Any, Callable, TYPE_CHECKING
+import os
 import re
 
+if TYPE_CHECKING:
+    from tkx.cache import StylesheetCache
+
 
 class Stylesheet:
     """
@@ -19,27 +20,86 @@ class Stylesheet:
     Simply creating this class with a valid CSS filepath
     will make it available for use in your code. Reading
     and parsing happens upon instantiation.
-    """
 
-    def __init__(self, source_path: str):
-        self.styles = dict()
+    Passing a `StylesheetCache` skips parsing entirely when the
+    file has not changed since it was last compiled.
+    """
 
-        if not Path(source_path).is_file():
+    def __init__(self, source_path: str, cache: StylesheetCache | None = None):
+        if not os.path.isfile(source_path):
             raise ValueError("Stylesheet expects a valid file path.")
 
-        # Minify and store the provided CSS.
-        self.source_min = self.minify_css(source_path)
+        self.source_path = source_path
+        self.cache = cache
+
+        # Incremented every time self.blocks is replaced.
+        self.version = 0
+
+        # Formatted values, keyed by the raw value passed to self.var.
+        self.__formatted: dict[str, str | None] = {}
+
+        # Rule blocks in source order, and the properties of each selector
+        # merged from them.
+        self.blocks: list[tuple[tuple[str, ...], dict[str, str]]] = self.read()
+        self.styles: dict[str, dict[str, str]] = merge_blocks(self.blocks)
+
+        # Rules indexed for matching, see self.rules.
+        self.__rules: RuleSet | None = None
+
+    def compile(self, source: str) -> list[tuple[tuple[str, ...], dict[str, str]]]:
+        """
+        Parse CSS source code and return its rule blocks (see
+        `parse_blocks`) with every var() call replaced by its value.
+        Variables in `:root` are resolved first and may refer to one another.
+
+        Properties whose variables cannot be resolved (and which have no
+        fallback) are left out. Raises `CircularVariableError` if a
+        variable depends on itself.
+        """
+        blocks = parse_blocks(source, self.source_path)
+        root: dict[str, str] = {}
+        for names, block in blocks:
+            if ":root" in names:
+                root.update(block)
+
+        variables = resolve_variables(root)
+        directory = os.path.dirname(os.path.abspath(self.source_path))
+
+        for names, block in blocks:
+            if ":root" in names:
+                resolved = {k: variables[k] for k in block if k in variables}
+                block.clear()
+                block.update(resolved)
+                continue
+
+            for k, v in list(block.items()):
+                if "var(" not in v:
+                    continue
+
+                value = substitute(v, variables.get)
+                if value is None:
+                    del block[k]
+                else:
+                    block[k] = value
+
+            # Images are found relative to the stylesheet, like in browsers.
+            if "background-image" in block:
+                block["background-image"] = resolve_urls(block["background-image"], directory)
 
-        # Parse and store the minified CSS into self.styles.
-        for selector, block in zip(self.get_selectors(), self.get_blocks()):
-            self.styles[selector] = self.parse_block(block)
+        return blocks
 
-    def format_properties(self, properties: dict[str, str]) -> dict[str, str]:
+    def diff(self, styles: dict[str, dict[str, str]]) -> set[str]:
+        """Return the selectors whose rules differ between this stylesheet and `styles`."""
+        return {k for k in self.styles.keys() | styles.keys() if self.styles.get(k) != styles.get(k)}
+
+    def format_properties(self, properties: dict[str, Any]) -> dict[str, Any]:
         """
         Return the same dictionary with CSS variables replace with their
-        actual values.
+        actual values. Values which are not strings (such as commands)
+        are left untouched.
         """
-        return {k: self.var(str(v)) for k, v in properties.items()}
+        var = self.var
+        return {k: var(v) if type(v) is str else v for k, v in properties.items()}
 
     def get(self, name: str) -> str | None:
         """
@@ -48,71 +108,171 @@ class Stylesheet:
         """
         return self.styles.get(name)
 
-    def get_blocks(self) -> tuple[str]:
-        """Return a list of blocks found in the stylesheet."""
-        # Split along selectors and remove empty strings.
-        result = filter(None, re.split(MATCH_SELECTOR, self.source_min))
+    def read(self) -> list[tuple[tuple[str, ...], dict[str, str]]]:
+        """
+        Read and compile the source file into rule blocks, going through
+        `self.cache` if one was provided. Does not change this stylesheet.
+        """
+        start = perf_counter() if instrument.enabled else None
 
-        # Remove any leftover curly braces and return the result.
-        return (*map(lambda i: re.sub(MATCH_BRACES, "", i), result),)
+        if self.cache is not None:
+            blocks = self.cache.load(self.source_path, self.compile)
 
-    def get_property(self, widget_name: str, property: str) -> str | None:
-        """Return the value of a property given a selector and property name."""
-        if self.styles.get(widget_name) is None:
-            print(f"get_property found no CSS style for {widget_name}.")
-            return None
-        return self.styles[widget_name].get(property)
-
-    def get_selectors(self) -> tuple[str]:
-        """Return a list of selectors found in the stylesheet."""
-        # Remove empty strings and return the result.
-        return (*filter(None, re.split(MATCH_BLOCK, self.source_min)),)
-
-    def minify_css(self, source_path: str) -> str:
-        """Remove whitespace and comments from stylesheet."""
-        with open(source_path) as f:
-            lines = map(str.strip, f.readlines())
-
-        # For non-property lines, remove all spaces.
-        # For property lines, remove spaces following
-        # a colon or a comma.
-        result = map(
-            lambda line: re.sub(MATCH_DELIMITER_SPACE, "", line)
-            if line.endswith(";")
-            else re.sub(MATCH_SPACE, "", line),
-            lines,
-        )
-
-        return re.sub(MATCH_COMMENT, "", "".join(result))
-
-    def parse_block(self, block: str) -> dict[str, str]:
-        """Return a minified CSS block as a dictionary."""
-        results = {
-            property[0]: property[1]
-            for property in map(
-                lambda i: (*i.split(":"),),
-                filter(None, block.split(";")),
-            )
-        }
-
-        # Translate from CSS property names.
-        translated_results = {}
-        for k in results.keys():
-            if k in CSS_PROPERTY_NAME_TRANSLATIONS.keys():
-                translated_results[CSS_PROPERTY_NAME_TRANSLATIONS[k]] = results[k]
-
-            else:
-                translated_results[k] = results[k]
-
-        return dict(
-            filter(lambda k: results.get(k) is None, translated_results.items())
-        )
+        else:
+            with open(self.source_path) as f:
+                blocks = self.compile(f.read())
+
+        if start is not None:
+            instrument.record("parse", str(self.source_path), start)
+
+        return blocks
+
+    def reload(self) -> set[str]:
+        """
+        Read the source file again and replace this stylesheet's styles.
+        Returns the selectors whose rules changed.
+        """
+        blocks = self.read()
+        changed = self.diff(merge_blocks(blocks))
+        self.replace(blocks)
+        return changed
+
+    def replace(self, blocks: list[tuple[tuple[str, ...], dict[str, str]]]) -> None:
+        """Replace this stylesheet's compiled rule blocks, as returned by `read`."""
+        self.blocks = blocks
+        self.styles = merge_blocks(blocks)
+        self.__rules = None
+        self.version += 1
+        self.__formatted.clear()
+
+    @property
+    def rules(self) -> RuleSet:
+        """
+        Return the rules of this stylesheet indexed for matching. The index
+        is built the first time it is needed after `self.blocks` changes, so
+        loading a stylesheet from the cache does not pay for it.
+        """
+        if self.__rules is None:
+            self.__rules = RuleSet(self.blocks)
+        return self.__rules
+
+    @property
+    def variables(self) -> dict[str, str]:
+        """Return the resolved `:root` variables of this stylesheet."""
+        return self.styles.get(":root", {})
 
     def var(self, value: str) -> str | None:
-        """Return the value associated with a given variable name."""
-        name = re.findall(MATCH_VAR_NAME, value)
+        """
+        Return `value` with any var() calls replaced by their values, or
+        `None` if a variable is undefined and has no fallback. Results are
+        memoized, so repeated values cost a single dictionary lookup.
+        """
+        if "var(" not in value:
+            return value
 
-        if name:
-            return self.get_property(":root", *name)
+        try:
+            return self.__formatted[value]
+        except KeyError:
+            result = self.__formatted[value] = substitute(value, self.variables.get)
+            return result
 
+
+def resolve_variables(variables: dict[str, str]) -> dict[str, str]:
+    """
+    Return a new dictionary of CSS variables with var() references to
+    other variables replaced by their values. Variables which cannot be
+    resolved are left out.
+    """
+    resolved: dict[str, str | None] = {}
+    stack: list[str] = []
+
+    def visit(name: str) -> str | None:
+        if name in resolved:
+            return resolved[name]
+
+        if name in stack:
+            cycle = " -> ".join(stack[stack.index(name) :] + [name])
+            raise CircularVariableError(f"CSS variables depend on themselves: {cycle}")
+
+        value = variables.get(name)
+        if value is None:
+            return None
+
+        stack.append(name)
+        resolved[name] = substitute(value, visit) if "var(" in value else value
+        stack.pop()
+
+        return resolved[name]
+
+    for name in variables:
+        visit(name)
+
+    return {k: v for k, v in resolved.items() if v is not None}
+
+
+def resolve_urls(value: str, directory: str) -> str:
+    """Return `value` with the relative paths of its url() calls made absolute from `directory`."""
+
+    def resolve(match: re.Match) -> str:
+        path = match[1]
+        if not path or os.path.isabs(path) or "://" in path:
+            return match[0]
+        return f'url("{os.path.join(directory, path)}")'
+
+    return MATCH_URL.sub(resolve, value)
+
+
+def closing_parenthesis(value: str, start: int) -> int:
+    """Return the index of the parenthesis closing the one at `start`, or -1 if it is never closed."""
+    depth = 0
+    for i in range(start, len(value)):
+        if value[i] == "(":
+            depth += 1
+        elif value[i] == ")":
+            depth -= 1
+            if depth == 0:
+                return i
+
+    return -1
+
+
+def substitute(value: str, lookup: Callable[[str], str | None]) -> str | None:
+    """
+    Replace every var() call in `value` using `lookup`, falling back to a
+    call's default where one is given. Defaults may contain parentheses
+    and var() calls of their own, such as `var(--a, rgb(0, 0, 0))` or
+    `var(--a, var(--b))`, which are only resolved if they are used.
+
+    Returns `None` if any variable cannot be resolved, or a call is malformed.
+    """
+    parts = []
+    position = 0
+
+    while True:
+        start = value.find("var(", position)
+        if start == -1:
+            break
+
+        end = closing_parenthesis(value, start + 3)
+        match = MATCH_VAR_CALL.fullmatch(value, start, end + 1) if end != -1 else None
+        if match is None:
+            return None
+
+        result = lookup(match[1])
+        if result is None:
+            if match[2] is None:
+                return None
+
+            result = substitute(match[2], lookup)
+            if result is None:
+                return None
+
+        parts.append(value[position:start])
+        parts.append(result)
+        position = end + 1
+
+    if not parts:
         return value
+
+    parts.append(value[position:])
+    return "".join(parts)
@@ -0,0 +1,386 @@
+from __future__ import annotations
+from collections import OrderedDict
+from functools import lru_cache
+from time import perf_counter
+from tkx import instrument
+from tkx.constants import (
+    ANIMATED_COLOR_OPTIONS,
+    ANIMATED_LENGTH_OPTIONS,
+    CSS_PROPERTY_NAME_TRANSLATIONS,
+    MATCH_CUBIC_BEZIER,
+    MATCH_NUMBER,
+    MATCH_TIME,
+    MATCH_TRANSITION_SEPARATOR,
+    TIMING_FUNCTIONS,
+)
+from typing import Any, Callable, NamedTuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from tkx.core import TkxElement
+    from tkx.window import Window
+
+
+def linear(x: float) -> float:
+    """The CSS timing function `linear`."""
+    return x
+
+
+@lru_cache(maxsize=64)
+def cubic_bezier(x1: float, y1: float, x2: float, y2: float) -> Callable[[float], float]:
+    """Return the CSS timing function `cubic-bezier(x1, y1, x2, y2)`."""
+    # The curve is the line y = x when both its control points are on it.
+    if x1 == y1 and x2 == y2:
+        return linear
+
+    def bezier(a: float, b: float, t: float) -> float:
+        return 3 * a * (1 - t) ** 2 * t + 3 * b * (1 - t) * t**2 + t**3
+
+    def timing(x: float) -> float:
+        # Find the curve's parameter for x by bisection, which is plenty
+        # precise for a value drawn once per frame.
+        low, high = 0.0, 1.0
+        for _ in range(16):
+            t = (low + high) / 2
+            if bezier(x1, x2, t) < x:
+                low = t
+            else:
+                high = t
+
+        return bezier(y1, y2, (low + high) / 2)
+
+    return timing
+
+
+class Transition(NamedTuple):
+    """How changes to one property are animated, in seconds."""
+
+    property: str
+    duration: float
+    timing: Callable[[float], float]
+    delay: float
+
+
+@lru_cache(maxsize=256)
+def parse_transition(value: str) -> dict[str, Transition]:
+    """
+    Parse the value of a CSS `transition` property, such as
+    `"background-color 200ms ease-in, width .3s"`, into the transition of
+    each property, keyed by its tkinter name (or `"all"`). Parts which
+    cannot be parsed are left out.
+
+    Results are cached and shared, so they must not be modified.
+    """
+    transitions = {}
+
+    for part in MATCH_TRANSITION_SEPARATOR.split(value):
+        words = MATCH_CUBIC_BEZIER.sub(lambda m: m[0].replace(" ", ""), part.strip()).split()
+        if not words:
+            continue
+
+        name = CSS_PROPERTY_NAME_TRANSLATIONS.get(words[0], words[0])
+        times = []
+        timing = cubic_bezier(*TIMING_FUNCTIONS["ease"])
+
+        for word in words[1:]:
+            time = MATCH_TIME.fullmatch(word)
+            bezier = MATCH_CUBIC_BEZIER.fullmatch(word)
+
+            if time is not None:
+                times.append(float(time[1]) / (1000 if time[2] == "ms" else 1))
+
+            elif bezier is not None:
+                try:
+                    timing = cubic_bezier(*(float(n) for n in bezier[1].split(",")))
+                except (TypeError, ValueError):
+                    break
+
+            elif word in TIMING_FUNCTIONS:
+                timing = cubic_bezier(*TIMING_FUNCTIONS[word])
+
+            else:
+                break
+
+        else:
+            if times:
+                transitions[name] = Transition(name, times[0], timing, times[1] if len(times) > 1 else 0.0)
+
+    return transitions
+
+
+def parse_number(value: Any) -> float | None:
+    """Return a length such as `12`, `"12"` or `"12px"` as a number, or `None`."""
+    if type(value) in (int, float):
+        return value
+
+    if type(value) is str and MATCH_NUMBER.fullmatch(value):
+        return float(value.removesuffix("px"))
+
+    return None
+
+
+class Animation:
+    """One property of one element moving between two values."""
+
+    __slots__ = ("start", "end", "value", "began", "duration", "delay", "timing", "color")
+
+    def __init__(self, start, end, value: Any, began: float, transition: Transition, color: bool):
+        # Start and end points: numbers, or (red, green, blue) for colors.
+        self.start = start
+        self.end = end
+
+        # The value the property is given once the animation ends.
+        self.value = value
+
+        self.began = began
+        self.duration = transition.duration
+        self.delay = transition.delay
+        self.timing = transition.timing
+        self.color = color
+
+    def at(self, now: float):
+        """Return the point reached at time `now`, or `None` if the animation has not begun."""
+        elapsed = now - self.began - self.delay
+        if elapsed < 0:
+            return None
+
+        amount = self.timing(min(elapsed / self.duration, 1.0))
+        if self.color:
+            return tuple(round(a + (b - a) * amount) for a, b in zip(self.start, self.end))
+
+        return self.start + (self.end - self.start) * amount
+
+    def finished(self, now: float) -> bool:
+        return now - self.began - self.delay >= self.duration
+
+
+class Animator:
+    """
+    Runs every property transition of a `Window` from one shared frame
+    scheduler.
+
+    Configuring a property named by an element's `transition` style
+    starts an animation from the value currently shown to the new one.
+    Colors are parsed into RGB when an animation starts, so frames only
+    interpolate numbers. Each frame advances all running animations
+    together and configures every animated widget once, in one batch.
+    Frames are only scheduled while animations are running.
+
+    Parameters
+    - window: `Window` - The window whose elements are animated.
+    - max_fps: `int` - Most frames drawn per second.
+    - max_colors: `int` - Most parsed colors kept, the least recently used being dropped first.
+    """
+
+    def __init__(self, window: Window, max_fps: int = 60, max_colors: int = 256):
+        self.window = window
+        self.max_fps = max_fps
+        self.max_colors = max_colors
+
+        # Frame statistics. Frames are dropped when one starts later than
+        # a whole frame interval after it was due.
+        self.frames = 0
+        self.dropped = 0
+        self.frame_time = 0.0
+        self.max_frame_time = 0.0
+        self.started = 0
+
+        self.__active: dict[TkxElement, dict[str, Animation]] = {}
+        self.__colors: OrderedDict[str, tuple[int, int, int] | None] = OrderedDict()
+        self.__after_id: str | None = None
+        self.__due = 0.0
+
+    @property
+    def active(self) -> int:
+        """Return the number of properties being animated."""
+        return sum(len(animations) for animations in self.__active.values())
+
+    @property
+    def frame_interval(self) -> float:
+        """Return the time between frames in seconds."""
+        return 1 / self.max_fps
+
+    def cancel(self, element: TkxElement, keys=None) -> None:
+        """Stop animating the given properties of `element`, or all of them, where they are."""
+        animations = self.__active.get(element)
+        if animations is None:
+            return
+
+        if keys is None:
+            animations.clear()
+        else:
+            for k in keys:
+                animations.pop(k, None)
+
+        if not animations:
+            del self.__active[element]
+
+    def color(self, value: Any) -> tuple[int, int, int] | None:
+        """Return a color as (red, green, blue) from 0 to 255, or `None` if `value` is not a color."""
+        if type(value) is not str:
+            return None
+
+        rgb = self.__colors.get(value, False)
+        if rgb is not False:
+            self.__colors.move_to_end(value)
+            return rgb
+
+        if value.startswith("#") and len(value) in (4, 7):
+            digits = value[1:] if len(value) == 7 else "".join(c * 2 for c in value[1:])
+            try:
+                rgb = tuple(int(digits[i : i + 2], 16) for i in (0, 2, 4))
+            except ValueError:
+                rgb = None
+
+        else:
+            # Color names are looked up by Tk, once each.
+            try:
+                rgb = tuple(c >> 8 for c in self.window.winfo_rgb(value))
+            except Exception:
+                rgb = None
+
+        self.__colors[value] = rgb
+        if len(self.__colors) > self.max_colors:
+            self.__colors.popitem(last=False)
+        return rgb
+
+    def counters(self) -> dict[str, float]:
+        return {
+            "active": self.active,
+            "started": self.started,
+            "frames": self.frames,
+            "dropped": self.dropped,
+            "frame_time": self.frame_time,
+            "max_frame_time": self.max_frame_time,
+        }
+
+    def submit(self, element: TkxElement, options: dict[str, Any]) -> None:
+        """
+        Configure `element`'s widget, animating the options named by its
+        `transition` style and sending the rest to the window's
+        configure queue.
+        """
+        queue = self.window.configure_queue
+        spec = element.style.get("transition")
+
+        if spec is None:
+            if element in self.__active:
+                self.cancel(element, options)
+            queue.submit(element, options)
+            return
+
+        transitions = parse_transition(spec)
+        every = transitions.get("all")
+        now = perf_counter()
+        immediate = {}
+
+        for k, v in options.items():
+            # Only colors and lengths are animated; content (eg. `text`) is set at once.
+            transition = None
+            if k in ANIMATED_COLOR_OPTIONS or k in ANIMATED_LENGTH_OPTIONS:
+                transition = transitions.get(k, every)
+            if transition is None or transition.duration <= 0 or not self.__start(element, k, v, now, transition):
+                self.cancel(element, (k,))
+                immediate[k] = v
+
+        if immediate:
+            queue.submit(element, immediate)
+
+        if self.__active and self.__after_id is None:
+            self.__due = now
+            self.__after_id = self.window.after(1, self.__frame)
+
+    def __current(self, element: TkxElement, k: str, now: float) -> Any:
+        """Return the value shown for a property: where it is being animated to, or the widget's."""
+        animation = self.__active.get(element, {}).get(k)
+        if animation is not None:
+            point = animation.at(now)
+            return animation.start if point is None else point
+
+        return element.widget.cget(k)
+
+    def __start(self, element: TkxElement, k: str, value: Any, now: float, transition: Transition) -> bool:
+        """Start animating a property towards `value`. Returns `False` if it cannot be animated."""
+        try:
+            current = self.__current(element, k, now)
+        except Exception:
+            return False
+
+        color = k in ANIMATED_COLOR_OPTIONS
+        if color:
+            end = self.color(value)
+            start = current if type(current) is tuple else self.color(current)
+        else:
+            end = parse_number(value)
+            start = parse_number(current)
+
+        if start is None or end is None or start == end:
+            return False
+
+        self.__active.setdefault(element, {})[k] = Animation(start, end, value, now, transition, color)
+        self.started += 1
+        return True
+
+    def step(self) -> int:
+        """
+        Advance every running animation to the current time and configure
+        their widgets in one batch. Returns the number of widgets
+        configured. Called once per frame while animations are running.
+        """
+        start = perf_counter()
+        configured = 0
+
+        with self.window.batch():
+            queue = self.window.configure_queue
+            for element, animations in list(self.__active.items()):
+                options = {}
+                for k, animation in list(animations.items()):
+                    if animation.finished(start):
+                        options[k] = animation.value
+                        del animations[k]
+                        continue
+
+                    point = animation.at(start)
+                    if point is None:
+                        continue
+
+                    if animation.color:
+                        options[k] = "#%02x%02x%02x" % point
+                    else:
+                        options[k] = round(point)
+
+                if not animations:
+                    del self.__active[element]
+
+                if options:
+                    queue.submit(element, options)
+                    configured += 1
+
+        end = perf_counter()
+        self.frames += 1
+        self.frame_time = end - start
+        self.max_frame_time = max(self.max_frame_time, self.frame_time)
+
+        if instrument.enabled:
+            instrument.record("animate", None, start, end)
+
+        return configured
+
+    def __frame(self) -> None:
+        start = perf_counter()
+        interval = self.frame_interval
+
+        # A frame due more than an interval ago stands in for those missed.
+        late = start - self.__due
+        if late > interval:
+            self.dropped += int(late / interval)
+
+        try:
+            self.step()
+        finally:
+            if self.__active:
+                # Keep frames on a fixed cadence, whatever this one cost.
+                self.__due = start + interval
+                delay = max(1, round((self.__due - perf_counter()) * 1000))
+                self.__after_id = self.window.after(delay, self.__frame)
+            else:
+                self.__after_id = None
@@ -0,0 +1,164 @@
+from __future__ import annotations
+from math import ceil
+from typing import Any, Callable, Sequence, TYPE_CHECKING
+from tkx.builder import Template
+
+if TYPE_CHECKING:
+    from tkx.core import TkxElement
+    from tkx.element import Element
+
+
+def bind_item(row: Element, item: Any) -> None:
+    """
+    Default data binding for virtual rows. Dictionaries are passed to
+    `configure` as properties, anything else becomes the row's text.
+    """
+    if isinstance(item, dict):
+        row.configure(item)
+    else:
+        row.configure(text=str(item))
+
+
+class VirtualList:
+    """
+    Renders a sequence of items inside a container with `display="virtual"`
+    using only as many rows as fit in its viewport.
+
+    Rows are instantiated from a `Template` and recycled as the list
+    scrolls: a row which leaves the viewport is rebound to an item coming
+    into view, so memory use depends on the viewport's height rather than
+    on the number of items.
+
+    `VirtualList` implements `yview` and `yscrollcommand`, so it can be
+    connected to a `tk.Scrollbar` like any scrollable widget.
+
+    Parameters
+    - container: `TkxElement` - Element with `display="virtual"` which holds the rows.
+    - source: `Sequence` - Items to display. Call `refresh` after changing it.
+    - template: `Template | dict` - Template (or spec) for a single row.
+    - bind: `Callable[[Element, Any], None]` - Applies an item to a row.
+    - row_height: `int` - Height of every row in pixels.
+    """
+
+    def __init__(
+        self,
+        container: TkxElement,
+        source: Sequence,
+        template: Template | dict,
+        bind: Callable[[Element, Any], None] = bind_item,
+        row_height: int = 24,
+    ):
+        self.container = container
+        self.source = source
+        self.template = template if isinstance(template, Template) else Template(template)
+        self.bind = bind
+        self.row_height = row_height
+        self.yscrollcommand: Callable[[str, str], Any] | None = None
+
+        # Scroll position in pixels from the top of the list.
+        self.offset = 0
+
+        # Rows which have been created, and the item index each one shows.
+        self.rows: list[Element] = []
+        self.__indices: dict[Element, int] = {}
+        self.__positions: dict[Element, int | None] = {}
+
+        container.widget.bind("<Configure>", lambda _: self.render(), add="+")
+        self.bind_scrolling(container)
+
+    @property
+    def viewport_height(self) -> int:
+        return max(self.container.widget.winfo_height(), 1)
+
+    @property
+    def content_height(self) -> int:
+        return len(self.source) * self.row_height
+
+    def bind_scrolling(self, element: TkxElement) -> None:
+        """Scroll the list with the mouse wheel while hovering `element`."""
+        element.widget.bind("<MouseWheel>", lambda e: self.scroll(-e.delta // 120, "units"), add="+")
+        element.widget.bind("<Button-4>", lambda _: self.scroll(-1, "units"), add="+")
+        element.widget.bind("<Button-5>", lambda _: self.scroll(1, "units"), add="+")
+
+    def refresh(self) -> None:
+        """Rebind every visible row, eg. after `source` has changed."""
+        self.__indices.clear()
+        self.render()
+
+    def render(self) -> None:
+        """Place and bind rows for the items currently in view."""
+        self.offset = max(0, min(self.offset, self.content_height - self.viewport_height))
+
+        first = self.offset // self.row_height
+        count = ceil(self.viewport_height / self.row_height) + 1
+        visible = range(first, min(first + count, len(self.source)))
+
+        # Create rows only until the viewport is full.
+        while len(self.rows) < len(visible):
+            row = self.template.instantiate(self.container)
+            self.bind_scrolling(row)
+            self.rows.append(row)
+
+        # Keep rows which still show a visible item and recycle the rest.
+        indices = self.__indices
+        shown = {indices[row] for row in self.rows if indices.get(row) in visible}
+        free = [row for row in reversed(self.rows) if indices.get(row) not in shown]
+
+        with self.container.root.batch():
+            for index in visible:
+                if index in shown:
+                    continue
+
+                row = free.pop()
+                indices[row] = index
+                self.bind(row, self.source[index])
+
+        for row in self.rows:
+            index = indices.get(row)
+            y = None if index not in visible else index * self.row_height - self.offset
+
+            # Only move rows whose position has changed.
+            if self.__positions.get(row) == y:
+                continue
+
+            self.__positions[row] = y
+            if y is None:
+                indices.pop(row, None)
+                row.widget.place_forget()
+            else:
+                row.widget.place(x=0, y=y, relwidth=1, height=self.row_height)
+
+        if self.yscrollcommand is not None:
+            self.yscrollcommand(*self.yview())
+
+    def scroll(self, number: int, what: str = "units") -> None:
+        """Scroll by a number of rows (`"units"`) or viewport heights (`"pages"`)."""
+        step = self.viewport_height if what == "pages" else self.row_height
+        self.scroll_to(self.offset + int(number) * step)
+
+    def scroll_to(self, offset: int) -> None:
+        """Scroll to a pixel offset from the top of the list."""
+        self.offset = int(offset)
+        self.render()
+
+    def see(self, index: int) -> None:
+        """Scroll the least amount needed to bring an item into view."""
+        top = index * self.row_height
+        if top < self.offset:
+            self.scroll_to(top)
+        elif top + self.row_height > self.offset + self.viewport_height:
+            self.scroll_to(top + self.row_height - self.viewport_height)
+
+    def yview(self, *args) -> tuple[float, float] | None:
+        """
+        Query or change the visible part of the list, following the
+        protocol of `tk.Scrollbar` commands.
+        """
+        if not args:
+            total = max(self.content_height, 1)
+            return self.offset / total, min((self.offset + self.viewport_height) / total, 1.0)
+
+        if args[0] == "moveto":
+            self.scroll_to(float(args[1]) * self.content_height)
+        elif args[0] == "scroll":
+            self.scroll(int(args[1]), args[2])
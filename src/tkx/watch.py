@@ -0,0 +1,69 @@
+from __future__ import annotations
+from typing import Callable, NamedTuple, Protocol, TYPE_CHECKING
+import os
+
+if TYPE_CHECKING:
+    from tkx.window import Window
+
+
+class ReloadReport(NamedTuple):
+    """Describes one stylesheet reload performed by a `Window`."""
+
+    seconds: float
+    selectors: set[str]
+    widgets: int
+
+
+class Watcher(Protocol):
+    """
+    Anything which can notify a `Window` that a file has changed. The
+    callback must be called from the Tk thread (eg. through
+    `window.after`).
+    """
+
+    def start(self, window: Window, path: str, callback: Callable[[], None]) -> None:
+        ...
+
+    def stop(self) -> None:
+        ...
+
+
+class PollingWatcher:
+    """
+    Watches a file by comparing its modification time and size every
+    `interval` milliseconds, using the window's event loop.
+    """
+
+    def __init__(self, interval: int = 500):
+        self.interval = interval
+        self.__after_id: str | None = None
+
+    def start(self, window: Window, path: str, callback: Callable[[], None]) -> None:
+        self.stop()
+        self.window = window
+        self.path = path
+        self.callback = callback
+        self.signature = self.stat()
+        self.__after_id = window.after(self.interval, self.poll)
+
+    def stop(self) -> None:
+        if self.__after_id is not None:
+            self.window.after_cancel(self.__after_id)
+            self.__after_id = None
+
+    def poll(self) -> None:
+        # Schedule the next poll first so that a failing callback
+        # doesn't stop the watcher.
+        self.__after_id = self.window.after(self.interval, self.poll)
+
+        signature = self.stat()
+        if signature != self.signature:
+            self.signature = signature
+            self.callback()
+
+    def stat(self) -> tuple[int, int] | None:
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
@@ -1,13 +1,39 @@
+from __future__ import annotations
+from tkx import instrument, resources
+from tkx.backend import TkBackend
+from tkx.batch import Batch, ConfigureQueue
+from tkx.cache import StyleCache
+from tkx.constants import INHERITED_STYLE_KEYS, MATCH_GEOMETRY_SEPARATOR, RESOURCE_PROPERTIES
 from tkx.core import update_style, TkxElement
+from tkx.delegate import Delegate, Delegator
 from tkx.element import Element
+from tkx.layout import Layout
+from tkx.parser import merge_blocks
+from tkx.post import PostQueue
+from tkx.query import select
+from tkx.selector import Descriptor, describe, subject_index
+from tkx.style import StyleTable
 from tkx.stylesheet import Stylesheet
-import re
+from tkx.transition import Animator
+from tkx.watch import PollingWatcher, ReloadReport, Watcher
+from time import perf_counter
+from typing import Any, Callable, TYPE_CHECKING
 import tkinter as tk
 
+if TYPE_CHECKING:
+    from tkx.aio import AsyncRunner
+
+
+# How selectors see the window itself, eg. in `Window > Frame`.
+WINDOW = describe("Window")
+
 
 class Window(TkxElement, tk.Tk):
-    def __init__(self, title: str = "", stylesheet: Stylesheet | None = None):
-        super().__init__()
+    def __init__(self, title: str = "", stylesheet: Stylesheet | None = None, backend: TkBackend | None = None):
+        # Creates the interpreter this window runs on, see tkx.backend.
+        self.backend = backend or TkBackend()
+        super().__init__(**self.backend.options)
+        self.backend.attach(self)
 
         # Update window geometry.
         super().update()
@@ -27,19 +53,432 @@ class Window(TkxElement, tk.Tk):
         # the id and the value is the one Element with that id.
         self.__ids: dict[str, Element] = None
 
+        # @property self.paths is a dictionary where the key is a
+        # widget's path (eg. ".!frame.!label2") and the value is the
+        # Element with that widget.
+        self.__paths: dict[str, Element] = None
+
+        # @property self.types is a dictionary where the key is a
+        # widget class name and the value is a set containing all
+        # Elements with that type of widget.
+        self.__types: dict[str, set[Element]] = None
+
+        # Watches the stylesheet's source file, if enabled.
+        self.watcher: Watcher | None = None
+
+        # Runs this window within an asyncio loop, see self.run_async.
+        self.runner: AsyncRunner | None = None
+
         # List of direct children of this window.
         self.elements: list[Element] = None
 
+        # Number of elements created so far, giving each its `order`.
+        self.created = 0
+
+        # Resolved styles shared by elements with the same selectors.
+        self.style_cache = StyleCache()
+
+        # Base styles shared by elements styled alike, see tkx.style.
+        self.styles = StyleTable()
+
+        # Version of the stylesheet the two caches above were filled from.
+        self.__version: int | None = None
+
+        # Widget options waiting to be sent to Tk while batching.
+        self.configure_queue = ConfigureQueue(self)
+
+        # Keeps percentage sizes in step with the window's size.
+        self.layout = Layout(self)
+
+        # Element updates posted from other threads, see self.post.
+        self.post_queue = PostQueue(self)
+
+        # Animates properties named by elements' `transition` styles.
+        self.animator = Animator(self)
+
+        # Fonts and images shared by elements, across every window.
+        self.resources = resources.cache
+
+        # Event handlers delegated by containers, see self.delegate.
+        self.delegator = Delegator(self)
+
         # Style dictionary associated with this window.
         self.stylesheet: Stylesheet | None = stylesheet
 
         # tk.Tk().geometry returns a str = "{width}x{height}+{x}+{y}".
         # Split the string along "x" and "+", then assign those values.
-        self.width, self.height, self.x, self.y = re.split("[x+]", self.geometry())
+        self.width, self.height, self.x, self.y = MATCH_GEOMETRY_SEPARATOR.split(self.geometry())
 
         if stylesheet is not None:
             self.configure(self.stylesheet.get("Window"))
 
+        # Percentages of top-level elements refer to the window's size.
+        self.style.setdefault("width", self.width)
+        self.style.setdefault("height", self.height)
+
+    @property
+    def auto_batch(self) -> bool:
+        """
+        If `True`, widget configuration is always deferred and merged per
+        element, then flushed the next time Tk is idle.
+        """
+        return self.configure_queue.idle
+
+    @auto_batch.setter
+    def auto_batch(self, value: bool) -> None:
+        self.configure_queue.idle = value
+
+    def batch(self) -> Batch:
+        """
+        Return a context manager which defers widget configuration until
+        it exits, then sends one `configure` call per changed widget.
+
+        ```python
+        with root.batch() as batch:
+            for row in rows:
+                row.configure(bg="var(--highlight)")
+
+        print(batch.requested, batch.issued, batch.saved)
+        ```
+        """
+        return Batch(self.configure_queue)
+
+    def ancestry(self, element: TkxElement) -> tuple[Descriptor, ...]:
+        """
+        Describe `element` and its ancestors, nearest first, for matching
+        selectors with combinators. Empty if the stylesheet has none, so
+        that elements are only walked when it matters.
+        """
+        if self.stylesheet is None or not self.stylesheet.rules.contextual:
+            return ()
+
+        ancestry = []
+        while element.parent is not None:
+            ancestry.append(describe(type(element.widget).__name__, element.id, element.cl))
+            element = element.parent
+        ancestry.append(WINDOW)
+
+        return tuple(ancestry)
+
+    def cascade(
+        self, widget_name: str, id: str | None = None, cl: str | None = None, ancestry: tuple[Descriptor, ...] = ()
+    ) -> dict[str, str]:
+        """
+        Return a new dictionary combining the stylesheet rules which apply
+        to the given widget name, id and space-separated classes (and
+        ancestors, see `ancestry`), in order of specificity and then of
+        appearance in the stylesheet.
+        """
+        style = dict()
+        if self.stylesheet is None:
+            return style
+
+        start = perf_counter() if instrument.enabled else None
+        rules = self.stylesheet.rules.match(describe(widget_name, id, cl), ancestry)
+        if start is not None:
+            instrument.record("selector", widget_name, start)
+
+        for rule in rules:
+            style.update(rule.declarations)
+
+        return style
+
+    def class_properties(self, names, subject: bool = True) -> set[str]:
+        """
+        Return the names of every property set by rules selecting the given
+        CSS classes, or with `subject=False`, by rules requiring them on an
+        ancestor (eg. `.selected > Label`).
+        """
+        if self.stylesheet is None:
+            return set()
+
+        return self.stylesheet.rules.properties(names, subject)
+
+    def cls_bind(self, name: str, sequence: str, func: Callable) -> Delegate:
+        """
+        Call `func` when the event `sequence` happens on any element with
+        the CSS class `name`, or inside one, including elements added
+        later. One handler serves them all, see `delegate`.
+        """
+        return self.delegate(sequence, f".{name}", func)
+
+    def cls_toggle(self, name: str, elements, force: bool | None = None) -> None:
+        """
+        Toggle a CSS class on many elements at once, as with
+        `Element.toggle_class`. Only the properties set by the class's
+        rule are recomputed, and all widget changes are sent in a single
+        batch.
+        """
+        properties = self.class_properties((name,))
+
+        with self.batch():
+            for element in elements:
+                element.toggle_class(name, force, properties)
+
+    def compute_style(
+        self,
+        widget_name: str,
+        id: str | None,
+        cl: str | None,
+        parent_style: dict[str, str],
+        ancestry: tuple[Descriptor, ...] = (),
+    ) -> dict[str, str]:
+        """
+        Return a copy of the fully resolved style for an element with the
+        given widget name, id and classes, including the properties it
+        inherits from its parent's style. `ancestry` describes its parent
+        and their ancestors (see `Window.ancestry`).
+        """
+        return dict(self.resolved_style(widget_name, id, cl, parent_style, ancestry))
+
+    def resolved_style(
+        self,
+        widget_name: str,
+        id: str | None,
+        cl: str | None,
+        parent_style: dict[str, str],
+        ancestry: tuple[Descriptor, ...] = (),
+    ) -> dict[str, str]:
+        """
+        Same as `compute_style`, but returns the style shared through
+        `self.style_cache`, which must not be modified.
+        """
+        # The stylesheet may have been changed directly, eg. by `Stylesheet.reload`.
+        if self.stylesheet is not None and self.stylesheet.version != self.__version:
+            self.__forget_styles()
+
+        inherited = tuple(parent_style.get(p) for p in INHERITED_STYLE_KEYS)
+
+        # Elements matched by the same rules with combinators share a style
+        # regardless of the rest of their ancestry.
+        context = ()
+        if ancestry:
+            context = self.stylesheet.rules.match_context(describe(widget_name, id, cl), ancestry)
+
+        key = (widget_name, id, cl, inherited, context)
+
+        style = self.style_cache.get(key)
+        if style is None:
+            start = perf_counter() if instrument.enabled else None
+            style = self.cascade(widget_name, id, cl, ancestry)
+
+            for k, v in zip(INHERITED_STYLE_KEYS, inherited):
+                if v is not None and style.get(k) is None:
+                    style[k] = v
+
+            self.style_cache.set(key, style)
+
+            if start is not None:
+                instrument.record("cascade", widget_name, start)
+
+        return style
+
+    def destroy(self) -> None:
+        """Destroy the window, dropping the fonts and images created for it."""
+        self.post_queue.stop()
+        self.resources.clear(self)
+        super().destroy()
+
+    def mainloop(self, n: int = 0) -> None:
+        """Run Tk's event loop, applying updates posted from other threads (see `post`) while it runs."""
+        self.post_queue.attach(mainloop=True)
+        try:
+            super().mainloop(n)
+        finally:
+            self.post_queue.detach()
+
+    def post(self, element: TkxElement, args: dict[str, Any] | None = None, **kwargs) -> bool:
+        """
+        Configure `element` from any thread. Properties are queued, merged
+        with any still pending for the element (the latest value wins) and
+        applied on the Tk thread at most `post_queue.max_fps` times per
+        second. Returns `False` if the queue was full and the post dropped.
+        """
+        if args is not None:
+            kwargs = {**args, **kwargs}
+        return self.post_queue.post(element, kwargs)
+
+    def propagate_inherited(self, element: TkxElement, keys) -> int:
+        """
+        Push the current values of inherited style keys (eg. `bg`) of
+        `element` down to its descendants. Only descendants which inherit
+        a key are updated, and a descendant which overrides it stops the
+        key from going further down its branch. All widget changes are
+        sent in one batch. Returns the number of elements updated.
+        """
+        updated = 0
+        queue = self.configure_queue
+
+        with self.batch():
+            # Each entry holds an element and its dirty keys: those whose
+            # values its children may need to take.
+            stack = [(element, tuple(keys))]
+            while stack:
+                parent, dirty = stack.pop()
+                style = parent.style
+
+                for child in parent.elements or ():
+                    changed = [k for k in dirty if k in child.inherits and child.style.get(k) != style.get(k)]
+                    if not changed:
+                        continue
+
+                    options = {}
+                    for k in changed:
+                        value = style.get(k)
+                        if value is None:
+                            # Nothing is inherited any more, so restore the widget's default.
+                            child.style.pop(k, None)
+                            if k in child.widget.keys():
+                                options[k] = child.widget.configure(k)[3]
+                        else:
+                            child.style[k] = options[k] = value
+
+                    if child.widget_name == "frame":
+                        options.pop("fg", None)
+
+                    if options:
+                        self.animator.submit(child, options)
+
+                    updated += 1
+                    stack.append((child, changed))
+
+        return updated
+
+    def query(self, selector: str) -> Element | None:
+        """Return the first element created which matches `selector`, or `None`."""
+        matches = self.query_all(selector)
+        return matches[0] if matches else None
+
+    def query_all(self, selector: str) -> list[Element]:
+        """
+        Return every element matching `selector`, in the order they were
+        created. Selectors may combine types, ids and classes, descendant
+        and child combinators, and be comma-separated lists, eg.
+        `"#sidebar Label"` or `"Button.primary, .link"`. Candidates come
+        from the `ids`, `cls` and `types` indexes, so lookups cost in
+        proportion to the smallest matching index rather than to the size
+        of the tree.
+        """
+        return select(self, selector)
+
+    def reload_stylesheet(self) -> ReloadReport:
+        """
+        Reload the stylesheet from its source file and restyle only the
+        elements matched by selectors whose rules changed. Elements are
+        found through the `ids`, `cls` and `types` indexes.
+        """
+        start = perf_counter()
+        stylesheet = self.stylesheet
+        blocks = stylesheet.read()
+        styles = merge_blocks(blocks)
+        changed = stylesheet.diff(styles)
+
+        # Find the affected elements (those indexed under the subject of a
+        # changed selector) and the properties to recompute.
+        affected: dict[Element, set[str]] = {}
+        for selector in changed:
+            properties = set(stylesheet.get(selector) or ()) | set(styles.get(selector) or ())
+
+            index, key = subject_index(selector)
+            if index == "ids":
+                element = self.ids.get(key)
+                elements = () if element is None else (element,)
+            elif index == "cls":
+                elements = self.cls.get(key, ())
+            elif index == "types":
+                elements = self.types.get(key, ())
+            elif index == "all":
+                elements = set().union(*self.types.values())
+            else:
+                elements = ()
+
+            for element in elements:
+                affected.setdefault(element, set()).update(properties)
+
+        # Resolve the affected elements' previous styles before replacing them.
+        before = {element: element.resolved_style() for element in affected}
+
+        stylesheet.replace(blocks)
+        self.__forget_styles()
+
+        with self.batch():
+            if "Window" in changed:
+                self.configure(stylesheet.get("Window"))
+
+            for element, properties in affected.items():
+                element.restyle(before[element], properties)
+
+        return ReloadReport(perf_counter() - start, changed, len(affected))
+
+    def watch_stylesheet(
+        self,
+        watcher: Watcher | None = None,
+        on_reload: Callable[[ReloadReport], None] | None = None,
+    ) -> None:
+        """
+        Reload the stylesheet whenever its source file changes. Uses a
+        `PollingWatcher` unless another watcher is given. `on_reload` is
+        called with a `ReloadReport` after every reload.
+        """
+        self.unwatch_stylesheet()
+        self.watcher = watcher or PollingWatcher()
+
+        def reload():
+            report = self.reload_stylesheet()
+            if on_reload is not None:
+                on_reload(report)
+
+        self.watcher.start(self, self.stylesheet.source_path, reload)
+
+    async def run_async(self, **kwargs) -> None:
+        """
+        Handle this window's events from within the running asyncio loop
+        until the window is destroyed, so coroutines can run alongside the
+        UI. Event handlers bound with `Element.bind` may then be coroutine
+        functions. Keyword arguments are passed to `tkx.aio.AsyncRunner`.
+        """
+        # Imported here so that asyncio is only loaded by apps using it.
+        from tkx.aio import AsyncRunner
+
+        await AsyncRunner(self, **kwargs).run()
+
+    def stats(self) -> dict:
+        """
+        Return the counters of this window's caches and queues, and under
+        "timings" the summary of `tkx.instrument`, which is recorded for
+        the whole process rather than per window and is empty unless
+        instrumentation is enabled.
+        """
+        return {
+            "style_cache": {
+                "hits": self.style_cache.hits,
+                "misses": self.style_cache.misses,
+                "evictions": self.style_cache.evictions,
+            },
+            "styles": self.styles.counters(),
+            "post_queue": self.post_queue.counters(),
+            "animations": self.animator.counters(),
+            "resources": self.resources.counters(),
+            "configure_queue": {
+                "requested": self.configure_queue.stats.requested,
+                "issued": self.configure_queue.stats.issued,
+                "saved": self.configure_queue.stats.saved,
+            },
+            "timings": instrument.summary(),
+        }
+
+    def unwatch_stylesheet(self) -> None:
+        """Stop watching the stylesheet's source file."""
+        if self.watcher is not None:
+            self.watcher.stop()
+            self.watcher = None
+
+    @property
+    def paths(self) -> dict[str, Element]:
+        if self.__paths is None:
+            self.__paths = dict()
+        return self.__paths
+
     @property
     def ids(self) -> dict[str, Element] | None:
         if self.__ids is None:
@@ -52,7 +491,31 @@ class Window(TkxElement, tk.Tk):
             self.__cls = dict()
         return self.__cls
 
+    @property
+    def types(self) -> dict[str, set[Element]]:
+        if self.__types is None:
+            self.__types = dict()
+        return self.__types
+
+    @property
+    def stylesheet(self) -> Stylesheet | None:
+        return self.__stylesheet
+
+    @stylesheet.setter
+    def stylesheet(self, value: Stylesheet | None) -> None:
+        self.__stylesheet = value
+        self.__forget_styles()
+
     @update_style
     def configure(self, **kwargs):
         kwargs.pop("fg", None)
+        kwargs.pop("transition", None)
+        for k in RESOURCE_PROPERTIES:
+            kwargs.pop(k, None)
         super().configure(**kwargs)
+
+    def __forget_styles(self) -> None:
+        # Styles computed from a previous stylesheet no longer apply.
+        self.style_cache.clear()
+        self.styles.clear()
+        self.__version = None if self.__stylesheet is None else self.__stylesheet.version
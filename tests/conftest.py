@@ -0,0 +1,30 @@
+import pytest
+import tkx
+
+
+@pytest.fixture
+def stylesheet(tmp_path):
+    """Return a function writing CSS source to a file and loading it as a `Stylesheet`."""
+
+    def load(source: str) -> tkx.Stylesheet:
+        path = tmp_path / "style.css"
+        path.write_text(source)
+        return tkx.Stylesheet(str(path))
+
+    return load
+
+
+@pytest.fixture
+def window(stylesheet):
+    """Return a function creating a headless `Window` styled by CSS source."""
+    windows = []
+
+    def create(source: str | None = None) -> tkx.Window:
+        root = tkx.Window("test", None if source is None else stylesheet(source), backend=tkx.HeadlessBackend())
+        windows.append(root)
+        return root
+
+    yield create
+
+    for root in windows:
+        root.destroy()
@@ -0,0 +1,19 @@
+import tkinter as tk
+import tkx
+
+
+def test_headless_backend_keeps_the_last_calls():
+    backend = tkx.HeadlessBackend(max_calls=3)
+    root = tkx.Window("test", backend=backend)
+    try:
+        label = root.add(tk.Label)
+        label.widget.configure(text="a")
+        label.widget.configure(text="b")
+
+        assert len(backend.calls) == 3
+        assert backend.configure_calls[-2:] == [
+            (str(label.widget), "configure", "-text", "a"),
+            (str(label.widget), "configure", "-text", "b"),
+        ]
+    finally:
+        root.destroy()
@@ -0,0 +1,45 @@
+import pytest
+import tkinter as tk
+
+
+def test_batch_merges_configure_calls(window):
+    root = window()
+    labels = [root.add(tk.Label) for _ in range(3)]
+
+    with root.batch() as batch:
+        for label in labels:
+            label.configure(text="a")
+            label.configure(fg="#ffffff")
+
+    assert (batch.requested, batch.issued, batch.saved) == (6, 3, 3)
+    assert [label.widget.cget("text") for label in labels] == ["a"] * 3
+
+
+def test_nothing_is_sent_before_the_outermost_batch_closes(window):
+    root = window()
+    label = root.add(tk.Label, text="before")
+
+    with root.batch():
+        with root.batch():
+            label.configure(text="inner")
+        assert label.widget.cget("text") == "before"
+
+    assert label.widget.cget("text") == "inner"
+
+
+def test_failed_flush_configures_other_widgets_and_ends_the_batch(window):
+    root = window()
+    good = root.add(tk.Label)
+    bad = root.add(tk.Label)
+
+    with pytest.raises(tk.TclError):
+        with root.batch():
+            bad.configure(bogus=1)
+            good.configure(text="batched")
+
+    assert good.widget.cget("text") == "batched"
+
+    # Configuration is no longer deferred once the batch is gone.
+    bad.configure(text="after")
+    assert bad.widget.cget("text") == "after"
+    assert not root.configure_queue.pending
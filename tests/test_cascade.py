@@ -0,0 +1,63 @@
+import tkinter as tk
+
+STYLESHEET = """
+#save { background: #000001; }
+Button.primary { background: #000002; }
+.primary { background: #000003; color: #ffffff; }
+Button { background: #000004; border-width: 3; }
+Frame > Button { background: #000005; }
+Frame Button { background: #000006; }
+"""
+
+
+def test_ids_win_over_classes_and_types(window):
+    root = window(STYLESHEET)
+    button = root.add(tk.Button, id="save", cl="primary")
+
+    assert button.style["bg"] == "#000001"
+
+
+def test_more_specific_compounds_win(window):
+    root = window(STYLESHEET)
+
+    assert root.add(tk.Button, cl="primary").style["bg"] == "#000002"
+    assert root.add(tk.Label, cl="primary").style["bg"] == "#000003"
+    assert root.add(tk.Button).style["bg"] == "#000004"
+
+
+def test_later_rules_win_at_equal_specificity(window):
+    root = window(STYLESHEET)
+    button = root.add(tk.Frame).add(tk.Button)
+
+    # "Frame > Button" and "Frame Button" weigh the same, so the last wins.
+    assert button.style["bg"] == "#000006"
+
+
+def test_rules_combine_properties(window):
+    root = window(STYLESHEET)
+    button = root.add(tk.Button, cl="primary")
+
+    assert button.style["fg"] == "#ffffff"
+    assert button.style["bd"] == "3"
+
+
+def test_options_given_to_an_element_win(window):
+    root = window(STYLESHEET)
+    button = root.add(tk.Button, id="save", bg="#00000f")
+
+    assert button.style["bg"] == "#00000f"
+    assert button.widget.cget("background") == "#00000f"
+
+
+def test_repeated_selectors_apply_in_the_order_of_each_block(window):
+    root = window(".x { color: #000001; }\n.y { color: #000002; }\n.x { color: #000003; }")
+
+    assert root.add(tk.Label, cl="x y").style["fg"] == "#000003"
+    assert root.add(tk.Label, cl="y").style["fg"] == "#000002"
+
+
+def test_selector_lists_share_the_order_of_their_block(window):
+    root = window(".x, .z { color: #000001; }\n.y { color: #000002; }")
+
+    assert root.add(tk.Label, cl="x y").style["fg"] == "#000002"
+    assert root.add(tk.Label, cl="z y").style["fg"] == "#000002"
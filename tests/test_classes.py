@@ -0,0 +1,39 @@
+import tkinter as tk
+
+
+def test_toggling_a_class_restyles_the_element_and_updates_the_index(window):
+    root = window(".on{color: #000001; padx: 4}")
+    label = root.add(tk.Label)
+    default = label.widget.cget("padx")
+
+    assert label.toggle_class("on") is True
+    assert root.cls["on"] == {label}
+    assert label.widget.cget("fg") == "#000001"
+    assert str(label.widget.cget("padx")) == "4"
+
+    assert label.toggle_class("on") is False
+    assert "on" not in root.cls
+    assert label.cl is None
+    assert label.widget.cget("padx") == default
+
+
+def test_forced_toggles_leave_matching_elements_alone(window):
+    root = window(".on{color: #000001}")
+    label = root.add(tk.Label, cl="on")
+    root.backend.reset()
+
+    assert label.toggle_class("on", force=True) is True
+    assert label.toggle_class("off", force=False) is False
+    assert root.backend.configure_calls == []
+
+
+def test_descendants_follow_classes_required_on_an_ancestor(window):
+    root = window(".selected > Label{color: #000002}")
+    row = root.add(tk.Frame)
+    label = row.add(tk.Label)
+
+    row.toggle_class("selected")
+    assert label.widget.cget("fg") == "#000002"
+
+    row.toggle_class("selected")
+    assert label.widget.cget("fg") != "#000002"
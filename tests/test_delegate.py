@@ -0,0 +1,76 @@
+import tkinter as tk
+
+
+def click(element):
+    element.widget.event_generate("<Button-1>")
+
+
+def test_delegated_handlers_receive_the_matching_element(window):
+    root = window()
+    rows = [root.add(tk.Frame, cl="row") for _ in range(3)]
+    cells = [row.add(tk.Label, text=str(i)) for i, row in enumerate(rows)]
+    clicked = []
+    root.delegate("<Button-1>", ".row", lambda event: clicked.append(event.element))
+
+    click(cells[1])
+    click(rows[2])
+
+    assert clicked == [rows[1], rows[2]]
+
+
+def test_elements_added_later_are_handled(window):
+    root = window()
+    clicked = []
+    root.delegate("<Button-1>", "Label", lambda event: clicked.append(event.element))
+
+    label = root.add(tk.Frame).add(tk.Label)
+    click(label)
+
+    assert clicked == [label]
+
+
+def test_handlers_run_from_the_innermost_container_out(window):
+    root = window()
+    outer = root.add(tk.Frame, cl="outer")
+    inner = outer.add(tk.Frame, cl="inner")
+    label = inner.add(tk.Label, cl="cell")
+    calls = []
+    root.delegate("<Button-1>", ".cell", lambda event: calls.append("root"))
+    inner.delegate("<Button-1>", ".cell", lambda event: calls.append("inner"))
+
+    click(label)
+
+    assert calls == ["inner", "root"]
+
+
+def test_break_stops_outer_handlers(window):
+    root = window()
+    inner = root.add(tk.Frame)
+    label = inner.add(tk.Label, cl="cell")
+    calls = []
+
+    def stop(event):
+        calls.append("inner")
+        return "break"
+
+    root.delegate("<Button-1>", ".cell", lambda event: calls.append("root"))
+    inner.delegate("<Button-1>", ".cell", stop)
+
+    click(label)
+
+    assert calls == ["inner"]
+
+
+def test_non_matching_elements_and_removed_handlers_are_ignored(window):
+    root = window()
+    label = root.add(tk.Label, cl="other")
+    calls = []
+    delegate = root.delegate("<Button-1>", ".cell", lambda event: calls.append(event.element))
+
+    click(label)
+    label.add_class("cell")
+    click(label)
+    root.undelegate("<Button-1>", delegate)
+    click(label)
+
+    assert calls == [label]
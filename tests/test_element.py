@@ -0,0 +1,29 @@
+import tkinter as tk
+
+
+def test_items_which_are_not_attributes_are_stored_on_the_element(window):
+    root = window()
+    label = root.add(tk.Label, cl="a")
+
+    label["data"] = 1
+    label["cl"] = "b"
+
+    assert label["data"] == 1
+    assert label["missing"] is None
+    assert label.cl == label["cl"] == "b"
+    assert root.add(tk.Label)["data"] is None
+
+
+def test_elements_inheriting_the_same_keys_share_them(window):
+    root = window(".own{color: #000001}")
+    first, second = root.add(tk.Label), root.add(tk.Label)
+    own = root.add(tk.Label, cl="own")
+
+    assert first.inherits == {"bg", "fg"}
+    assert first.inherits is second.inherits
+    assert own.inherits == {"bg"}
+
+    first.configure(fg="#000002")
+
+    assert first.inherits == {"bg"}
+    assert second.inherits == {"bg", "fg"}
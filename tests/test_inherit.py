@@ -0,0 +1,32 @@
+import tkinter as tk
+
+
+def test_inherited_values_reach_descendants_until_one_overrides_them(window):
+    root = window(".own{color: #000009}")
+    outer = root.add(tk.Frame)
+    inner = outer.add(tk.Frame)
+    label = inner.add(tk.Label)
+    own = inner.add(tk.Frame, cl="own")
+    below = own.add(tk.Label)
+
+    outer.configure(fg="#000001")
+
+    assert label.widget.cget("fg") == "#000001"
+    assert own.style["fg"] == below.style["fg"] == "#000009"
+    assert below.widget.cget("fg") == "#000009"
+
+
+def test_propagation_only_updates_elements_which_inherit(window):
+    root = window()
+    outer = root.add(tk.Frame)
+    inheriting = outer.add(tk.Label)
+    overriding = outer.add(tk.Label, fg="#000002")
+
+    root.backend.reset()
+    outer.configure(fg="#000001")
+
+    assert inheriting.widget.cget("fg") == "#000001"
+    assert overriding.widget.cget("fg") == "#000002"
+    # Frames take no foreground, so only the inheriting label is configured.
+    assert [call[0] for call in root.backend.configure_calls] == [str(inheriting.widget)]
+    assert root.propagate_inherited(outer, ("fg",)) == 0
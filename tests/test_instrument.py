@@ -0,0 +1,31 @@
+import pytest
+import tkinter as tk
+from tkx import instrument
+
+
+@pytest.fixture
+def instrumented():
+    instrument.reset()
+    instrument.enable()
+    yield
+    instrument.disable()
+    instrument.reset()
+
+
+def test_stats_include_timings_of_selector_matching(window, instrumented):
+    root = window(".a{color: #000001} Label.a{padx: 2}")
+    for _ in range(3):
+        root.add(tk.Label, cl="a")
+
+    timings = root.stats()["timings"]
+
+    assert timings["selector"]["count"] == timings["cascade"]["count"] > 0
+    assert set(timings["selector"]["by_label"]) == {"Label"}
+
+
+def test_stats_timings_are_empty_while_disabled(window):
+    instrument.reset()
+    root = window(".a{color: #000001}")
+    root.add(tk.Label, cl="a")
+
+    assert root.stats()["timings"] == {}
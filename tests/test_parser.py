@@ -0,0 +1,43 @@
+import pytest
+from tkx.error import CSSSyntaxError
+from tkx.parser import parse, parse_blocks
+
+
+def test_parse_merges_rules_and_selector_lists():
+    styles = parse("Label, Button { color: red; }\n/* note */\nLabel { background: blue; }")
+
+    assert styles == {"Label": {"fg": "red", "bg": "blue"}, "Button": {"fg": "red"}}
+
+
+def test_parse_keeps_delimiters_inside_quotes():
+    assert parse("Label { text: 'a: b; c'; }") == {"Label": {"text": "'a: b; c'"}}
+
+
+@pytest.mark.parametrize(
+    "source, message, line, column",
+    [
+        ("Label { color: red; }\nButton {\n  color red;\n}", "Expected a declaration", 3, 3),
+        ("Label { color: red;", "Unterminated block", 1, 1),
+        ("Label { color: red; }\n}", "Expected a selector followed by '{'", 2, 1),
+        ("Label {\n  color: red\n  background: blue;\n}", 'Expected ";" after the value of "color"', 3, 3),
+        ("Label {\n  color: red\n  /* note */ background: blue;\n}", 'Expected ";" after the value of "color"', 3, 14),
+    ],
+)
+def test_syntax_errors_report_their_position(source, message, line, column):
+    with pytest.raises(CSSSyntaxError) as error:
+        parse(source, "style.css")
+
+    assert (error.value.message, error.value.line, error.value.column) == (message, line, column)
+    assert str(error.value).endswith(f"(style.css:{line}:{column})")
+
+
+def test_parse_blocks_keeps_every_block_in_source_order():
+    blocks = parse_blocks(".x { color: red; }\n.y, .z { color: blue; }\n.x { color: green; }")
+
+    assert blocks == [((".x",), {"fg": "red"}), ((".y", ".z"), {"fg": "blue"}), ((".x",), {"fg": "green"})]
+
+
+def test_values_may_span_lines():
+    styles = parse("Label {\n  font-family: Arial,\n    sans-serif;\n  text: 'a\nb: c';\n}")
+
+    assert styles == {"Label": {"font-family": "Arial,\n    sans-serif", "text": "'a\nb: c'"}}
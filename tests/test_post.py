@@ -0,0 +1,67 @@
+import threading
+import tkinter as tk
+
+
+def test_posts_are_merged_per_element(window):
+    root = window()
+    label = root.add(tk.Label)
+
+    root.post(label, text="first", fg="#000001")
+    root.post(label, text="second")
+
+    assert root.post_queue.depth == 1
+    assert root.post_queue.drain() == 1
+    assert label.widget.cget("text") == "second"
+    assert label.widget.cget("fg") == "#000001"
+    assert root.post_queue.coalesced == 1
+
+
+def test_posts_from_other_threads_are_applied_on_drain(window):
+    root = window()
+    labels = [root.add(tk.Label) for _ in range(4)]
+
+    threads = [
+        threading.Thread(target=root.post, args=(label,), kwargs={"text": str(i)}) for i, label in enumerate(labels)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert root.post_queue.drain() == 4
+    assert [label.widget.cget("text") for label in labels] == ["0", "1", "2", "3"]
+
+
+def test_a_failed_update_does_not_stop_later_ones(window):
+    root = window()
+    bad = root.add(tk.Label)
+    good = root.add(tk.Label)
+    errors = []
+    root.report_callback_exception = lambda kind, error, traceback: errors.append(error)
+
+    root.post(bad, bogus="1")
+    root.post(good, text="same frame")
+    root.post_queue.drain()
+
+    assert len(errors) == 1 and isinstance(errors[0], tk.TclError)
+    assert root.post_queue.failed == 1
+    assert good.widget.cget("text") == "same frame"
+
+    root.post(bad, text="next frame")
+    assert root.post_queue.drain() == 1
+    assert bad.widget.cget("text") == "next frame"
+
+    # Configuration outside the queue is applied immediately again.
+    good.configure(text="direct")
+    assert good.widget.cget("text") == "direct"
+
+
+def test_posts_to_destroyed_elements_are_dropped(window):
+    root = window()
+    label = root.add(tk.Label)
+
+    root.post(label, text="gone")
+    label.destroy()
+
+    assert root.post_queue.drain() == 0
+    assert root.post_queue.dropped == 1
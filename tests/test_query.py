@@ -0,0 +1,47 @@
+import pytest
+import tkinter as tk
+
+
+@pytest.fixture
+def tree(window):
+    root = window()
+    grid = root.add(tk.Frame, id="grid")
+    row = grid.add(tk.Frame, cl="row")
+    cells = [row.add(tk.Label, cl="cell"), row.add(tk.Label, cl="cell wide")]
+    other = root.add(tk.Label, cl="cell")
+    return root, grid, row, cells, other
+
+
+def test_query_all_matches_combinators_in_creation_order(tree):
+    root, grid, row, cells, other = tree
+
+    assert root.query_all("#grid Label.cell") == cells
+    assert root.query_all("Frame > Label") == cells
+    assert root.query_all("#grid > Label") == []
+    assert root.query_all(".wide, Window > .cell") == [cells[1], other]
+    assert root.query_all("*") == [grid, row, *cells, other]
+
+
+def test_query_returns_the_first_match_or_none(tree):
+    root, grid, row, cells, other = tree
+
+    assert root.query(".cell") is cells[0]
+    assert root.query("#grid") is grid
+    assert root.query("#missing") is None
+
+
+def test_query_follows_index_changes(tree):
+    root, grid, row, cells, other = tree
+
+    other.toggle_class("wide")
+    cells[0].destroy()
+
+    assert root.query_all(".wide") == [cells[1], other]
+    assert root.query_all(".cell") == [cells[1], other]
+
+
+def test_unsupported_selectors_raise(tree):
+    root = tree[0]
+
+    with pytest.raises(ValueError):
+        root.query_all("Label:hover")
@@ -0,0 +1,30 @@
+import tkinter as tk
+
+
+def test_reload_restyles_only_elements_of_changed_selectors(window, tmp_path):
+    root = window(".a{color: #000001;} .b{color: #000002;}")
+    a = [root.add(tk.Label, cl="a") for _ in range(2)]
+    b = root.add(tk.Label, cl="b")
+
+    (tmp_path / "style.css").write_text(".a{color: #000003;} .b{color: #000002;}")
+    root.backend.reset()
+    report = root.reload_stylesheet()
+
+    assert report.selectors == {".a"}
+    assert report.widgets == 2
+    assert [label.widget.cget("fg") for label in a] == ["#000003"] * 2
+    assert b.widget.cget("fg") == "#000002"
+    assert {call[0] for call in root.backend.configure_calls} == {str(label.widget) for label in a}
+
+
+def test_reload_restores_defaults_of_removed_properties(window, tmp_path):
+    root = window(".a{padx: 5;}")
+    label = root.add(tk.Label, cl="a")
+    default = root.add(tk.Label).widget.cget("padx")
+
+    (tmp_path / "style.css").write_text(".b{padx: 5;}")
+    report = root.reload_stylesheet()
+
+    assert report.selectors == {".a", ".b"}
+    assert label.widget.cget("padx") == default
+    assert "padx" not in label.style
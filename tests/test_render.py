@@ -0,0 +1,73 @@
+import tkinter as tk
+
+
+def labels(*keys):
+    return [{"widget": "Label", "key": key, "text": key} for key in keys]
+
+
+def texts(parent):
+    return [parent.nametowidget(path).cget("text") for path in parent.pack_slaves()]
+
+
+def test_render_creates_children(window):
+    root = window()
+    report = root.render(labels("a", "b", "c"))
+
+    assert report.created == 3
+    assert texts(root) == ["a", "b", "c"]
+
+
+def test_keyed_reorder_moves_widgets_without_recreating_them(window):
+    root = window()
+    root.render(labels("a", "b", "c", "d"))
+    widgets = {element.key: element.widget for element in root.elements}
+
+    report = root.render(labels("d", "a", "c", "b"))
+
+    assert (report.created, report.destroyed) == (0, 0)
+    assert report.moved > 0
+    assert texts(root) == ["d", "a", "c", "b"]
+    assert [element.key for element in root.elements] == ["d", "a", "c", "b"]
+    assert all(element.widget is widgets[element.key] for element in root.elements)
+
+
+def test_keyed_remove_destroys_only_what_is_gone(window):
+    root = window()
+    root.render(labels("a", "b", "c"))
+    kept = root.elements[2].widget
+
+    report = root.render(labels("a", "c"))
+
+    assert (report.created, report.destroyed, report.moved) == (0, 1, 0)
+    assert texts(root) == ["a", "c"]
+    assert root.elements[1].widget is kept
+
+
+def test_insert_between_keyed_children(window):
+    root = window()
+    root.render(labels("a", "c"))
+
+    report = root.render(labels("a", "b", "c"))
+
+    assert report.created == 1
+    assert texts(root) == ["a", "b", "c"]
+
+
+def test_changed_options_are_configured_and_equal_specs_skipped(window):
+    root = window()
+    root.render(labels("a", "b"))
+
+    report = root.render([{"widget": "Label", "key": "a", "text": "A"}] + labels("b"))
+
+    assert (report.updated, report.unchanged) == (1, 1)
+    assert texts(root) == ["A", "b"]
+
+
+def test_widget_type_change_recreates(window):
+    root = window()
+    root.render(labels("a"))
+
+    report = root.render([{"widget": "Button", "key": "a", "text": "a"}])
+
+    assert (report.created, report.destroyed) == (1, 1)
+    assert isinstance(root.elements[0].widget, tk.Button)
@@ -0,0 +1,55 @@
+import tkinter as tk
+
+
+def test_elements_with_the_same_selectors_share_a_resolved_style(window):
+    root = window("Label { color: #000001; }\n.x { background: #000002; }")
+    a = root.add(tk.Label, cl="x")
+    b = root.add(tk.Label, cl="x")
+
+    assert a.resolved_style() is b.resolved_style()
+    assert root.style_cache.hits >= 1
+
+
+def test_new_elements_follow_a_stylesheet_reloaded_directly(window, tmp_path):
+    root = window("Label { color: #000001; }")
+    before = root.add(tk.Label)
+
+    (tmp_path / "style.css").write_text("Label { color: #000002; }")
+    root.stylesheet.reload()
+    after = root.add(tk.Label)
+
+    assert before.style["fg"] == "#000001"
+    assert after.style["fg"] == "#000002"
+    assert after.widget.cget("fg") == "#000002"
+
+
+def test_new_elements_follow_a_replaced_stylesheet(window, stylesheet):
+    root = window("Label { color: #000001; }")
+    root.add(tk.Label)
+
+    root.stylesheet = stylesheet("Label { color: #000003; }")
+
+    assert root.add(tk.Label).style["fg"] == "#000003"
+
+
+def test_least_recently_used_styles_are_dropped_beyond_max_size(window):
+    root = window("Label { color: #000001; }")
+    root.style_cache.max_size = 2
+    first = root.add(tk.Label, cl="a")
+    root.add(tk.Label, cl="b")
+
+    # Using the first style again keeps it over the second.
+    assert root.add(tk.Label, cl="a").resolved_style() is first.resolved_style()
+    root.add(tk.Label, cl="c")
+
+    assert len(root.style_cache) == 2
+    assert root.style_cache.evictions == 1
+    assert root.add(tk.Label, cl="a").resolved_style() is first.resolved_style()
+
+
+def test_each_base_style_lookup_is_counted_once(window):
+    root = window(".a{color: #000001} .b{color: #000001}")
+    for cl in ("a", "a", "a", "b"):
+        root.add(tk.Label, cl=cl)
+
+    assert root.stats()["styles"] == {"bases": 1, "hits": 2, "misses": 2, "shared": 1}
@@ -0,0 +1,43 @@
+import gc
+import os
+import threading
+import tkx
+import tkx.cache
+
+
+def test_threads_writing_one_entry_use_their_own_temporary_files(tmp_path, monkeypatch):
+    source = tmp_path / "style.css"
+    source.write_text(".a{foreground: #000001;}")
+    cache = tkx.StylesheetCache(tmp_path / "cache")
+
+    written = []
+    replace = os.replace
+
+    def record(src, dst):
+        written.append(str(src))
+        replace(src, dst)
+
+    monkeypatch.setattr(tkx.cache.os, "replace", record)
+
+    # Tk interpreters left by earlier tests abort if collected on another thread.
+    gc.collect()
+
+    # Both threads miss, then write the same entry at once.
+    barrier = threading.Barrier(2)
+
+    def compile(text):
+        barrier.wait()
+        return text
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.load(str(source), compile))) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [source.read_text()] * 2
+    assert len(set(written)) == 2
+    assert [path.suffix for path in (tmp_path / "cache").iterdir()] == [".tkxc"]
+    assert cache.load(str(source), compile) == source.read_text()
+    assert cache.last.hit
@@ -0,0 +1,34 @@
+import tkinter as tk
+import tkx
+
+
+ROW = {"widget": "Frame", "cl": "row", "children": [{"widget": "Label", "cl": "cell a"}, {"widget": "Button"}]}
+
+
+def test_template_instances_match_added_elements(window):
+    root = window(".cell{foreground: #ff0000} .a{padx: 3}")
+    row = tkx.Template(ROW)
+
+    stamped = row.instantiate(root)
+    added = root.add(tk.Frame, cl="row")
+    added.add(tk.Label, cl="cell a")
+    added.add(tk.Button)
+
+    for a, b in zip(stamped.elements, added.elements):
+        assert (a.cl, a.widget_name, a.style) == (b.cl, b.widget_name, b.style)
+
+    label = stamped.elements[0]
+    assert label.classes == ["cell", "a"]
+    assert label.widget.cget("fg") == "#ff0000"
+    assert str(label.widget.cget("padx")) == "3"
+
+
+def test_template_children_are_packed_in_order(window):
+    root = window()
+    row = tkx.Template(ROW)
+
+    first, second = row.instantiate(root), row.instantiate(root)
+
+    assert root.pack_slaves() == [first.widget, second.widget]
+    assert first.widget.pack_slaves() == [element.widget for element in first.elements]
+    assert first.elements[1].widget.pack_info()["fill"] == "x"
@@ -0,0 +1,11 @@
+def test_animator_keeps_the_colors_used_last(window):
+    animator = window().animator
+    animator.max_colors = 2
+
+    assert animator.color("#ff0000") == (255, 0, 0)
+    assert animator.color("#0f0") == (0, 255, 0)
+    assert animator.color("#ff0000") == (255, 0, 0)
+    assert animator.color("#00f") == (0, 0, 255)
+    assert animator.color("bogus") is None
+
+    assert list(animator._Animator__colors) == ["#00f", "bogus"]
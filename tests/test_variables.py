@@ -0,0 +1,53 @@
+import pytest
+from tkx.error import CircularVariableError
+from tkx.stylesheet import resolve_variables, substitute
+
+VARIABLES = {"--fg": "#fff", "--width": "2"}
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("var(--fg)", "#fff"),
+        ("solid var(--width) var(--fg)", "solid 2 #fff"),
+        ("var(--missing, #000)", "#000"),
+        ("var(--missing, rgb(1, 2, 3))", "rgb(1, 2, 3)"),
+        ("var(--missing, var(--fg))", "#fff"),
+        ("var(--fg, var(--missing))", "#fff"),
+        ("var(--missing)", None),
+        ("var(--missing, var(--other))", None),
+        ("var(--fg", None),
+    ],
+)
+def test_substitute(value, expected):
+    assert substitute(value, VARIABLES.get) == expected
+
+
+def test_variables_may_refer_to_each_other():
+    variables = {"--base": "#123456", "--accent": "var(--base)", "--border": "var(--accent, red)"}
+
+    assert resolve_variables(variables) == {"--base": "#123456", "--accent": "#123456", "--border": "#123456"}
+
+
+@pytest.mark.parametrize(
+    "variables",
+    [
+        {"--a": "var(--a)"},
+        {"--a": "var(--b)", "--b": "var(--c)", "--c": "var(--a)"},
+    ],
+)
+def test_circular_variables_raise(variables):
+    with pytest.raises(CircularVariableError):
+        resolve_variables(variables)
+
+
+def test_stylesheet_resolves_variables(stylesheet):
+    sheet = stylesheet(":root { --bg: #222; }\nLabel { background: var(--bg); color: var(--fg, white); }")
+
+    assert sheet.get("Label") == {"bg": "#222", "fg": "white"}
+    assert sheet.var("var(--bg) var(--none, 1px)") == "#222 1px"
+
+
+def test_stylesheet_rejects_circular_variables(stylesheet):
+    with pytest.raises(CircularVariableError):
+        stylesheet(":root { --a: var(--b); --b: var(--a); }")
@@ -0,0 +1,40 @@
+import pytest
+import tkinter as tk
+from tkx.error import InvalidDisplayError
+
+ROW = {"widget": "Label"}
+
+
+def test_only_rows_filling_the_viewport_are_created(window):
+    root = window()
+    container = root.add(tk.Frame, display="virtual", height=100)
+
+    rows = container.virtualize([f"item {i}" for i in range(10_000)], ROW, row_height=25)
+
+    assert len(rows.rows) == 5
+    assert [row.widget.cget("text") for row in rows.rows] == [f"item {i}" for i in range(5)]
+
+
+def test_scrolling_recycles_rows_for_new_items(window):
+    root = window()
+    container = root.add(tk.Frame, display="virtual", height=100)
+    rows = container.virtualize([f"item {i}" for i in range(10_000)], ROW, row_height=25)
+    created = list(rows.rows)
+
+    rows.scroll(2)
+
+    assert rows.rows == created
+    assert sorted(row.widget.cget("text") for row in rows.rows) == sorted(f"item {i}" for i in range(2, 7))
+    top = next(row for row in rows.rows if row.widget.cget("text") == "item 2")
+    assert str(top.widget.place_info()["y"]) == "0"
+
+    rows.see(9_999)
+    assert len(rows.rows) == 5
+    assert "item 9999" in {row.widget.cget("text") for row in rows.rows}
+
+
+def test_virtualize_requires_a_virtual_container(window):
+    root = window()
+
+    with pytest.raises(InvalidDisplayError):
+        root.add(tk.Frame).virtualize(range(3), ROW)